@@ -0,0 +1,202 @@
+"""Synthetic mutwo events for benchmarking the abjad converters.
+
+All generators are deterministic: the same ``event_count`` and ``seed``
+always return the same event. Rhythms are assembled from groups which
+fill exactly one quarter note beat, so that both quantizers produce
+sensible notation and the benchmarks measure the converters and not
+pathological rhythms.
+"""
+
+import random
+
+try:
+    import quicktions as fractions  # type: ignore
+except ImportError:
+    import fractions  # type: ignore
+
+from mutwo import core_events
+from mutwo import core_parameters
+from mutwo import music_events
+from mutwo import music_parameters
+
+__all__ = (
+    "flat_notes",
+    "dense_tuplets",
+    "grace_notes",
+    "heavy_indicators",
+    "lyrics",
+    "long_tempo_envelope",
+    "multi_staff_score",
+)
+
+f = fractions.Fraction
+
+# Each group fills exactly one quarter note beat.
+_FLAT_GROUP_TUPLE = (
+    (f(1, 4),),
+    (f(1, 8), f(1, 8)),
+    (f(3, 16), f(1, 16)),
+    (f(1, 16), f(1, 16), f(1, 8)),
+    (f(1, 16),) * 4,
+)
+_TUPLET_GROUP_TUPLE = (
+    (f(1, 12),) * 3,
+    (f(1, 6), f(1, 12)),
+    (f(1, 12), f(1, 6)),
+    (f(1, 24),) * 6,
+)
+# Nauert swallows some of the 1/24 notes of sextuplets, which breaks
+# attachments of those notes, so mixed rhythms only use triplets.
+_MIXED_GROUP_TUPLE = _FLAT_GROUP_TUPLE + _TUPLET_GROUP_TUPLE[:3]
+_PITCH_NAME_TUPLE = ("c", "d", "e", "f", "g", "a", "b")
+_VOLUME_TUPLE = ("pp", "p", "mp", "mf", "f", "ff")
+_ARTICULATION_TUPLE = (".", ">", "-", "^")
+_CONTACT_POINT_TUPLE = ("sul tasto", "sul ponticello", "ordinario")
+
+
+def _duration_tuple(
+    event_count: int,
+    group_tuple: tuple[tuple[fractions.Fraction, ...], ...],
+    random_generator: random.Random,
+) -> tuple[fractions.Fraction, ...]:
+    duration_list: list[fractions.Fraction] = []
+    while len(duration_list) < event_count:
+        duration_list.extend(random_generator.choice(group_tuple))
+    return tuple(duration_list)
+
+
+def _pitch(random_generator: random.Random) -> music_parameters.WesternPitch:
+    return music_parameters.WesternPitch(
+        random_generator.choice(_PITCH_NAME_TUPLE), random_generator.randint(3, 5)
+    )
+
+
+def _note_consecution(
+    event_count: int,
+    group_tuple: tuple[tuple[fractions.Fraction, ...], ...],
+    seed: int,
+    **kwargs,
+) -> core_events.Consecution[music_events.NoteLike]:
+    random_generator = random.Random(seed)
+    return core_events.Consecution(
+        [
+            music_events.NoteLike(
+                _pitch(random_generator), duration, volume="mf", **kwargs
+            )
+            for duration in _duration_tuple(event_count, group_tuple, random_generator)
+        ]
+    )
+
+
+def flat_notes(
+    event_count: int, seed: int = 0
+) -> core_events.Consecution[music_events.NoteLike]:
+    """Notes without tuplets, attachments or grace notes."""
+    return _note_consecution(event_count, _FLAT_GROUP_TUPLE, seed)
+
+
+def dense_tuplets(
+    event_count: int, seed: int = 0
+) -> core_events.Consecution[music_events.NoteLike]:
+    """Notes where (nearly) every beat is a triplet or a sextuplet."""
+    return _note_consecution(event_count, _TUPLET_GROUP_TUPLE, seed)
+
+
+def grace_notes(
+    event_count: int, seed: int = 0
+) -> core_events.Consecution[music_events.NoteLike]:
+    """Notes where every second note has before or after grace notes."""
+    consecution = flat_notes(event_count, seed)
+    random_generator = random.Random(seed)
+    for note_like in consecution[::2]:
+        grace_note_consecution = core_events.Consecution(
+            [
+                music_events.NoteLike(_pitch(random_generator), f(1, 8))
+                for _ in range(random_generator.randint(1, 3))
+            ]
+        )
+        if random_generator.random() > 0.25:
+            note_like.grace_note_consecution = grace_note_consecution
+        else:
+            note_like.after_grace_note_consecution = grace_note_consecution
+    return consecution
+
+
+def heavy_indicators(
+    event_count: int, seed: int = 0
+) -> core_events.Consecution[music_events.NoteLike]:
+    """Notes with many playing and notation indicators and volume changes."""
+    consecution = _note_consecution(event_count, _MIXED_GROUP_TUPLE, seed)
+    random_generator = random.Random(seed)
+    for index, note_like in enumerate(consecution):
+        playing = note_like.playing_indicator_collection
+        notation = note_like.notation_indicator_collection
+        note_like.volume = random_generator.choice(_VOLUME_TUPLE)
+        playing.articulation.name = random_generator.choice(_ARTICULATION_TUPLE)
+        playing.string_contact_point.contact_point = random_generator.choice(
+            _CONTACT_POINT_TUPLE
+        )
+        if index % 3 == 0:
+            playing.tremolo.flag_count = 2
+        if index % 4 == 0:
+            playing.arpeggio.direction = "up"
+            notation.markup.content = f"m{index}"
+            notation.markup.direction = "up"
+        if index % 5 == 0:
+            playing.bartok_pizzicato.is_active = True
+        if index % 7 == 0:
+            notation.ottava.octave_count = random_generator.choice((-1, 1))
+        if index % 11 == 0:
+            playing.fermata.type = "fermata"
+    return consecution
+
+
+def lyrics(
+    event_count: int, seed: int = 0
+) -> core_events.Consecution[music_events.NoteLike]:
+    """Notes which all carry a syllable of a lyric."""
+    consecution = flat_notes(event_count, seed)
+    random_generator = random.Random(seed)
+    for note_like in consecution:
+        note_like.lyric = music_parameters.LanguageBasedSyllable(
+            random_generator.random() > 0.5,
+            random_generator.choice(("la", "li", "lo", "mu", "to")),
+        )
+    return consecution
+
+
+def long_tempo_envelope(event_count: int, seed: int = 0) -> core_parameters.FlexTempo:
+    """Tempo envelope which changes its tempo once per beat.
+
+    This isn't an event but the tempo which is passed to
+    :class:`mutwo.abjad_converters.ConsecutionToAbjadVoice`
+    together with :func:`flat_notes`.
+    """
+    random_generator = random.Random(seed)
+    point_list = []
+    for beat_index in range(event_count):
+        tempo = core_parameters.WesternTempo(random_generator.randint(50, 140))
+        point_list.append((beat_index, tempo))
+    return core_parameters.FlexTempo(point_list)
+
+
+def multi_staff_score(
+    event_count: int, seed: int = 0, staff_count: int = 8
+) -> core_events.Concurrence:
+    """Score with ``staff_count`` staves, each with ``event_count`` notes."""
+    return core_events.Concurrence(
+        [
+            core_events.Concurrence(
+                [
+                    _note_consecution(
+                        event_count,
+                        _MIXED_GROUP_TUPLE,
+                        seed + staff_index,
+                    )
+                ],
+                tag=f"Staff{staff_index}",
+            )
+            for staff_index in range(staff_count)
+        ],
+        tag="Score",
+    )
@@ -0,0 +1,301 @@
+"""Benchmark the conversion of mutwo events to abjad.
+
+Each benchmark converts a synthetic event (see ``generators.py``) with
+:class:`mutwo.abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer`,
+:class:`mutwo.abjad_converters.NauertConsecutionToQuantizedAbjadContainer`
+and :class:`mutwo.abjad_converters.GridConsecutionToQuantizedAbjadContainer`
+at increasing event counts. Results are written to
+``benchmarks/results/<mutwo.abjad version>.json`` so that two versions can
+be compared later on::
+
+    python benchmarks/run.py
+    python benchmarks/run.py --benchmark flat_notes lyrics --size 16 64
+    python benchmarks/run.py --compare results/0.19.0.json results/0.20.0.json
+
+Timed runs don't record any statistics. If the installed version supports
+:class:`mutwo.abjad_utilities.ConversionStatistics`, the stage statistics
+are collected in one additional run which isn't timed. Quantizers and
+parameters which the installed version doesn't offer are skipped, so that
+older versions can be benchmarked, too.
+"""
+
+import argparse
+import concurrent.futures
+import dataclasses
+import datetime
+import functools
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import typing
+
+import abjad
+
+from mutwo import abjad_converters
+from mutwo import abjad_utilities
+from mutwo import abjad_version
+
+import generators
+
+
+def _has_parameter(callable_: typing.Callable, parameter_name: str) -> bool:
+    return parameter_name in inspect.signature(callable_).parameters
+
+
+# Older versions don't offer all quantizers and parameters.
+ConversionStatistics = getattr(abjad_utilities, "ConversionStatistics", None)
+IS_STATISTICS_SUPPORTED = ConversionStatistics is not None and _has_parameter(
+    abjad_converters.ConsecutionToAbjadVoice, "statistics"
+)
+
+QUANTIZER_DICT = {
+    "leaf_maker": abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer,
+    "nauert": abjad_converters.NauertConsecutionToQuantizedAbjadContainer,
+}
+if hasattr(abjad_converters, "GridConsecutionToQuantizedAbjadContainer"):
+    QUANTIZER_DICT["grid"] = abjad_converters.GridConsecutionToQuantizedAbjadContainer
+if _has_parameter(
+    abjad_converters.NauertConsecutionToQuantizedAbjadContainer,
+    "segment_at_bar_lines",
+):
+    QUANTIZER_DICT["nauert_segmented"] = functools.partial(
+        abjad_converters.NauertConsecutionToQuantizedAbjadContainer,
+        segment_at_bar_lines=True,
+        executor_class=concurrent.futures.ProcessPoolExecutor,
+    )
+
+DEFAULT_SIZE_TUPLE = (16, 64, 256)
+
+# Nauert quantization is orders of magnitudes slower than the leaf maker,
+# so large event counts are only benchmarked for the leaf maker by default.
+DEFAULT_NAUERT_MAXIMUM_SIZE = 64
+
+RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# Relative slow down at which '--compare' marks a benchmark as regression.
+DEFAULT_REGRESSION_THRESHOLD = 0.1
+
+
+def _statistics_kwargs(statistics_) -> dict:
+    # Don't pass the parameter at all if no statistics are collected:
+    # older versions don't know it.
+    if statistics_ is None:
+        return {}
+    return {"statistics": statistics_}
+
+
+def _voice_converter(quantizer_class, statistics_, **kwargs):
+    return abjad_converters.ConsecutionToAbjadVoice(
+        quantizer_class(), **_statistics_kwargs(statistics_), **kwargs
+    )
+
+
+def _consecution_benchmark(generator):
+    def benchmark(size, quantizer_class, statistics_):
+        return _voice_converter(quantizer_class, statistics_), generator(size)
+
+    return benchmark
+
+
+def _long_tempo_envelope(size, quantizer_class, statistics_):
+    converter = _voice_converter(
+        quantizer_class,
+        statistics_,
+        default_tempo=generators.long_tempo_envelope(size),
+    )
+    return converter, generators.flat_notes(size)
+
+
+def _multi_staff_score(size, quantizer_class, statistics_):
+    event = generators.multi_staff_score(size)
+    converter = abjad_converters.NestedCompoundToAbjadContainer(
+        abjad_converters.TagBasedNestedCompoundToCompoundToAbjadContainers(
+            {
+                staff.tag: abjad_converters.NestedCompoundToAbjadContainer(
+                    abjad_converters.CycleBasedNestedCompoundToCompoundToAbjadContainers(
+                        [_voice_converter(quantizer_class, statistics_)]
+                    ),
+                    abjad.Staff,
+                    "Staff",
+                    **_statistics_kwargs(statistics_),
+                )
+                for staff in event
+            }
+        ),
+        abjad.Score,
+        "Score",
+        **_statistics_kwargs(statistics_),
+    )
+    return converter, event
+
+
+BENCHMARK_DICT: dict[str, typing.Callable] = {
+    "flat_notes": _consecution_benchmark(generators.flat_notes),
+    "dense_tuplets": _consecution_benchmark(generators.dense_tuplets),
+    "grace_notes": _consecution_benchmark(generators.grace_notes),
+    "heavy_indicators": _consecution_benchmark(generators.heavy_indicators),
+    "lyrics": _consecution_benchmark(generators.lyrics),
+    "long_tempo_envelope": _long_tempo_envelope,
+    "multi_staff_score": _multi_staff_score,
+}
+
+
+def run_benchmark(
+    benchmark_name: str, quantizer_name: str, size: int, repeat: int
+) -> dict:
+    """Convert one synthetic event ``repeat`` times and return its timings."""
+
+    def make_converter_and_event(statistics_):
+        # Converters are rebuilt for each run, so that caches don't
+        # leak from one run into the next one.
+        return BENCHMARK_DICT[benchmark_name](
+            size, QUANTIZER_DICT[quantizer_name], statistics_
+        )
+
+    time_list = []
+    for _ in range(repeat):
+        converter, event = make_converter_and_event(None)
+        start = time.perf_counter()
+        abjad_object = converter.convert(event)
+        time_list.append(time.perf_counter() - start)
+    # Statistics slow the conversion down, so they are collected in
+    # a separate run which isn't timed.
+    stage_dict = {}
+    if IS_STATISTICS_SUPPORTED:
+        statistics_ = ConversionStatistics()
+        converter, event = make_converter_and_event(statistics_)
+        converter.convert(event)
+        stage_dict = {
+            stage_name: dataclasses.asdict(stage)
+            for stage_name, stage in statistics_.stage_dict.items()
+        }
+    return {
+        "benchmark": benchmark_name,
+        "quantizer": quantizer_name,
+        "size": size,
+        "repeat": repeat,
+        "leaf_count": len(abjad.select.leaves(abjad_object)),
+        "minimum": min(time_list),
+        "median": statistics.median(time_list),
+        "stage_dict": stage_dict,
+    }
+
+
+def run(
+    benchmark_name_sequence: typing.Sequence[str],
+    quantizer_name_sequence: typing.Sequence[str],
+    size_sequence: typing.Sequence[int],
+    repeat: int,
+    nauert_maximum_size: int,
+) -> dict:
+    """Run all requested benchmarks and return a JSON serializable report."""
+    result_list = []
+    for benchmark_name in benchmark_name_sequence:
+        for quantizer_name in quantizer_name_sequence:
+            for size in size_sequence:
+                if quantizer_name.startswith("nauert") and size > nauert_maximum_size:
+                    continue
+                result = run_benchmark(benchmark_name, quantizer_name, size, repeat)
+                print(
+                    f"{benchmark_name:<20} {quantizer_name:<16} {size:>6}"
+                    f" {result['minimum']:>10.4f}s",
+                    flush=True,
+                )
+                result_list.append(result)
+    return {
+        "version": abjad_version.VERSION,
+        "abjad_version": abjad.__version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "result_list": result_list,
+    }
+
+
+def compare(old_path: str, new_path: str, threshold: float) -> bool:
+    """Print the speed up of ``new_path`` in relation to ``old_path``.
+
+    Returns ``True`` if no benchmark got slower by more than ``threshold``.
+    """
+
+    def load(path):
+        with open(path) as f:
+            report = json.load(f)
+        return report["version"], {
+            (r["benchmark"], r["quantizer"], r["size"]): r["minimum"]
+            for r in report["result_list"]
+        }
+
+    old_version, old_dict = load(old_path)
+    new_version, new_dict = load(new_path)
+    print(
+        f"{'benchmark':<20} {'quantizer':<16} {'size':>6}"
+        f" {old_version:>10} {new_version:>10} {'speed up':>9}"
+    )
+    is_ok = True
+    for key in sorted(old_dict.keys() & new_dict.keys()):
+        old_time, new_time = old_dict[key], new_dict[key]
+        speed_up = old_time / new_time
+        is_regression = new_time > old_time * (1 + threshold)
+        is_ok = is_ok and not is_regression
+        print(
+            f"{key[0]:<20} {key[1]:<16} {key[2]:>6} {old_time:>9.4f}s"
+            f" {new_time:>9.4f}s {speed_up:>8.2f}x"
+            f"{'  REGRESSION' if is_regression else ''}"
+        )
+    return is_ok
+
+
+def main(argument_list: typing.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--benchmark",
+        nargs="+",
+        choices=tuple(BENCHMARK_DICT),
+        default=tuple(BENCHMARK_DICT),
+    )
+    parser.add_argument(
+        "--quantizer",
+        nargs="+",
+        choices=tuple(QUANTIZER_DICT),
+        default=tuple(QUANTIZER_DICT),
+    )
+    parser.add_argument("--size", nargs="+", type=int, default=DEFAULT_SIZE_TUPLE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--nauert-maximum-size", type=int, default=DEFAULT_NAUERT_MAXIMUM_SIZE
+    )
+    parser.add_argument(
+        "--output",
+        help="path of the JSON report (default: results/<version>.json)",
+    )
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+    arguments = parser.parse_args(argument_list)
+
+    if arguments.compare:
+        return int(not compare(*arguments.compare, arguments.threshold))
+
+    report = run(
+        arguments.benchmark,
+        arguments.quantizer,
+        sorted(arguments.size),
+        arguments.repeat,
+        arguments.nauert_maximum_size,
+    )
+    output_path = arguments.output or os.path.join(
+        RESULTS_PATH, f"{report['version']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote results to '{output_path}'.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,5 +14,20 @@ DEFAULT_ABJAD_ATTACHMENT_CLASS_TUPLE = tuple(
 """Default value for argument `abjad_attachment_classes` in
 :class:`~mutwo.abjad_converters.ConsecutionToAbjadVoiceConverter`."""
 
+DEFAULT_GRID_SUBDIVISION_DICT = {
+    2: {2: {2: None}, 3: None},
+    3: {2: None, 3: None},
+    5: {3: None},
+}
+"""Default value for argument `subdivision_dict` in
+:class:`~mutwo.abjad_converters.GridConsecutionToQuantizedAbjadContainer`.
+
+Each key is a number of equal parts into which a beat (or a part of a
+beat) can be divided. The value describes how each of those parts can be
+divided again (`None` if they can't be divided any further). Not dividing
+a beat or a part is always allowed. By default a beat can therefore be
+divided into eighth notes, sixteenth notes, thirty-second notes, triplets,
+sextuplets, nonuplets, quintuplets and quintuplets with nested triplets."""
+
 # Cleanup
 del abjad_parameters, inspect
@@ -1,8 +1,11 @@
 """Module to build complex multi-level abjad based scores from mutwo events."""
 
 import abc
+import bisect
+import concurrent.futures
 import inspect
 import itertools
+import time
 import typing
 
 try:
@@ -14,6 +17,7 @@ import abjad  # type: ignore
 
 from mutwo import abjad_converters
 from mutwo import abjad_parameters
+from mutwo import abjad_utilities
 from mutwo import core_converters
 from mutwo import core_events
 from mutwo import core_parameters
@@ -27,6 +31,7 @@ from ..parameters import TempoToAbjadAttachmentTempo
 from ..parameters import ComplexTempoToAbjadAttachmentTempo
 from ..parameters import MutwoLyricToAbjadString
 
+from .quantization import AbjadLeafHandle
 from .quantization import ConsecutionToQuantizedAbjadContainer
 from .quantization import LeafMakerConsecutionToQuantizedAbjadContainer
 
@@ -36,6 +41,7 @@ from .quantization import (
 from .quantization import (
     LeafMakerConsecutionToDurationLineBasedQuantizedAbjadContainer,
 )
+from .quantization import LeafHandleTupleTuple
 from .quantization import to_abjad_compatible_duration
 
 
@@ -49,6 +55,25 @@ __all__ = (
 )
 
 
+# The following functions are used as default arguments instead of lambda
+# functions: lambda functions can't be pickled, but converters need to be
+# picklable so that they can be send to worker processes.
+
+
+def _compound_to_none(_: core_events.abc.Compound) -> None:
+    return None
+
+
+def _compound_to_tag(compound: core_events.abc.Compound) -> str:
+    return compound.tag
+
+
+def _chronon_to_empty_consecution(
+    _: core_events.Chronon,
+) -> core_events.Consecution[core_events.Chronon]:
+    return core_events.Consecution([])
+
+
 class CompoundToAbjadContainer(core_converters.abc.Converter):
     def __init__(
         self,
@@ -63,6 +88,7 @@ class CompoundToAbjadContainer(core_converters.abc.Converter):
         post_process_abjad_container_routine_sequence: typing.Sequence[
             abjad_converters.ProcessAbjadContainerRoutine
         ],
+        statistics: typing.Optional[abjad_utilities.ConversionStatistics] = None,
     ):
         self._abjad_container_class = abjad_container_class
         self._lilypond_type_of_abjad_container = lilypond_type_of_abjad_container
@@ -73,6 +99,30 @@ class CompoundToAbjadContainer(core_converters.abc.Converter):
         self._post_process_abjad_container_routine_sequence = (
             post_process_abjad_container_routine_sequence
         )
+        self._statistics = statistics
+
+    def _get_statistics_name(self) -> str:
+        return type(self).__name__
+
+    def _record_stage(
+        self,
+        stage_name: str,
+        start: float,
+        leaf_container: typing.Optional[abjad.Container] = None,
+    ) -> float:
+        # Record the stage which started at 'start' in the statistics
+        # object and return the start of the next stage. Only call this
+        # if there is a statistics object, so that conversions without
+        # statistics call their stages directly. Leaves are only counted
+        # if 'leaf_container' is set (once per conversion, because
+        # counting them walks all leaves again).
+        end = time.perf_counter()
+        self._statistics.record(
+            f"{self._get_statistics_name()}.{stage_name}",
+            end - start,
+            0 if leaf_container is None else len(abjad.select.leaves(leaf_container)),
+        )
+        return end
 
     def _make_empty_abjad_container(
         self, compound_to_converter: core_events.abc.Compound
@@ -140,11 +190,65 @@ class CompoundToAbjadContainer(core_converters.abc.Converter):
 
     def convert(self, compound_to_convert: core_events.abc.Compound) -> abjad.Container:
         abjad_container = self._make_empty_abjad_container(compound_to_convert)
+        is_recording = self._statistics is not None
+        if is_recording:
+            start = time.perf_counter()
         self._pre_process_abjad_container(compound_to_convert, abjad_container)
+        if is_recording:
+            start = self._record_stage("pre_process", start)
         self._fill_abjad_container(abjad_container, compound_to_convert)
+        if is_recording:
+            start = self._record_stage("fill", start, abjad_container)
         self._post_process_abjad_container(compound_to_convert, abjad_container)
+        if is_recording:
+            self._record_stage("post_process", start)
         return abjad_container
 
+    def convert_many(
+        self,
+        compound_sequence_to_convert: typing.Sequence[core_events.abc.Compound],
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        max_workers: typing.Optional[int] = None,
+    ) -> tuple[abjad.Container, ...]:
+        """Convert many independent compounds in parallel.
+
+        :param compound_sequence_to_convert: The compounds which shall be
+            converted.
+        :type compound_sequence_to_convert: typing.Sequence[core_events.abc.Compound]
+        :param executor: The executor which runs the conversions. If set to
+            ``None`` a :class:`concurrent.futures.ProcessPoolExecutor` is
+            created (and shut down again after all conversions finished).
+            Default to ``None``.
+        :type executor: typing.Optional[concurrent.futures.Executor]
+        :param max_workers: Maximum number of worker processes if no
+            ``executor`` is passed. If ``None`` the number of processors
+            of the machine is used. Default to ``None``.
+        :type max_workers: typing.Optional[int]
+        :return: The converted abjad containers in the order of the input.
+
+        When using a process based executor, both the converter and the
+        compounds need to be picklable. This means that all callables
+        passed to the converter (for instance ``compound_to_abjad_container_name``
+        or process container routines) mustn't be lambda functions or closures.
+        Please also note that the results are send back via pickle and that
+        abjad sorts the note heads of chords when unpickling them.
+
+        **Example:**
+
+        >>> from mutwo import core_events, music_events
+        >>> from mutwo import abjad_converters
+        >>> seq_list = [
+        ...     core_events.Consecution([music_events.NoteLike(p, 1)])
+        ...     for p in "c d e".split(" ")
+        ... ]
+        >>> converter = abjad_converters.ConsecutionToAbjadVoice()
+        >>> voice_tuple = converter.convert_many(seq_list, max_workers=2)
+        """
+        if executor is None:
+            with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+                return tuple(executor.map(self.convert, compound_sequence_to_convert))
+        return tuple(executor.map(self.convert, compound_sequence_to_convert))
+
 
 class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
     """Convert :class:`~mutwo.core_events.Consecution` to :class:`abjad.Voice`.
@@ -279,7 +383,12 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
         Default to ``None``, but this will likely change in the future.
     :type event_to_tempo: typing.Optional[typing.Callable[[core_events.abc.Event], typing.Optional[core_parameters.abc.Tempo]]]
     :param abjad_attachment_class_sequence: A tuple which contains all available abjad attachment classes
-        which shall be used by the converter.
+        which shall be used by the converter. Each attachment class is initialised
+        from the indicator with the same name (the snake case version of the
+        class name, see :meth:`mutwo.abjad_parameters.abc.AbjadAttachment.get_class_name`),
+        if this indicator is active. Attachment classes which override
+        ``from_indicator_collection`` or ``is_active`` are called for each
+        indicator collection.
     :type abjad_attachment_class_sequence: typing.Sequence[abjad_parameters.abc.AbjadAttachment], optional
     :param write_multimeasure_rests: Set to ``True`` if the converter should replace
         rests that last a complete bar with multimeasure rests (rests with uppercase
@@ -296,6 +405,11 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
         :class:`mutwo.abjad_converters.PrepareForDurationLineBasedNotation` to
         `post_process_abjad_container_routine_sequence`. Default to ``True``.
     :type prepare_for_duration_line_based_notation: bool
+    :param statistics: If set, the converter records wall time and call count
+        of each conversion stage (quantization, data extraction, pitches,
+        attachments, tempos, multimeasure rests and lyrics) and the number
+        of converted leaves in this object. Default to ``None``.
+    :type statistics: typing.Optional[abjad_utilities.ConversionStatistics]
     """
 
     ExtractedData = tuple[
@@ -376,7 +490,7 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
         lilypond_type_of_abjad_container: str = "Voice",
         compound_to_abjad_container_name: typing.Callable[
             [core_events.abc.Compound], typing.Optional[str]
-        ] = lambda _: None,
+        ] = _compound_to_none,
         pre_process_abjad_container_routine_sequence: typing.Sequence[
             abjad_converters.ProcessAbjadContainerRoutine
         ] = tuple([]),
@@ -385,6 +499,7 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
         ] = tuple([]),
         duration_line_engraver: bool = True,
         prepare_for_duration_line_based_notation: bool = True,
+        statistics: typing.Optional[abjad_utilities.ConversionStatistics] = None,
     ):
         self._with_duration_line = isinstance(
             consecution_to_quantized_abjad_container,
@@ -417,6 +532,7 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
             compound_to_abjad_container_name,
             pre_process_abjad_container_routine_sequence,
             post_process_abjad_container_routine_sequence,
+            statistics,
         )
 
         if abjad_attachment_class_sequence is None:
@@ -432,6 +548,31 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
             abjad_attachment_class.get_class_name()
             for abjad_attachment_class in self._abjad_attachment_class_sequence
         )
+        self._attachment_name_to_position_dict = {
+            attachment_name: position
+            for position, attachment_name in enumerate(self._available_attachment_tuple)
+        }
+        # Attachments are initialised from the indicator with the same name.
+        # With this registry we only need to visit the active indicators of
+        # an indicator collection, instead of probing all attachment classes.
+        # Classes which override 'from_indicator_collection' or 'is_active'
+        # may not follow this rule: they are called for each collection.
+        self._indicator_name_to_abjad_attachment_class_dict = {}
+        fallback_abjad_attachment_class_list = []
+        for attachment_name, abjad_attachment_class in zip(
+            self._available_attachment_tuple, self._abjad_attachment_class_sequence
+        ):
+            if ConsecutionToAbjadVoice._is_abjad_attachment_class_registrable(
+                abjad_attachment_class
+            ):
+                self._indicator_name_to_abjad_attachment_class_dict[
+                    attachment_name
+                ] = abjad_attachment_class
+            else:
+                fallback_abjad_attachment_class_list.append(abjad_attachment_class)
+        self._fallback_abjad_attachment_class_tuple = tuple(
+            fallback_abjad_attachment_class_list
+        )
 
         self._consecution_to_quantized_abjad_container = (
             consecution_to_quantized_abjad_container
@@ -472,22 +613,90 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
 
         self._write_multimeasure_rests = write_multimeasure_rests
 
+        # Grace note converters are created lazily and reused for all
+        # chronons with grace notes (see '_get_grace_note_converter').
+        self._is_before_to_grace_note_converter_dict: dict[
+            bool, "_GraceNotesToAbjadVoiceConverter"
+        ] = {}
+
     # ###################################################################### #
     #                          static methods                                #
     # ###################################################################### #
 
+    @staticmethod
+    def _is_abjad_attachment_class_registrable(
+        abjad_attachment_class: typing.Type[abjad_parameters.abc.AbjadAttachment],
+    ) -> bool:
+        abjad_attachment_base_class = abjad_parameters.abc.AbjadAttachment
+        return (
+            abjad_attachment_class.from_indicator_collection.__func__
+            is abjad_attachment_base_class.from_indicator_collection.__func__
+            and abjad_attachment_class.is_active
+            is abjad_attachment_base_class.is_active
+        )
+
     @staticmethod
     def _find_absolute_times_of_abjad_leaves(
         abjad_voice: abjad.Voice,
     ) -> tuple[fractions.Fraction, ...]:
+        # We collect the start offsets of all leaves in one walk through
+        # the tree, instead of calling 'abjad.get.timespan' for each leaf
+        # (which climbs the parentage of the leaf again and again).
         absolute_time_per_leaf_list: list[fractions.Fraction] = []
-        for leaf in abjad.select.leaves(abjad_voice):
-            start, _ = abjad.get.timespan(leaf).offsets
-            absolute_time_per_leaf_list.append(
-                fractions.Fraction(start.numerator, start.denominator)
-            )
+
+        def add_component(
+            component: abjad.Component,
+            start: abjad.Duration,
+            prolation: abjad.Multiplier,
+        ) -> abjad.Duration:
+            if isinstance(component, abjad.Leaf):
+                absolute_time_per_leaf_list.append(
+                    fractions.Fraction(start.numerator, start.denominator)
+                )
+                return start + (
+                    abjad.get.duration(component, preprolated=True) * prolation
+                )
+            if isinstance(component, abjad.Tuplet):
+                prolation *= component.implied_prolation
+            if component.simultaneous:
+                return max(
+                    [start]
+                    + [
+                        add_component(child, start, prolation)
+                        for child in component
+                    ]
+                )
+            for child in component:
+                start = add_component(child, start, prolation)
+            return start
+
+        add_component(abjad_voice, abjad.Duration(0), abjad.Multiplier(1))
         return tuple(absolute_time_per_leaf_list)
 
+    @staticmethod
+    def _find_closest_leaf_index(
+        absolute_time: core_parameters.abc.Duration,
+        absolute_time_per_leaf: tuple[fractions.Fraction, ...],
+    ) -> int:
+        # Bisection based equivalent of 'core_utilities.find_closest_index'
+        # for already sorted start times: if two leaves are equally close
+        # the later leaf wins, and for leaves with equal start times the
+        # first leaf is returned.
+        beat_count = absolute_time.beat_count
+        leaf_count = len(absolute_time_per_leaf)
+        solution = bisect.bisect_left(absolute_time_per_leaf, beat_count)
+        if solution == leaf_count:
+            index = solution - 1
+        elif solution == 0:
+            index = solution
+        elif abs(absolute_time_per_leaf[solution] - beat_count) <= abs(
+            absolute_time_per_leaf[solution - 1] - beat_count
+        ):
+            index = solution
+        else:
+            index = solution - 1
+        return bisect.bisect_left(absolute_time_per_leaf, absolute_time_per_leaf[index])
+
     @staticmethod
     def _replace_rests_with_full_measure_rests(abjad_voice: abjad.Voice) -> None:
         def ok(indicator_sequence) -> bool:
@@ -521,6 +730,43 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
                 )
                 del bar[1:]
 
+    @staticmethod
+    def _remove_leaves(leaf_handle_sequence: typing.Sequence[AbjadLeafHandle]):
+        # Remove each slot only once and start with the highest index of
+        # each parent, so that the remaining handles still point to the
+        # correct slots.
+        leaf_handle_dict = {
+            leaf_handle.key: leaf_handle for leaf_handle in leaf_handle_sequence
+        }
+        for leaf_handle in sorted(
+            leaf_handle_dict.values(),
+            key=lambda leaf_handle: leaf_handle.index,
+            reverse=True,
+        ):
+            del leaf_handle.parent[leaf_handle.index]
+
+    @staticmethod
+    def _to_leaf_handle_tuple_tuple_per_chronon(
+        quanitisized_abjad_leaf_voice: abjad.Voice,
+        related_abjad_leaf_tuple_tuple_per_chronon: tuple[
+            tuple[typing.Union[AbjadLeafHandle, tuple[int, ...]], ...], ...
+        ],
+    ) -> LeafHandleTupleTuple:
+        # Quantizers may still return nested index paths instead of
+        # leaf handles: resolve them once, so that all later stages
+        # can directly access the leaves.
+        return tuple(
+            tuple(
+                leaf_handle
+                if isinstance(leaf_handle, AbjadLeafHandle)
+                else AbjadLeafHandle.from_index_sequence(
+                    leaf_handle, quanitisized_abjad_leaf_voice
+                )
+                for leaf_handle in related_abjad_leaf_tuple
+            )
+            for related_abjad_leaf_tuple in related_abjad_leaf_tuple_tuple_per_chronon
+        )
+
     # ###################################################################### #
     #                          private methods                               #
     # ###################################################################### #
@@ -536,14 +782,32 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
         indicator_collection: music_parameters.abc.IndicatorCollection,
     ) -> dict[str, abjad_parameters.abc.AbjadAttachment]:
         attachment_dict = {}
-        for abjad_attachment_class in self._abjad_attachment_class_sequence:
+        keyword_argument_dict = dict(
+            is_chronon_rest=self._consecution_to_quantized_abjad_container._is_chronon_rest,
+            mutwo_pitch_to_abjad_pitch=self._mutwo_pitch_to_abjad_pitch,
+            mutwo_volume_to_abjad_attachment_dynamic=self._mutwo_volume_to_abjad_attachment_dynamic,
+            mutwo_lyric_to_abjad_string=self._mutwo_lyric_to_abjad_string,
+            with_duration_line=self._with_duration_line,
+        )
+        for indicator_name, indicator in indicator_collection.indicator_dict.items():
+            try:
+                abjad_attachment_class = (
+                    self._indicator_name_to_abjad_attachment_class_dict[indicator_name]
+                )
+            except KeyError:
+                continue
+            # Inactive indicators won't be applied anyway
+            if not indicator.is_active:
+                continue
+            abjad_attachment = abjad_attachment_class.from_indicator_collection(
+                indicator_collection, **keyword_argument_dict
+            )
+            if abjad_attachment:
+                attachment_dict.update({indicator_name: abjad_attachment})
+
+        for abjad_attachment_class in self._fallback_abjad_attachment_class_tuple:
             abjad_attachment = abjad_attachment_class.from_indicator_collection(
-                indicator_collection,
-                is_chronon_rest=self._consecution_to_quantized_abjad_container._is_chronon_rest,
-                mutwo_pitch_to_abjad_pitch=self._mutwo_pitch_to_abjad_pitch,
-                mutwo_volume_to_abjad_attachment_dynamic=self._mutwo_volume_to_abjad_attachment_dynamic,
-                mutwo_lyric_to_abjad_string=self._mutwo_lyric_to_abjad_string,
-                with_duration_line=self._with_duration_line,
+                indicator_collection, **keyword_argument_dict
             )
             if abjad_attachment:
                 attachment_dict.update(
@@ -552,6 +816,26 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
 
         return attachment_dict
 
+    def _get_grace_note_converter(
+        self, is_before: bool
+    ) -> "_GraceNotesToAbjadVoiceConverter":
+        try:
+            return self._is_before_to_grace_note_converter_dict[is_before]
+        except KeyError:
+            converter = self._is_before_to_grace_note_converter_dict[
+                is_before
+            ] = _GraceNotesToAbjadVoiceConverter(
+                is_before,
+                self._chronon_to_pitch_list,
+                self._chronon_to_volume,
+                self._chronon_to_playing_indicator_collection,
+                self._chronon_to_notation_indicator_collection,
+                self._mutwo_pitch_to_abjad_pitch,
+                self._consecution_to_quantized_abjad_container,
+                self._statistics,
+            )
+            return converter
+
     def _grace_note_consecution_to_abjad_attachment(
         self,
         grace_note_consecution_or_after_grace_note_consecution: core_events.Consecution[
@@ -561,15 +845,7 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
     ) -> dict[str, abjad_parameters.abc.AbjadAttachment]:
         if not grace_note_consecution_or_after_grace_note_consecution:
             return {}
-        converter = _GraceNotesToAbjadVoiceConverter(
-            is_before,
-            self._chronon_to_pitch_list,
-            self._chronon_to_volume,
-            self._chronon_to_playing_indicator_collection,
-            self._chronon_to_notation_indicator_collection,
-            self._mutwo_pitch_to_abjad_pitch,
-            self._consecution_to_quantized_abjad_container,
-        )
+        converter = self._get_grace_note_converter(is_before)
         grace_note_consecution_container = converter.convert(
             grace_note_consecution_or_after_grace_note_consecution
         )
@@ -581,6 +857,34 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
             abjad_attachment_class = abjad_parameters.AfterGraceNoteConsecution
         return {name: abjad_attachment_class(grace_note_consecution_container)}
 
+    def _grace_note_consecutions_to_abjad_attachment_dict_tuple(
+        self,
+        extracted_data_per_chronon: ExtractedDataPerChronon,
+    ) -> tuple[dict[str, abjad_parameters.abc.AbjadAttachment], ...]:
+        # Each (after) grace note consecution is still converted on its
+        # own, because attachments (e.g. dynamics or slurs) must not leak
+        # from one grace note group into the next one. Only the converters
+        # are shared; chronons without grace notes are skipped without any
+        # further function calls.
+        abjad_attachment_dict_list = []
+        for extracted_data in extracted_data_per_chronon:
+            grace_note_consecution, after_grace_note_consecution = extracted_data[2:4]
+            abjad_attachment_dict = {}
+            if grace_note_consecution:
+                abjad_attachment_dict.update(
+                    self._grace_note_consecution_to_abjad_attachment(
+                        grace_note_consecution, True
+                    )
+                )
+            if after_grace_note_consecution:
+                abjad_attachment_dict.update(
+                    self._grace_note_consecution_to_abjad_attachment(
+                        after_grace_note_consecution, False
+                    )
+                )
+            abjad_attachment_dict_list.append(abjad_attachment_dict)
+        return tuple(abjad_attachment_dict_list)
+
     def _volume_to_abjad_attachment(
         self, volume: music_parameters.abc.Volume
     ) -> dict[str, abjad_parameters.abc.AbjadAttachment]:
@@ -611,8 +915,6 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
             ConsecutionToAbjadVoice._find_absolute_times_of_abjad_leaves(abjad_voice)
         )
 
-        assert absolute_time_per_leaf == tuple(sorted(absolute_time_per_leaf))
-
         leaf_index_to_tempo_attachment_pairs_list: list[
             tuple[
                 int,
@@ -623,8 +925,8 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
             ]
         ] = []
         for absolute_time, tempo_attachment in tempo_attachment_tuple:
-            closest_leaf = core_utilities.find_closest_index(
-                absolute_time.beat_count, absolute_time_per_leaf
+            closest_leaf = ConsecutionToAbjadVoice._find_closest_leaf_index(
+                absolute_time, absolute_time_per_leaf
             )
             # special case:
             # check for stop dynamic change indication
@@ -643,34 +945,32 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
     def _get_abjad_parameters_for_quantized_abjad_leaves(
         self,
         extracted_data_per_chronon: ExtractedDataPerChronon,
-    ) -> tuple[tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...], ...]:
-        abjad_parameters_per_type_per_event: dict[
-            str, list[typing.Optional[abjad_parameters.abc.AbjadAttachment]]
-        ] = {
-            attachment_name: [None for _ in extracted_data_per_chronon]
-            for attachment_name in self._available_attachment_tuple
-        }
-        for nth_event, extracted_data in enumerate(extracted_data_per_chronon):
+    ) -> tuple[tuple[tuple[int, abjad_parameters.abc.AbjadAttachment], ...], ...]:
+        # Sparse table: for each attachment type we only store the
+        # attachments which are actually used, each together with the
+        # index of the chronon it belongs to.
+        nth_event_and_attachment_list_per_type: dict[
+            str, list[tuple[int, abjad_parameters.abc.AbjadAttachment]]
+        ] = {}
+        grace_note_attachment_dict_tuple = (
+            self._grace_note_consecutions_to_abjad_attachment_dict_tuple(
+                extracted_data_per_chronon
+            )
+        )
+        for nth_event, (extracted_data, grace_note_attachment_dict) in enumerate(
+            zip(extracted_data_per_chronon, grace_note_attachment_dict_tuple)
+        ):
             (
                 _,
                 volume,
-                grace_note_consecution,
-                after_grace_note_consecution,
+                _,
+                _,
                 playing_indicators,
                 notation_indicators,
                 *_,
             ) = extracted_data
             abjad_parameters_for_nth_event = self._volume_to_abjad_attachment(volume)
-            abjad_parameters_for_nth_event.update(
-                self._grace_note_consecution_to_abjad_attachment(
-                    grace_note_consecution, True
-                )
-            )
-            abjad_parameters_for_nth_event.update(
-                self._grace_note_consecution_to_abjad_attachment(
-                    after_grace_note_consecution, False
-                )
-            )
+            abjad_parameters_for_nth_event.update(grace_note_attachment_dict)
             abjad_parameters_for_nth_event.update(
                 self._indicator_collection_to_abjad_parameters(playing_indicators)
             )
@@ -678,13 +978,27 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
                 self._indicator_collection_to_abjad_parameters(notation_indicators)
             )
             for attachment_name, attachment in abjad_parameters_for_nth_event.items():
-                abjad_parameters_per_type_per_event[attachment_name][
-                    nth_event
-                ] = attachment
-
+                try:
+                    nth_event_and_attachment_list = (
+                        nth_event_and_attachment_list_per_type[attachment_name]
+                    )
+                except KeyError:
+                    nth_event_and_attachment_list = (
+                        nth_event_and_attachment_list_per_type[attachment_name]
+                    ) = []
+                nth_event_and_attachment_list.append((nth_event, attachment))
+
+        # Keep the order of 'abjad_attachment_class_sequence', because
+        # the order in which attachments are applied can change the result.
+        attachment_count = len(self._available_attachment_tuple)
         return tuple(
-            tuple(abjad_parameters)
-            for abjad_parameters in abjad_parameters_per_type_per_event.values()
+            tuple(nth_event_and_attachment_list_per_type[attachment_name])
+            for attachment_name in sorted(
+                nth_event_and_attachment_list_per_type,
+                key=lambda attachment_name: self._attachment_name_to_position_dict.get(
+                    attachment_name, attachment_count
+                ),
+            )
         )
 
     def _apply_tempo_on_quantized_abjad_leaves(
@@ -713,14 +1027,12 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
     def _apply_abjad_parameters_on_quantized_abjad_leaves(
         self,
         quanitisized_abjad_leaf_voice: abjad.Voice,
-        related_abjad_leaf_index_tuple_tuple_per_chronon: tuple[
-            tuple[tuple[int, ...], ...], ...
-        ],
-        abjad_parameters_per_type_per_event_tuple: tuple[
-            tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...], ...
+        related_abjad_leaf_handle_tuple_tuple_per_chronon: LeafHandleTupleTuple,
+        abjad_parameters_per_type_tuple: tuple[
+            tuple[tuple[int, abjad_parameters.abc.AbjadAttachment], ...], ...
         ],
     ) -> None:
-        index_tuple_to_remove_list: list[tuple[int, ...]] = []
+        leaf_handle_to_remove_list: list[AbjadLeafHandle] = []
 
         # All indicators which don't replace leaf-by-leaf can
         # potentially break indicators which do replace leaf-by-leaf:
@@ -729,80 +1041,73 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
         # To fix this we ensure that all leaf-by-leaf indicators are applied
         # before more complex converters start.
 
-        def filter_key(abjad_parameters_per_type):
-            abjad_parameters_per_type = tuple(filter(bool, abjad_parameters_per_type))
-            if abjad_parameters_per_type:
-                return int(abjad_parameters_per_type[0].replace_leaf_by_leaf is False)
+        def filter_key(nth_event_and_attachment_tuple):
+            if nth_event_and_attachment_tuple:
+                _, attachment = nth_event_and_attachment_tuple[0]
+                return int(attachment.replace_leaf_by_leaf is False)
             else:
                 return 0
 
-        abjad_parameters_per_type_per_event_tuple = sorted(
-            abjad_parameters_per_type_per_event_tuple,
+        abjad_parameters_per_type_tuple = sorted(
+            abjad_parameters_per_type_tuple,
             key=filter_key,
         )
 
-        for abjad_parameters_per_type in abjad_parameters_per_type_per_event_tuple:
+        for nth_event_and_attachment_tuple in abjad_parameters_per_type_tuple:
             previous_attachment = None
-            for related_abjad_leaf_index_tuple_tuple, attachment in zip(
-                related_abjad_leaf_index_tuple_tuple_per_chronon,
-                abjad_parameters_per_type,
-            ):
-                if attachment and attachment.is_active:
-                    index_tuple_to_remove_list.extend(
+            for nth_event, attachment in nth_event_and_attachment_tuple:
+                related_abjad_leaf_handle_tuple = (
+                    related_abjad_leaf_handle_tuple_tuple_per_chronon[nth_event]
+                )
+                # Rests which have been merged into a previous rest by the
+                # quantizer don't have any leaves.
+                if (
+                    attachment
+                    and attachment.is_active
+                    and related_abjad_leaf_handle_tuple
+                ):
+                    leaf_handle_to_remove_list.extend(
                         self._apply_abjad_attachment(
                             attachment,
                             previous_attachment,
-                            quanitisized_abjad_leaf_voice,
-                            related_abjad_leaf_index_tuple_tuple,
+                            related_abjad_leaf_handle_tuple,
                         )
                     )
                     previous_attachment = attachment
 
-        for index_tuple in reversed(index_tuple_to_remove_list):
-            core_utilities.del_nested_item_from_index_sequence(
-                index_tuple, quanitisized_abjad_leaf_voice
-            )
+        ConsecutionToAbjadVoice._remove_leaves(leaf_handle_to_remove_list)
 
     def _apply_abjad_attachment(
         self,
         attachment: abjad_parameters.abc.AbjadAttachment,
         previous_attachment: typing.Optional[abjad_parameters.abc.AbjadAttachment],
-        quanitisized_abjad_leaf_voice: abjad.Voice,
-        related_abjad_leaf_index_tuple_tuple,
-    ) -> tuple[tuple[int, ...]]:
+        related_abjad_leaf_handle_tuple: tuple[AbjadLeafHandle, ...],
+    ) -> tuple[AbjadLeafHandle, ...]:
         abjad_leaf_tuple = tuple(
-            core_utilities.get_nested_item_from_index_sequence(
-                index_tuple,
-                quanitisized_abjad_leaf_voice,
-            )
-            for index_tuple in related_abjad_leaf_index_tuple_tuple
+            leaf_handle.leaf for leaf_handle in related_abjad_leaf_handle_tuple
         )
         processed_abjad_leaf_tuple = attachment.process_leaf_tuple(
             abjad_leaf_tuple, previous_attachment
         )
         if attachment.replace_leaf_by_leaf:
             assert len(processed_abjad_leaf_tuple) == len(
-                related_abjad_leaf_index_tuple_tuple
+                related_abjad_leaf_handle_tuple
             ), f"Attachment '{attachment}' returned bad abjad_leaf_tuple!"
         else:
             processed_abjad_leaf_tuple = (processed_abjad_leaf_tuple,) + (
-                (None,) * (len(related_abjad_leaf_index_tuple_tuple) - 1)
+                (None,) * (len(related_abjad_leaf_handle_tuple) - 1)
             )
-        index_tuple_to_remove_list = []
-        for processed_abjad_leaf, index_tuple in zip(
-            processed_abjad_leaf_tuple, related_abjad_leaf_index_tuple_tuple
+        leaf_handle_to_remove_list = []
+        for processed_abjad_leaf, leaf_handle in zip(
+            processed_abjad_leaf_tuple, related_abjad_leaf_handle_tuple
         ):
             if processed_abjad_leaf is None:
                 # We can't immediately call __delitem__, because
-                # this would confuse all other indices!
-                index_tuple_to_remove_list.append(index_tuple)
+                # this would confuse all other handles with the same parent!
+                leaf_handle_to_remove_list.append(leaf_handle)
             else:
-                core_utilities.set_nested_item_from_index_sequence(
-                    index_tuple,
-                    quanitisized_abjad_leaf_voice,
-                    processed_abjad_leaf,
-                )
-        return tuple(index_tuple_to_remove_list)
+                leaf_handle.leaf = processed_abjad_leaf
+        return tuple(leaf_handle_to_remove_list)
 
     def _extract_pitch_list_and_volume_from_chronon(
         self, chronon: core_events.Chronon
@@ -830,21 +1135,26 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
 
         return tuple(extracted_data)  # type: ignore
 
+    def _extract_data_from_consecution(
+        self, consecution_to_convert: core_events.Consecution[core_events.Chronon]
+    ) -> ExtractedDataPerChronon:
+        return tuple(
+            self._extract_data_from_chronon(chronon)
+            for chronon in consecution_to_convert
+        )
+
     def _apply_pitch_list_on_quantized_abjad_leaf(
         self,
-        quanitisized_abjad_leaf_voice: abjad.Voice,
         abjad_pitch_list: list[abjad.Pitch],
-        related_abjad_leaf_index_tuple_tuple: tuple[tuple[int, ...], ...],
+        related_abjad_leaf_handle_tuple: tuple[AbjadLeafHandle, ...],
     ):
         if len(abjad_pitch_list) == 1:
             leaf_class = abjad.Note
         else:
             leaf_class = abjad.Chord
 
-        for related_abjad_leaf_index_tuple in related_abjad_leaf_index_tuple_tuple:
-            abjad_leaf = core_utilities.get_nested_item_from_index_sequence(
-                related_abjad_leaf_index_tuple, quanitisized_abjad_leaf_voice
-            )
+        for leaf_handle in related_abjad_leaf_handle_tuple:
+            abjad_leaf = leaf_handle.leaf
             if leaf_class == abjad.Note:
                 abjad_leaf.note_head._written_pitch = abjad_pitch_list[0]
             else:
@@ -861,15 +1171,11 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
                 ):
                     note_head._written_pitch = abjad_pitch
 
-                core_utilities.set_nested_item_from_index_sequence(
-                    related_abjad_leaf_index_tuple,
-                    quanitisized_abjad_leaf_voice,
-                    new_abjad_leaf,
-                )
+                leaf_handle.leaf = new_abjad_leaf
 
             # In case we have a duration line based quantization, all leaves
             # after the first leaf aren't notes, but simply skips. This is
-            # applied in '_adjust_quantisized_abjad_leaves' and it's necessary
+            # applied in '_add_duration_lines' and it's necessary
             # to make duration line based notation work. Because of this we
             # only need to apply pitches to our very first leaf (and we only
             # *can* apply this to our very first leaf, because all other aren't
@@ -880,20 +1186,18 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
     def _apply_pitches_on_quantized_abjad_leaves(
         self,
         quanitisized_abjad_leaf_voice: abjad.Voice,
-        related_abjad_leaf_index_tuple_tuple_per_chronon: tuple[
-            tuple[tuple[int, ...], ...], ...
-        ],
+        related_abjad_leaf_handle_tuple_tuple_per_chronon: LeafHandleTupleTuple,
         extracted_data_per_chronon: ExtractedDataPerChronon,
-        is_chronon_rest_tuple: tuple[bool, ...],
+        is_chronon_rest_mask: tuple[bool, ...],
     ):
         for (
             is_chronon_rest,
             extracted_data,
-            related_abjad_leaf_index_tuple_tuple,
+            related_abjad_leaf_handle_tuple,
         ) in zip(
-            is_chronon_rest_tuple,
+            is_chronon_rest_mask,
             extracted_data_per_chronon,
-            related_abjad_leaf_index_tuple_tuple_per_chronon,
+            related_abjad_leaf_handle_tuple_tuple_per_chronon,
         ):
             if not is_chronon_rest:
                 pitch_list = extracted_data[0]
@@ -902,19 +1206,18 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
                     for pitch in pitch_list
                 ]
                 self._apply_pitch_list_on_quantized_abjad_leaf(
-                    quanitisized_abjad_leaf_voice,
                     abjad_pitch_list,
-                    related_abjad_leaf_index_tuple_tuple,
+                    related_abjad_leaf_handle_tuple,
                 )
 
     def _get_lyric_content(
         self,
         extracted_data_per_chronon: ExtractedDataPerChronon,
-        is_chronon_rest_tuple: tuple[bool, ...],
+        is_chronon_rest_mask: tuple[bool, ...],
     ) -> str:
         lyric_content_list = []
         for extracted_data, is_chronon_rest in zip(
-            extracted_data_per_chronon, is_chronon_rest_tuple
+            extracted_data_per_chronon, is_chronon_rest_mask
         ):
             if not is_chronon_rest:
                 lyric = extracted_data[6]
@@ -944,64 +1247,102 @@ class ConsecutionToAbjadVoice(CompoundToAbjadContainer):
                 voice_to_apply_lyrics_to,
             )
 
+    def _add_lyrics_to_voice(
+        self,
+        voice_to_apply_lyrics_to: abjad.Voice,
+        extracted_data_per_chronon: ExtractedDataPerChronon,
+        is_chronon_rest_mask: tuple[bool, ...],
+    ):
+        lyric_content = self._get_lyric_content(
+            extracted_data_per_chronon, is_chronon_rest_mask
+        )
+        self._apply_lyrics_on_voice(voice_to_apply_lyrics_to, lyric_content)
+
     def _fill_abjad_container(
         self,
         abjad_container_to_fill: abjad.Voice,
         consecution_to_convert: core_events.Consecution[core_events.Chronon],
     ):
+        # Each stage is recorded in the optional statistics object. Leaves
+        # are only counted once per conversion (in the 'fill' stage of
+        # 'convert').
+        is_recording = self._statistics is not None
+        if is_recording:
+            start = time.perf_counter()
+
         # first quantize the consecution
         (
             quanitisized_abjad_leaf_voice,
-            related_abjad_leaf_index_tuple_tuple_per_chronon,
-            is_chronon_rest_tuple,
+            related_abjad_leaf_handle_tuple_tuple_per_chronon,
+            is_chronon_rest_mask,
         ) = self._consecution_to_quantized_abjad_container.convert(
             consecution_to_convert
         )
+        related_abjad_leaf_handle_tuple_tuple_per_chronon = (
+            ConsecutionToAbjadVoice._to_leaf_handle_tuple_tuple_per_chronon(
+                quanitisized_abjad_leaf_voice,
+                related_abjad_leaf_handle_tuple_tuple_per_chronon,
+            )
+        )
+        if is_recording:
+            start = self._record_stage("quantize", start)
 
         # second, extract data from chronons
-        extracted_data_per_chronon = tuple(
-            self._extract_data_from_chronon(chronon)
-            for chronon in consecution_to_convert
+        extracted_data_per_chronon = self._extract_data_from_consecution(
+            consecution_to_convert
         )
+        if is_recording:
+            start = self._record_stage("extract", start)
 
         # third, apply pitches on Abjad voice
         self._apply_pitches_on_quantized_abjad_leaves(
             quanitisized_abjad_leaf_voice,
-            related_abjad_leaf_index_tuple_tuple_per_chronon,
+            related_abjad_leaf_handle_tuple_tuple_per_chronon,
             extracted_data_per_chronon,
-            is_chronon_rest_tuple,
+            is_chronon_rest_mask,
         )
+        if is_recording:
+            start = self._record_stage("pitches", start)
 
         # fourth, apply dynamics, tempos and playing_indicators on abjad voice
-        abjad_parameters_per_type_per_event = (
+        abjad_parameters_per_type_tuple = (
             self._get_abjad_parameters_for_quantized_abjad_leaves(
                 extracted_data_per_chronon
             )
         )
+        if is_recording:
+            start = self._record_stage("collect_attachments", start)
         tempo = self._get_tempo(consecution_to_convert)
         self._apply_tempo_on_quantized_abjad_leaves(
             quanitisized_abjad_leaf_voice, tempo
         )
+        if is_recording:
+            start = self._record_stage("tempo", start)
         self._apply_abjad_parameters_on_quantized_abjad_leaves(
             quanitisized_abjad_leaf_voice,
-            related_abjad_leaf_index_tuple_tuple_per_chronon,
-            abjad_parameters_per_type_per_event,
+            related_abjad_leaf_handle_tuple_tuple_per_chronon,
+            abjad_parameters_per_type_tuple,
         )
+        if is_recording:
+            start = self._record_stage("apply_attachments", start)
 
         # fifth, replace rests lasting one bar with full measure rests
         if self._write_multimeasure_rests:
             ConsecutionToAbjadVoice._replace_rests_with_full_measure_rests(
                 quanitisized_abjad_leaf_voice
             )
+            if is_recording:
+                start = self._record_stage("multimeasure_rests", start)
 
         # move leaves from 'quanitisized_abjad_leaf_voice' object to target container
         abjad.mutate.swap(quanitisized_abjad_leaf_voice, abjad_container_to_fill)
 
         # finally: apply lyrics on abjad voice
-        lyric_content = self._get_lyric_content(
-            extracted_data_per_chronon, is_chronon_rest_tuple
+        self._add_lyrics_to_voice(
+            abjad_container_to_fill, extracted_data_per_chronon, is_chronon_rest_mask
         )
-        self._apply_lyrics_on_voice(abjad_container_to_fill, lyric_content)
+        if is_recording:
+            self._record_stage("lyrics", start)
 
     # ###################################################################### #
     #               public methods for interaction with the user             #
@@ -1050,15 +1391,15 @@ class _GraceNotesToAbjadVoiceConverter(ConsecutionToAbjadVoice):
             self, consecution_to_convert: core_events.Consecution
         ) -> abjad.Container:
             container = abjad.Container([], simultaneous=False)
-            indices = []
+            leaf_handle_list = []
             for nth_event, event in enumerate(consecution_to_convert):
                 leaf = abjad.Note("c", to_abjad_compatible_duration(event.duration))
                 container.append(leaf)
-                indices.append(((nth_event,),))
+                leaf_handle_list.append((AbjadLeafHandle(container, nth_event),))
             return (
                 container,
-                tuple(indices),
-                tuple(self._is_chronon_rest(e) for e in consecution_to_convert),
+                tuple(leaf_handle_list),
+                bytearray(self._is_chronon_rest(e) for e in consecution_to_convert),
             )
 
     def __init__(
@@ -1080,6 +1421,7 @@ class _GraceNotesToAbjadVoiceConverter(ConsecutionToAbjadVoice):
         ],
         mutwo_pitch_to_abjad_pitch: MutwoPitchToAbjadPitch,
         consecution_to_quantized_abjad_container: ConsecutionToQuantizedAbjadContainer = LeafMakerConsecutionToQuantizedAbjadContainer(),
+        statistics: typing.Optional[abjad_utilities.ConversionStatistics] = None,
     ):
         if is_before:
             abjad_container_class = abjad.BeforeGraceContainer
@@ -1097,13 +1439,12 @@ class _GraceNotesToAbjadVoiceConverter(ConsecutionToAbjadVoice):
             mutwo_pitch_to_abjad_pitch=mutwo_pitch_to_abjad_pitch,
             mutwo_volume_to_abjad_attachment_dynamic=None,
             tempo_to_abjad_attachment_tempo=None,
-            chronon_to_grace_note_consecution=lambda _: core_events.Consecution([]),
-            chronon_to_after_grace_note_consecution=lambda _: core_events.Consecution(
-                []
-            ),
+            chronon_to_grace_note_consecution=_chronon_to_empty_consecution,
+            chronon_to_after_grace_note_consecution=_chronon_to_empty_consecution,
             write_multimeasure_rests=False,
             abjad_container_class=abjad_container_class,
             lilypond_type_of_abjad_container=None,
+            statistics=statistics,
         )
 
     def _grace_note_consecution_to_abjad_attachment(
@@ -1173,7 +1514,7 @@ class TagBasedNestedCompoundToCompoundToAbjadContainers(
         tag_to_abjad_converter_dict: dict[str, CompoundToAbjadContainer],
         compound_to_tag: typing.Callable[
             [core_events.abc.Compound], str
-        ] = lambda compound: compound.tag,
+        ] = _compound_to_tag,
     ):
         self._tag_to_abjad_converter_dict = tag_to_abjad_converter_dict
         self._compound_to_tag = compound_to_tag
@@ -1202,6 +1543,33 @@ class TagBasedNestedCompoundToCompoundToAbjadContainers(
 
 
 class NestedCompoundToAbjadContainer(CompoundToAbjadContainer):
+    """Convert nested compounds to nested abjad containers.
+
+    :param executor_class: If set, the children of the converted compound are
+        converted concurrently in an executor of the given class (for instance
+        :class:`concurrent.futures.ProcessPoolExecutor`). The converted children
+        are still appended in their original order and the pre- and post-process
+        routines run in the same order as in the serial mode. If set to ``None``
+        the children are converted one after another. Default to ``None``.
+    :type executor_class: typing.Optional[typing.Type[concurrent.futures.Executor]]
+    :param max_workers: Maximum number of workers of the executor. If ``None``
+        the default of the executor class is used. Default to ``None``.
+    :type max_workers: typing.Optional[int]
+    :param statistics: If set, the converter records wall time and call
+        count of its conversion stages in this object. Pass the same
+        object to the nested converters to record their stages as well.
+        Default to ``None``.
+    :type statistics: typing.Optional[abjad_utilities.ConversionStatistics]
+
+    When using a process based executor, all child converters need to be
+    picklable (see :meth:`CompoundToAbjadContainer.convert_many`). When using
+    a thread based executor, children which are converted by the same child
+    converter share this converter (and its quantizer and caches) between
+    threads. The converters of :mod:`mutwo.abjad_converters` don't keep any
+    state of a conversion on their instances, but custom converters or
+    functions (for instance ``is_chronon_rest``) need to be thread-safe too.
+    """
+
     def __init__(
         self,
         nested_compound_to_compound_to_abjad_container_converters_converter: NestedCompoundToCompoundToAbjadContainers,
@@ -1209,13 +1577,18 @@ class NestedCompoundToAbjadContainer(CompoundToAbjadContainer):
         lilypond_type_of_abjad_container: str,
         compound_to_abjad_container_name: typing.Callable[
             [core_events.abc.Compound], str
-        ] = lambda compound: compound.tag,
+        ] = _compound_to_tag,
         pre_process_abjad_container_routine_sequence: typing.Sequence[
             abjad_converters.ProcessAbjadContainerRoutine
         ] = tuple([]),
         post_process_abjad_container_routine_sequence: typing.Sequence[
             abjad_converters.ProcessAbjadContainerRoutine
         ] = tuple([]),
+        executor_class: typing.Optional[
+            typing.Type[concurrent.futures.Executor]
+        ] = None,
+        max_workers: typing.Optional[int] = None,
+        statistics: typing.Optional[abjad_utilities.ConversionStatistics] = None,
     ):
         super().__init__(
             abjad_container_class,
@@ -1223,10 +1596,16 @@ class NestedCompoundToAbjadContainer(CompoundToAbjadContainer):
             compound_to_abjad_container_name,
             pre_process_abjad_container_routine_sequence,
             post_process_abjad_container_routine_sequence,
+            statistics,
         )
         self._nested_compound_to_compound_to_abjad_container_converters_converter = (
             nested_compound_to_compound_to_abjad_container_converters_converter
         )
+        self._executor_class = executor_class
+        self._max_workers = max_workers
+
+    def _get_statistics_name(self) -> str:
+        return f"{type(self).__name__}[{self._lilypond_type_of_abjad_container}]"
 
     def _fill_abjad_container(
         self,
@@ -1236,9 +1615,29 @@ class NestedCompoundToAbjadContainer(CompoundToAbjadContainer):
         compound_to_abjad_container_converter_tuple = self._nested_compound_to_compound_to_abjad_container_converters_converter.convert(
             nested_compound_to_convert
         )
-        for compound, compound_to_abjad_container_converter in zip(
-            nested_compound_to_convert,
-            compound_to_abjad_container_converter_tuple,
-        ):
-            converted_compound = compound_to_abjad_container_converter.convert(compound)
-            abjad_container_to_fill.append(converted_compound)
+        compound_and_converter_tuple = tuple(
+            zip(
+                nested_compound_to_convert,
+                compound_to_abjad_container_converter_tuple,
+            )
+        )
+        if self._executor_class is None or len(compound_and_converter_tuple) < 2:
+            for compound, compound_to_abjad_container_converter in (
+                compound_and_converter_tuple
+            ):
+                converted_compound = compound_to_abjad_container_converter.convert(
+                    compound
+                )
+                abjad_container_to_fill.append(converted_compound)
+        else:
+            with self._executor_class(self._max_workers) as executor:
+                future_list = [
+                    executor.submit(compound_to_abjad_container_converter.convert, compound)
+                    for compound, compound_to_abjad_container_converter in (
+                        compound_and_converter_tuple
+                    )
+                ]
+                # Append in original order, regardless of which
+                # child finished first.
+                for future in future_list:
+                    abjad_container_to_fill.append(future.result())
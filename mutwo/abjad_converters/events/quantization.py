@@ -1,6 +1,14 @@
 """Module to quantize free :class:`Consecution` to notation based abjad :class:`Container`"""
 
+from __future__ import annotations
+
 import abc
+import bisect
+import concurrent.futures
+import itertools
+import os
+import threading
+import time
 import typing
 import warnings
 
@@ -11,8 +19,8 @@ except ImportError:
 
 import abjad  # type: ignore
 from abjadext import nauert  # type: ignore
-import ranges  # type: ignore
 
+from mutwo import abjad_converters
 from mutwo import abjad_utilities
 from mutwo import core_converters
 from mutwo import core_events
@@ -20,20 +28,242 @@ from mutwo import core_parameters
 from mutwo import core_utilities
 
 __all__ = (
+    "AbjadLeafHandle",
+    "QuantizationFallback",
     "ConsecutionToQuantizedAbjadContainer",
     "NauertConsecutionToQuantizedAbjadContainer",
     "NauertConsecutionToDurationLineBasedQuantizedAbjadContainer",
     "LeafMakerConsecutionToQuantizedAbjadContainer",
     "LeafMakerConsecutionToDurationLineBasedQuantizedAbjadContainer",
+    "GridConsecutionToQuantizedAbjadContainer",
 )
 
 
-IsChrononRestTuple: typing.TypeAlias = tuple[bool, ...]
+class AbjadLeafHandle(object):
+    """Reference to the slot of a leaf within its parent container.
+
+    :param parent: The container (e.g. a bar or a tuplet) in which
+        the leaf is located.
+    :type parent: abjad.Container
+    :param index: The index of the leaf inside the parent container.
+    :type index: int
+
+    Quantizers return leaf handles to link each chronon with its
+    abjad leaves. Unlike nested index paths a handle doesn't need to walk the
+    tree from the root container for each lookup. Because the handle points
+    to a slot and not to a leaf object, it stays valid if the leaf is
+    replaced by a new leaf.
+
+    **Example:**
+
+    >>> import abjad
+    >>> from mutwo import abjad_converters
+    >>> bar = abjad.Container("c'4 d'4")
+    >>> leaf_handle = abjad_converters.AbjadLeafHandle(bar, 1)
+    >>> leaf_handle.leaf
+    Note("d'4")
+    >>> leaf_handle.leaf = abjad.Rest("r4")
+    >>> bar[1]
+    Rest('r4')
+    """
+
+    __slots__ = ("parent", "index")
+
+    def __init__(self, parent: abjad.Container, index: int):
+        self.parent = parent
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.parent!r}, {self.index})"
+
+    @classmethod
+    def from_index_sequence(
+        cls, index_sequence: typing.Sequence[int], container: abjad.Container
+    ) -> AbjadLeafHandle:
+        """Create leaf handle from a nested index path.
+
+        :param index_sequence: Indices which point to a leaf in ``container``.
+        :type index_sequence: typing.Sequence[int]
+        :param container: The root container.
+        :type container: abjad.Container
+        """
+        parent = core_utilities.get_nested_item_from_index_sequence(
+            index_sequence[:-1], container
+        )
+        return cls(parent, index_sequence[-1])
+
+    @property
+    def leaf(self) -> abjad.Leaf:
+        """The leaf which is currently located at the slot of the handle."""
+        return self.parent[self.index]
+
+    @leaf.setter
+    def leaf(self, leaf: abjad.Leaf):
+        self.parent[self.index] = leaf
+
+    @property
+    def key(self) -> tuple[int, int]:
+        """Hashable identifier of the slot of the handle."""
+        return id(self.parent), self.index
+
+
+class QuantizationFallback(typing.NamedTuple):
+    """Report of a conversion in which nauert exceeded its time budget.
+
+    See the ``report_fallback`` parameter of
+    :class:`NauertConsecutionToQuantizedAbjadContainer`.
+    """
+
+    time_budget: float
+    """The time budget (in seconds) which has been exceeded."""
+    segment_index_tuple: tuple[int, ...]
+    """Indices of the segments which have been quantized by the leaf maker."""
+    chronon_index_tuple: tuple[int, ...]
+    """Indices of the chronons of the converted consecution which belong to
+    these segments (rests which are merged into a previous rest aren't
+    listed)."""
+
+
+# Quantizers return a bytearray (one byte per chronon), but custom
+# quantizers may return any sequence of booleans (e.g. a tuple).
+IsChrononRestMask: typing.TypeAlias = typing.Sequence[bool]
+LeafHandleTupleTuple: typing.TypeAlias = tuple[tuple[AbjadLeafHandle, ...], ...]
 QuantizationData: typing.TypeAlias = tuple[
-    abjad.Container, tuple[tuple[tuple[int, ...], ...], ...], IsChrononRestTuple
+    abjad.Container, LeafHandleTupleTuple, IsChrononRestMask
 ]
 
 
+class _BarSegment(typing.NamedTuple):
+    # Indices of the chronons to which the durations belong (a rest
+    # which is split at a bar line appears in two segments).
+    chronon_index_tuple: tuple[int, ...]
+    duration_list: list[abjad.Duration]
+    time_signature_tuple: tuple[abjad.TimeSignature, ...]
+
+
+class _RestMergedDurations(typing.NamedTuple):
+    # Durations of the chronons after adjacent rests have been merged.
+    duration_tuple: tuple[fractions.Fraction, ...]
+    is_rest_tuple: tuple[bool, ...]
+    # Index of the first input chronon of each merged chronon.
+    chronon_index_tuple: tuple[int, ...]
+
+
+class _Skeleton(typing.NamedTuple):
+    # A quantized voice without any pitches or attachments.
+    voice: abjad.Voice
+    related_abjad_leaves_per_merged_chronon: LeafHandleTupleTuple
+    # Skeletons which depend on more than the durations and time
+    # signatures (e.g. on the load of the machine) mustn't be cached.
+    is_cacheable: bool = True
+
+
+class _PlannedLeaf(typing.NamedTuple):
+    duration: fractions.Fraction
+    is_rest: bool
+    # A note which is split at a bar line is tied to its next part.
+    is_tied: bool
+
+
+class _Meter(abjad.Meter):
+    # abjad.Meter computes its depthwise offset inventory again on each
+    # access. Because meters are cached per time signature, it's worth
+    # remembering the inventory.
+
+    __slots__ = ("_depthwise_offset_inventory",)
+
+    @property
+    def depthwise_offset_inventory(self) -> tuple[tuple[abjad.Offset, ...], ...]:
+        try:
+            return self._depthwise_offset_inventory
+        except AttributeError:
+            self._depthwise_offset_inventory = super().depthwise_offset_inventory
+            return self._depthwise_offset_inventory
+
+
+class _MeterData(typing.NamedTuple):
+    meter: _Meter
+    # Offsets of the beat level at which beams are grouped: all leaves
+    # between two adjacent offsets are beamed together.
+    beam_offset_inventory: tuple[abjad.Offset, ...]
+
+
+# A division tree is either 'None' (the beat or part of the beat isn't
+# divided) or a pair of the count of equal parts and the division tree
+# of each part.
+_DivisionTree: typing.TypeAlias = typing.Optional[tuple[int, tuple]]
+
+
+class _GridCandidate(typing.NamedTuple):
+    division_tree: _DivisionTree
+    # Relative positions of the leaf onsets within the beat, followed
+    # by 1 (the start of the next beat).
+    point_tuple: tuple[float, ...]
+    leaf_count: int
+
+
+class _GridBeatOption(typing.NamedTuple):
+    cost: float
+    candidate: _GridCandidate
+    # Index of the grid point of each onset within the beat.
+    point_index_tuple: tuple[int, ...]
+    # 'True' if the last onset was moved to the start of the next beat.
+    is_onset_pushed: bool
+
+
+class _GridLeaf(typing.NamedTuple):
+    written_duration: fractions.Fraction
+    chronon_index: int
+    is_onset: bool
+
+
+class _GridTuplet(typing.NamedTuple):
+    multiplier: tuple[int, int]
+    item_list: list
+
+
+class _TimeBudgetExceededError(Exception):
+    pass
+
+
+class _DeadlineJobHandler(nauert.JobHandler):
+    # Run the search jobs of nauert one after another (like
+    # nauert.SerialJobHandler), but give up as soon as the deadline
+    # passed. Nauert often only creates one job per bar, so the deadline
+    # is checked before each step of the search tree and not only
+    # before each job.
+
+    __slots__ = ("_deadline",)
+
+    def __init__(self, deadline: float):
+        self._deadline = deadline
+
+    def __call__(
+        self, jobs: typing.Sequence[nauert.QuantizationJob]
+    ) -> typing.Sequence[nauert.QuantizationJob]:
+        for job in jobs:
+            # nauert doesn't offer any public way to interrupt a job.
+            if hasattr(job, "_search_tree"):
+                job._search_tree = self._make_search_tree_with_deadline(job.search_tree)
+            else:
+                warnings.warn(
+                    "The installed version of nauert doesn't allow to interrupt"
+                    " its search: the time budget is ignored."
+                )
+            job()
+        return jobs
+
+    def _make_search_tree_with_deadline(
+        self, search_tree: nauert.SearchTree
+    ) -> typing.Callable[[nauert.QGrid], list[nauert.QGrid]]:
+        def search_tree_with_deadline(q_grid: nauert.QGrid) -> list[nauert.QGrid]:
+            if time.monotonic() >= self._deadline:
+                raise _TimeBudgetExceededError()
+            return search_tree(q_grid)
+
+        return search_tree_with_deadline
+
+
 # XXX: In the future `default_tempo_envelope` should be set to `None` and
 # `mutwo` should, by default, use `event_to_tempo_envelope`. Then
 # `default_tempo_envelope` should be removed completely.
@@ -54,6 +284,15 @@ class ConsecutionToQuantizedAbjadContainer(core_converters.abc.Converter):
         default Mutwo simply checks if 'pitch_list' contain any objects. If not,
         the Event will be interpreted as a rest.
     :type is_chronon_rest: typing.Callable[[core_events.Chronon], bool], optional
+    :param skeleton_cache_size: How many quantized rhythms are kept. Voices
+        with the same durations, rests and time signatures (for instance
+        doubled voices) are only quantized once: further conversions get a
+        copy of the cached voice. Share one quantizer between voice converters
+        to share the cache between them. Set to `None` for an unbounded
+        cache. The cache costs a copy of the quantized voice for each
+        conversion and is therefore only useful if many voices share their
+        rhythm. Default to 0 (no cache).
+    :type skeleton_cache_size: typing.Optional[int]
     """
 
     def __init__(
@@ -70,18 +309,14 @@ class ConsecutionToQuantizedAbjadContainer(core_converters.abc.Converter):
         is_chronon_rest: typing.Optional[
             typing.Callable[[core_events.Chronon], bool]
         ] = None,
+        skeleton_cache_size: typing.Optional[int] = 0,
     ):
         default_time_signature_sequence_count = len(default_time_signature_sequence)
         if default_time_signature_sequence_count == 0:
             raise abjad_utilities.NoTimeSignatureError()
 
         if is_chronon_rest is None:
-
-            def is_chronon_rest(chronon: core_events.Chronon) -> bool:
-                pitch_list = core_utilities.call_function_except_attribute_error(
-                    lambda e: e.pitch_list, chronon, []
-                )
-                return not bool(pitch_list)
+            is_chronon_rest = _is_chronon_rest
 
         default_time_signature_tuple = tuple(default_time_signature_sequence)
         self._default_time_signature_tuple = default_time_signature_tuple
@@ -89,6 +324,51 @@ class ConsecutionToQuantizedAbjadContainer(core_converters.abc.Converter):
         self._event_to_time_signature_tuple = event_to_time_signature_tuple
 
         self._is_chronon_rest = is_chronon_rest
+        self._skeleton_cache = abjad_utilities.LRUCache(skeleton_cache_size)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Quantized voices are big and only useful within one process
+        # (for instance there is no need to send them to worker processes).
+        state["_skeleton_cache"] = abjad_utilities.LRUCache(
+            self._skeleton_cache.maxsize
+        )
+        return state
+
+    # ###################################################################### #
+    #                          static methods                                #
+    # ###################################################################### #
+
+    @staticmethod
+    def _copy_quantized_voice(
+        quanitisized_abjad_leaf_voice: abjad.Voice,
+        related_abjad_leaves_per_chronon: LeafHandleTupleTuple,
+    ) -> tuple[abjad.Voice, LeafHandleTupleTuple]:
+        voice_copy = abjad.mutate.copy(quanitisized_abjad_leaf_voice)
+        # Copies have the same structure as the original, so we can
+        # find the copy of each parent of the leaf handles by walking
+        # through both trees at once.
+        container_copy_dict = {
+            id(container): container_copy
+            for container, container_copy in zip(
+                abjad.select.components(quanitisized_abjad_leaf_voice),
+                abjad.select.components(voice_copy),
+            )
+            if isinstance(container, abjad.Container)
+        }
+        return voice_copy, tuple(
+            tuple(
+                AbjadLeafHandle(
+                    container_copy_dict[id(leaf_handle.parent)], leaf_handle.index
+                )
+                for leaf_handle in leaf_handle_tuple
+            )
+            for leaf_handle_tuple in related_abjad_leaves_per_chronon
+        )
+
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
 
     def _get_time_signature_tuple(
         self, event: core_events.abc.Event
@@ -98,12 +378,14 @@ class ConsecutionToQuantizedAbjadContainer(core_converters.abc.Converter):
                 return time_signature_tuple
         return self._default_time_signature_tuple
 
-    def _tie_rests(self, consecution_to_convert: core_events.Consecution):
-        # Tie rests before further processing the event
+    def _merge_rests(
+        self, consecution_to_convert: core_events.Consecution
+    ) -> tuple[_RestMergedDurations, IsChrononRestMask]:
+        # Merge adjacent rests before further processing the event
         #
         # We need to do this, because otherwise pitches/volumes/indicators
         # don't get attached to the right leaves, since
-        # 'related_abjad_leaf_index_tuple_tuple_per_chronon' would point
+        # 'related_abjad_leaf_handle_tuple_tuple_per_chronon' would point
         # to rests where notes are expected. This is because the quantizer
         # auto-splits and auto-combines rests in the following cases:
         #
@@ -126,32 +408,118 @@ class ConsecutionToQuantizedAbjadContainer(core_converters.abc.Converter):
         # (as rewrite_meter or concatenate_adjacent_tuplets) that have
         # indicators applied to them. For this we would need to pin tags to
         # events according to their status.
-        return consecution_to_convert.copy().tie_by(
-            lambda event0, event1: self._is_chronon_rest(event0)
-            and self._is_chronon_rest(event1),
-            event_type_to_examine=core_events.Chronon,
+        #
+        # The merged durations are only kept in side arrays, so that
+        # the users events are neither copied nor mutated. The rest
+        # predicate is called exactly once per chronon.
+        is_chronon_rest_mask = bytearray(len(consecution_to_convert))
+        duration_list: list[fractions.Fraction] = []
+        is_rest_list: list[bool] = []
+        chronon_index_list: list[int] = []
+        is_previous_chronon_rest = False
+        for chronon_index, chronon in enumerate(consecution_to_convert):
+            is_chronon_rest = bool(self._is_chronon_rest(chronon))
+            is_chronon_rest_mask[chronon_index] = is_chronon_rest
+            duration = fractions.Fraction(
+                to_abjad_compatible_duration(chronon.duration)
+            )
+            if is_chronon_rest and is_previous_chronon_rest:
+                duration_list[-1] += duration
+            else:
+                duration_list.append(duration)
+                is_rest_list.append(is_chronon_rest)
+                chronon_index_list.append(chronon_index)
+            is_previous_chronon_rest = is_chronon_rest
+        return (
+            _RestMergedDurations(
+                tuple(duration_list), tuple(is_rest_list), tuple(chronon_index_list)
+            ),
+            is_chronon_rest_mask,
         )
 
-    def _apply_is_rest(self, consecution_to_convert: core_events.Consecution):
-        # Apply 'is_rest' attribute to each event in the 'Consecution'
-        # (this is needed for further proceedings)
-        is_chronon_rest_tuple = tuple(
-            self._is_chronon_rest(chronon) for chronon in consecution_to_convert
+    @staticmethod
+    def _expand_related_abjad_leaves_per_chronon(
+        related_abjad_leaves_per_merged_chronon: LeafHandleTupleTuple,
+        rest_merged_durations: _RestMergedDurations,
+        chronon_count: int,
+    ) -> LeafHandleTupleTuple:
+        # Map the leaves of the merged chronons back to the chronons of
+        # the converted consecution. Rests which have been merged into
+        # a previous rest don't have any leaves.
+        related_abjad_leaves_per_chronon: list[tuple[AbjadLeafHandle, ...]] = [
+            ()
+        ] * chronon_count
+        for chronon_index, related_abjad_leaves in zip(
+            rest_merged_durations.chronon_index_tuple,
+            related_abjad_leaves_per_merged_chronon,
+        ):
+            related_abjad_leaves_per_chronon[chronon_index] = related_abjad_leaves
+        return tuple(related_abjad_leaves_per_chronon)
+
+    def _make_skeleton(
+        self,
+        rest_merged_durations: _RestMergedDurations,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> _Skeleton:
+        # Quantize the merged chronons: return the quantized voice and
+        # the related leaves of each merged chronon. Only quantizers
+        # which use '_quantize_consecution' in their 'convert' method
+        # need to override this hook.
+        raise NotImplementedError
+
+    def _get_skeleton(
+        self,
+        rest_merged_durations: _RestMergedDurations,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> tuple[abjad.Voice, LeafHandleTupleTuple]:
+        if self._skeleton_cache.maxsize == 0:
+            return self._make_skeleton(rest_merged_durations, time_signature_tuple)[:2]
+        skeleton_key = (
+            rest_merged_durations.duration_tuple,
+            rest_merged_durations.is_rest_tuple,
+            time_signature_tuple,
+        )
+        if (skeleton := self._skeleton_cache.get(skeleton_key)) is None:
+            skeleton = self._make_skeleton(rest_merged_durations, time_signature_tuple)
+            if not skeleton.is_cacheable:
+                return skeleton[:2]
+            self._skeleton_cache[skeleton_key] = skeleton
+        # The returned voice is filled with pitches and attachments, so
+        # the cached skeleton itself is never handed out.
+        return self._copy_quantized_voice(*skeleton[:2])
+
+    def _quantize_consecution(
+        self, consecution_to_convert: core_events.Consecution
+    ) -> QuantizationData:
+        rest_merged_durations, is_chronon_rest_mask = self._merge_rests(
+            consecution_to_convert
+        )
+        voice, related_abjad_leaves_per_merged_chronon = self._get_skeleton(
+            rest_merged_durations,
+            self._get_time_signature_tuple(consecution_to_convert),
         )
-        is_chronon_rest_iterator = iter(is_chronon_rest_tuple)
         return (
-            consecution_to_convert.copy().set_parameter(  # type: ignore
-                "is_rest",
-                lambda _: next(is_chronon_rest_iterator),
-                set_unassigned_parameter=True,
+            voice,
+            self._expand_related_abjad_leaves_per_chronon(
+                related_abjad_leaves_per_merged_chronon,
+                rest_merged_durations,
+                len(is_chronon_rest_mask),
             ),
-            is_chronon_rest_tuple,
+            is_chronon_rest_mask,
         )
 
     # ###################################################################### #
     #               public methods for interaction with the user             #
     # ###################################################################### #
 
+    def skeleton_cache_info(self) -> abjad_utilities.LRUCache.CacheInfo:
+        """Get hit and miss statistics of the skeleton cache.
+
+        Each conversion which doesn't need to quantize its rhythm again
+        counts as a hit. See ``skeleton_cache_size`` for more information.
+        """
+        return self._skeleton_cache.cache_info()
+
     @abc.abstractmethod
     def convert(
         self, consecution_to_convert: core_events.Consecution
@@ -178,6 +546,65 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
         optimizer is :class:`nauert.MeasurewiseAttackPointOptimizer` which splits events
         to better represent metrical structures within bars. If no optimizer is desired
         this argument can be set to ``None``.
+    :param search_tree: Optionally the user can pass a :class:`nauert.SearchTree`
+        object which defines the allowed subdivisions of beats. If ``None``
+        nauert's default search tree is used. Default to ``None``.
+    :type search_tree: typing.Optional[nauert.SearchTree]
+    :param segment_at_bar_lines: If set to ``True`` the converted
+        :class:`~mutwo.core_events.Consecution` is split into segments at
+        all bar lines which aren't crossed by a note (a rest which crosses
+        a bar line is split into two rests). Each segment is quantized
+        independently and the resulting bars are joined again. Because nauert
+        quantizes bar by bar anyway, this doesn't change the notation, but
+        it allows to quantize the segments in parallel. Only available for
+        duration unit 'beats'. Default to ``False``.
+    :type segment_at_bar_lines: bool
+    :param executor_class: The executor which quantizes the segments if
+        ``segment_at_bar_lines`` is ``True`` (for instance
+        :class:`concurrent.futures.ProcessPoolExecutor`). A new executor is
+        started for each conversion and the converter is sent to each of its
+        workers, which can take longer than quantizing a few short bars. So
+        this only pays off for long consecutions with many different bars.
+        If set to ``None`` the segments are quantized one after another in
+        the current process. Default to ``None``.
+    :type executor_class: typing.Optional[typing.Type[concurrent.futures.Executor]]
+    :param max_workers: Maximum number of workers of the executor. If ``None``
+        the default of the executor class is used. Default to ``None``.
+    :type max_workers: typing.Optional[int]
+    :param pattern_cache_size: If ``segment_at_bar_lines`` is ``True``,
+        the converter remembers how it quantized each segment pattern
+        (relative offsets, rests and time signatures) and copies the result
+        if the same pattern appears again instead of searching for a
+        quantization again. This sets how many patterns are kept. If ``None``
+        the cache grows without any limit, if ``0`` only repetitions within
+        one conversion are reused. Default to 128.
+    :type pattern_cache_size: typing.Optional[int]
+    :param time_budget: Maximum time in seconds which nauert may search for
+        the quantization of one segment (a bar segment if
+        ``segment_at_bar_lines`` is ``True``, otherwise the complete
+        :class:`~mutwo.core_events.Consecution`). If nauert needs longer,
+        the segment is quantized by
+        :class:`LeafMakerConsecutionToQuantizedAbjadContainer` instead,
+        and a warning which lists the indices of these segments is shown
+        (unless ``report_fallback`` is set). The budget is checked before
+        each step of nauert's search, so a segment can take slightly longer.
+        Because nauert doesn't offer any public way to interrupt its search,
+        this relies on internals of ``abjad-ext-nauert`` (tested with
+        version 3.11; ``setup.py`` restricts nauert to versions below 3.12).
+        If the installed version doesn't allow to interrupt the search, a
+        warning is shown and the time budget is ignored. Because fallbacks depend on
+        the load of the machine, segments which fell back aren't cached.
+        Only available for duration unit 'beats'. If ``None`` nauert has
+        unlimited time. Default to ``None``.
+    :type time_budget: typing.Optional[float]
+    :param report_fallback: Function which is called with a
+        :class:`QuantizationFallback` each time segments of a converted
+        :class:`~mutwo.core_events.Consecution` have been quantized by the
+        leaf maker, because nauert exceeded the ``time_budget`` (for instance
+        to collect the fallbacks of a nightly build). It is called in the
+        process which converts the consecution. If ``None`` a warning is
+        shown instead. Default to ``None``.
+    :type report_fallback: typing.Optional[typing.Callable[[QuantizationFallback], None]]
 
     Unlike :class:`LeafMakerConsecutionToQuantizedAbjadContainer` this converter
     supports nested tuplets and ties across tuplets. But this converter is much slower
@@ -192,6 +619,17 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
     # when building the QEventSequence. Furthermore you should auto write down the
     # metronome marks when initialising from miliseconds?)
 
+    # nauert measures durations in milliseconds: with this tempo one beat
+    # (a quarter note) lasts one second.
+    _nauert_tempo = abjad.MetronomeMark((1, 4), 60)
+
+    # The nauert quantizer is stateless and q-schemas only depend on the
+    # time signatures and the search tree, so both can be shared by all
+    # converters.
+    _nauert_quantizer = nauert.Quantizer()
+    _q_schema_cache = abjad_utilities.LRUCache(maxsize=128)
+    _q_schema_cache_lock = threading.Lock()
+
     def __init__(
         self,
         default_time_signature_sequence: typing.Sequence[abjad.TimeSignature] = (
@@ -202,8 +640,28 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
             nauert.AttackPointOptimizer
         ] = nauert.MeasurewiseAttackPointOptimizer(),
         search_tree: typing.Optional[nauert.SearchTree] = None,
+        segment_at_bar_lines: bool = False,
+        executor_class: typing.Optional[
+            typing.Type[concurrent.futures.Executor]
+        ] = None,
+        max_workers: typing.Optional[int] = None,
+        pattern_cache_size: typing.Optional[int] = 128,
+        time_budget: typing.Optional[float] = None,
+        report_fallback: typing.Optional[
+            typing.Callable[[QuantizationFallback], None]
+        ] = None,
         **kwargs,
     ):
+        if segment_at_bar_lines and duration_unit != "beats":
+            raise NotImplementedError(
+                "Segmenting at bar lines is only supported for duration unit 'beats'."
+            )
+
+        if time_budget is not None and duration_unit != "beats":
+            raise NotImplementedError(
+                "A time budget is only supported for duration unit 'beats'."
+            )
+
         if duration_unit == "miliseconds":
             # warning for not well implemented miliseconds conversion
 
@@ -224,6 +682,25 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
         self._duration_unit = duration_unit
         self._attack_point_optimizer = attack_point_optimizer
         self._search_tree = search_tree
+        self._segment_at_bar_lines = segment_at_bar_lines
+        self._executor_class = executor_class
+        self._max_workers = max_workers
+        self._pattern_cache = abjad_utilities.LRUCache(pattern_cache_size)
+        self._time_budget = time_budget
+        self._report_fallback = report_fallback
+        if time_budget is None:
+            self._fallback_quantizer = None
+        else:
+            self._fallback_quantizer = LeafMakerConsecutionToQuantizedAbjadContainer(
+                skeleton_cache_size=0
+            )
+
+    def __getstate__(self) -> dict:
+        state = super().__getstate__()
+        # Quantized patterns are big and only useful within one process
+        # (for instance there is no need to send them to worker processes).
+        state["_pattern_cache"] = abjad_utilities.LRUCache(self._pattern_cache.maxsize)
+        return state
 
     # ###################################################################### #
     #                          static methods                                #
@@ -233,22 +710,19 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
     def _get_respective_q_event_from_abjad_leaf(
         abjad_leaf: typing.Union[abjad.Rest, abjad.Note]
     ) -> typing.Optional[nauert.QEvent]:
-        # TODO(improve ugly, heuristic, unreliable code)
-        try:
-            return abjad.get.indicators(abjad_leaf)[0]["q_events"][0]
-        except TypeError:
-            return None
-        except KeyError:
-            return None
-        except IndexError:
-            return None
+        # nauert annotates each leaf which starts a q_event with a
+        # dict indicator '{"q_events": (q_event, ...)}'.
+        for annotation in abjad.get.indicators(abjad_leaf, dict):
+            if q_event_tuple := annotation.get("q_events"):
+                return q_event_tuple[0]
+        return None
 
     @staticmethod
     def _process_abjad_leaf(
-        indices: list[int],
+        leaf_handle: AbjadLeafHandle,
         abjad_leaf: abjad.Leaf,
-        related_abjad_leaves_per_chronon: list[list[tuple[int, ...]]],
-        q_event_sequence: nauert.QEventSequence,
+        related_abjad_leaves_per_chronon: list[list[AbjadLeafHandle]],
+        q_event_key_to_index_dict: dict[tuple[type, abjad.Offset], int],
         has_tie: bool,
         index_of_previous_q_event: int,
     ) -> tuple[bool, int]:
@@ -256,17 +730,17 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
             abjad_leaf
         )
 
-        if q_event and type(q_event) != nauert.TerminalQEvent:
-            nth_q_event = q_event_sequence.sequence.index(q_event)
-            related_abjad_leaves_per_chronon[nth_q_event].append(tuple(indices))
+        if q_event is not None and type(q_event) != nauert.TerminalQEvent:
+            nth_q_event = q_event_key_to_index_dict[(type(q_event), q_event.offset)]
+            related_abjad_leaves_per_chronon[nth_q_event].append(leaf_handle)
             index_of_previous_q_event = nth_q_event
         elif has_tie:
             related_abjad_leaves_per_chronon[index_of_previous_q_event].append(
-                tuple(indices)
+                leaf_handle
             )
         # skip leaves without any links
         # else:
-        #     related_abjad_leaves_per_chronon.append([tuple(indices)])
+        #     related_abjad_leaves_per_chronon.append([leaf_handle])
 
         has_tie = abjad.get.has_indicator(abjad_leaf, abjad.Tie)
 
@@ -274,10 +748,9 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
 
     @staticmethod
     def _process_tuplet(
-        indices: list[int],
         tuplet: abjad.Tuplet,
-        related_abjad_leaves_per_chronon: list[list[tuple[int, ...]]],
-        q_event_sequence: nauert.QEventSequence,
+        related_abjad_leaves_per_chronon: list[list[AbjadLeafHandle]],
+        q_event_key_to_index_dict: dict[tuple[type, abjad.Offset], int],
         has_tie: bool,
         index_of_previous_q_event: int,
     ) -> tuple[bool, int]:
@@ -289,10 +762,10 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
                 has_tie,
                 index_of_previous_q_event,
             ) = NauertConsecutionToQuantizedAbjadContainer._process_abjad_leaf_or_tuplet(
-                indices + [nth_abjad_leaf_or_tuplet],
+                AbjadLeafHandle(tuplet, nth_abjad_leaf_or_tuplet),
                 abjad_leaf_or_tuplet,
                 related_abjad_leaves_per_chronon,
-                q_event_sequence,
+                q_event_key_to_index_dict,
                 has_tie,
                 index_of_previous_q_event,
             )
@@ -301,61 +774,70 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
 
     @staticmethod
     def _process_abjad_leaf_or_tuplet(
-        index_list: list[int],
+        leaf_handle: AbjadLeafHandle,
         abjad_leaf_or_tuplet: typing.Union[abjad.Tuplet, abjad.Leaf],
-        related_abjad_leaves_per_chronon: list[list[tuple[int, ...]]],
-        q_event_sequence: nauert.QEventSequence,
+        related_abjad_leaves_per_chronon: list[list[AbjadLeafHandle]],
+        q_event_key_to_index_dict: dict[tuple[type, abjad.Offset], int],
         has_tie: bool,
         index_of_previous_q_event: int,
     ) -> tuple[bool, int]:
         if isinstance(abjad_leaf_or_tuplet, abjad.Tuplet):
             return NauertConsecutionToQuantizedAbjadContainer._process_tuplet(
-                index_list,
                 abjad_leaf_or_tuplet,
                 related_abjad_leaves_per_chronon,
-                q_event_sequence,
+                q_event_key_to_index_dict,
                 has_tie,
                 index_of_previous_q_event,
             )
 
         else:
             return NauertConsecutionToQuantizedAbjadContainer._process_abjad_leaf(
-                index_list,
+                leaf_handle,
                 abjad_leaf_or_tuplet,
                 related_abjad_leaves_per_chronon,
-                q_event_sequence,
+                q_event_key_to_index_dict,
                 has_tie,
                 index_of_previous_q_event,
             )
 
     @staticmethod
     def _make_related_abjad_leaves_per_chronon(
-        consecution: core_events.Consecution,
+        chronon_count: int,
         q_event_sequence: nauert.QEventSequence,
         quanitisized_abjad_leaf_voice: abjad.Voice,
-    ) -> tuple[tuple[tuple[int, ...], ...], ...,]:
+    ) -> LeafHandleTupleTuple:
+        # nauert deep copies q_events while searching, so the q_events
+        # attached to the leaves aren't identical to the q_events of the
+        # sequence. But within one sequence type and offset are enough to
+        # find the position of a q_event (first match wins, like with
+        # 'list.index').
+        q_event_key_to_index_dict: dict[tuple[type, abjad.Offset], int] = {}
+        for nth_q_event, q_event in enumerate(q_event_sequence.sequence):
+            q_event_key_to_index_dict.setdefault(
+                (type(q_event), q_event.offset), nth_q_event
+            )
         has_tie = False
         index_of_previous_q_event: int = 0
-        related_abjad_leaves_per_chronon: list[list[tuple[int, ...]]] = [
-            [] for _ in consecution
+        related_abjad_leaves_per_chronon: list[list[AbjadLeafHandle]] = [
+            [] for _ in range(chronon_count)
         ]
-        for nth_bar, bar in enumerate(quanitisized_abjad_leaf_voice):
+        for bar in quanitisized_abjad_leaf_voice:
             for nth_abjad_leaf_or_tuplet, abjad_leaf_or_tuplet in enumerate(bar):
                 (
                     has_tie,
                     index_of_previous_q_event,
                 ) = NauertConsecutionToQuantizedAbjadContainer._process_abjad_leaf_or_tuplet(
-                    [nth_bar, nth_abjad_leaf_or_tuplet],
+                    AbjadLeafHandle(bar, nth_abjad_leaf_or_tuplet),
                     abjad_leaf_or_tuplet,
                     related_abjad_leaves_per_chronon,
-                    q_event_sequence,
+                    q_event_key_to_index_dict,
                     has_tie,
                     index_of_previous_q_event,
                 )
 
         return tuple(
-            tuple(tuple(item) for item in pair)
-            for pair in related_abjad_leaves_per_chronon
+            tuple(leaf_handle_list)
+            for leaf_handle_list in related_abjad_leaves_per_chronon
         )
 
     @staticmethod
@@ -369,7 +851,7 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
 
         keyword_arguments = {
             "use_full_measure": True,
-            "tempo": abjad.MetronomeMark((1, 4), 60),
+            "tempo": NauertConsecutionToQuantizedAbjadContainer._nauert_tempo,
         }
 
         if search_tree:
@@ -383,27 +865,37 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
     #                         private methods                                #
     # ###################################################################### #
 
-    def _get_q_schema(self, event: core_events.abc.Event) -> nauert.MeasurewiseQSchema:
-        return NauertConsecutionToQuantizedAbjadContainer._make_q_schema(
-            self._get_time_signature_tuple(event), self._search_tree
-        )
-
-    def _consecution_to_q_event_sequence(
-        self, consecution: core_events.Consecution
-    ) -> nauert.QEventSequence:
-        duration_list = list(
-            map(to_abjad_compatible_duration, consecution.get_parameter("duration"))
-        )
-
-        for nth_chronon, chronon in enumerate(consecution):
-            if chronon.is_rest:
-                duration_list[nth_chronon] = (
-                    0 - duration_list[nth_chronon]
+    def _get_q_schema(
+        self, time_signature_tuple: tuple[abjad.TimeSignature, ...]
+    ) -> nauert.MeasurewiseQSchema:
+        key = (tuple(time_signature_tuple), self._search_tree)
+        with self._q_schema_cache_lock:
+            q_schema = self._q_schema_cache.get(key)
+            if q_schema is None:
+                q_schema = NauertConsecutionToQuantizedAbjadContainer._make_q_schema(
+                    *key
                 )
+                self._q_schema_cache[key] = q_schema
+        return q_schema
+
+    def _rest_merged_durations_to_duration_list(
+        self, rest_merged_durations: _RestMergedDurations
+    ) -> list[abjad.Duration]:
+        # nauert interprets negative durations as rests
+        return [
+            abjad.Duration(duration) * (-1 if is_rest else 1)
+            for duration, is_rest in zip(
+                rest_merged_durations.duration_tuple,
+                rest_merged_durations.is_rest_tuple,
+            )
+        ]
 
+    def _duration_list_to_q_event_sequence(
+        self, duration_list: list[abjad.Duration]
+    ) -> nauert.QEventSequence:
         if self._duration_unit == "beats":
             return nauert.QEventSequence.from_tempo_scaled_durations(
-                duration_list, tempo=abjad.MetronomeMark((1, 4), 60)
+                duration_list, tempo=self._nauert_tempo
             )
 
         elif self._duration_unit == "miliseconds":
@@ -420,41 +912,402 @@ class NauertConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadCont
         self,
         q_event_sequence: nauert.QEventSequence,
         q_schema: nauert.MeasurewiseQSchema,
+        job_handler: typing.Optional[nauert.JobHandler] = None,
     ) -> abjad.Voice:
-        quantizer = nauert.Quantizer()
-        return quantizer(
+        return self._nauert_quantizer(
             q_event_sequence,
             q_schema=q_schema,
+            job_handler=job_handler,
             attach_tempos=True if self._duration_unit == "miliseconds" else False,
             attack_point_optimizer=self._attack_point_optimizer,
         )
 
-    # ###################################################################### #
-    #               public methods for interaction with the user             #
-    # ###################################################################### #
-
-    def convert(
-        self, consecution_to_convert: core_events.Consecution
-    ) -> QuantizationData:
-        consecution_to_convert, is_chronon_rest_tuple = self._apply_is_rest(
-            self._tie_rests(consecution_to_convert)
-        )
-        q_event_sequence = self._consecution_to_q_event_sequence(consecution_to_convert)
-        q_schema = self._get_q_schema(consecution_to_convert)
+    def _quantize(
+        self,
+        duration_list: list[abjad.Duration],
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+        job_handler: typing.Optional[nauert.JobHandler] = None,
+    ) -> tuple[abjad.Voice, LeafHandleTupleTuple]:
+        q_event_sequence = self._duration_list_to_q_event_sequence(duration_list)
+        q_schema = self._get_q_schema(time_signature_tuple)
         quanitisized_abjad_leaf_voice = (
             self._q_event_sequence_to_quanitisized_abjad_leaf_voice(
-                q_event_sequence, q_schema
+                q_event_sequence, q_schema, job_handler
             )
         )
-
         related_abjad_leaves_per_chronon = NauertConsecutionToQuantizedAbjadContainer._make_related_abjad_leaves_per_chronon(
-            consecution_to_convert, q_event_sequence, quanitisized_abjad_leaf_voice
+            len(duration_list), q_event_sequence, quanitisized_abjad_leaf_voice
+        )
+        return quanitisized_abjad_leaf_voice, related_abjad_leaves_per_chronon
+
+    def _quantize_within_time_budget(
+        self,
+        duration_list: list[abjad.Duration],
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> tuple[abjad.Voice, LeafHandleTupleTuple, bool]:
+        # Return the quantized segment and if it fell back to the leaf maker.
+        if self._time_budget is None:
+            return (*self._quantize(duration_list, time_signature_tuple), False)
+        try:
+            return (
+                *self._quantize(
+                    duration_list,
+                    time_signature_tuple,
+                    _DeadlineJobHandler(time.monotonic() + self._time_budget),
+                ),
+                False,
+            )
+        except _TimeBudgetExceededError:
+            pass
+        # nauert interprets negative durations as rests
+        rest_merged_durations = _RestMergedDurations(
+            tuple(abs(duration) for duration in duration_list),
+            tuple(duration < 0 for duration in duration_list),
+            tuple(range(len(duration_list))),
         )
+        return (
+            *self._fallback_quantizer._make_skeleton(
+                rest_merged_durations, time_signature_tuple
+            )[:2],
+            True,
+        )
+
+    @staticmethod
+    def _split_duration_list_at_bar_lines(
+        duration_list: list[abjad.Duration],
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> tuple[_BarSegment, ...]:
+        # Find all bar lines at which the duration list can be split
+        # without cutting a note: bar lines on which a chronon starts and
+        # bar lines which are crossed by a rest (the rest is split into
+        # two rests). Bar lines which are crossed by a note are skipped,
+        # so that nauert can still tie the note across the bar line.
+        total_duration = sum(abs(duration) for duration in duration_list)
+        bar_line_list = [abjad.Duration(0)]
+        while bar_line_list[-1] < total_duration:
+            nth_bar = min(len(bar_line_list) - 1, len(time_signature_tuple) - 1)
+            bar_line_list.append(
+                bar_line_list[-1] + time_signature_tuple[nth_bar].duration
+            )
+
+        def time_signature(nth_bar: int) -> abjad.TimeSignature:
+            return time_signature_tuple[min(nth_bar, len(time_signature_tuple) - 1)]
+
+        segment_list: list[_BarSegment] = []
+        chronon_index_list: list[int] = []
+        segment_duration_list: list[abjad.Duration] = []
+        nth_first_bar, nth_bar_line = 0, 0
+
+        def close_segment():
+            nonlocal chronon_index_list, segment_duration_list, nth_first_bar
+            if chronon_index_list:
+                segment_list.append(
+                    _BarSegment(
+                        tuple(chronon_index_list),
+                        segment_duration_list,
+                        tuple(map(time_signature, range(nth_first_bar, nth_bar_line))),
+                    )
+                )
+                chronon_index_list, segment_duration_list = [], []
+                nth_first_bar = nth_bar_line
+
+        start = abjad.Duration(0)
+        for nth_chronon, duration in enumerate(duration_list):
+            end = start + abs(duration)
+            while bar_line_list[nth_bar_line] < start:
+                nth_bar_line += 1
+            if bar_line_list[nth_bar_line] == start:
+                close_segment()
+            if duration < 0:
+                while (bar_line := bar_line_list[nth_bar_line]) < end:
+                    if bar_line > start:
+                        chronon_index_list.append(nth_chronon)
+                        segment_duration_list.append(start - bar_line)
+                        close_segment()
+                        start = bar_line
+                    nth_bar_line += 1
+            chronon_index_list.append(nth_chronon)
+            segment_duration_list.append(start - end if duration < 0 else duration)
+            start = end
+
+        nth_bar_line = len(bar_line_list) - 1
+        close_segment()
+        return NauertConsecutionToQuantizedAbjadContainer._merge_rest_only_segments(
+            segment_list
+        )
+
+    @staticmethod
+    def _merge_rest_only_segments(
+        segment_list: list[_BarSegment],
+    ) -> tuple[_BarSegment, ...]:
+        # nauert can only quantize segments without any note if they
+        # fill complete bars. Apart from the last segment all segments end
+        # at a bar line, so only a last segment which only contains the
+        # end of a rest needs to be merged into the previous segment.
+        if len(segment_list) > 1:
+            last_segment = segment_list[-1]
+            if all(duration < 0 for duration in last_segment.duration_list) and (
+                -sum(last_segment.duration_list)
+                < sum(
+                    time_signature.duration
+                    for time_signature in last_segment.time_signature_tuple
+                )
+            ):
+                previous_segment = segment_list[-2]
+                chronon_index_list = list(previous_segment.chronon_index_tuple)
+                duration_list = list(previous_segment.duration_list)
+                for chronon_index, duration in zip(
+                    last_segment.chronon_index_tuple, last_segment.duration_list
+                ):
+                    # Join both parts of a rest which has been split at a bar line.
+                    if chronon_index_list[-1] == chronon_index:
+                        duration_list[-1] += duration
+                    else:
+                        chronon_index_list.append(chronon_index)
+                        duration_list.append(duration)
+                segment_list[-2:] = [
+                    _BarSegment(
+                        tuple(chronon_index_list),
+                        duration_list,
+                        previous_segment.time_signature_tuple
+                        + last_segment.time_signature_tuple,
+                    )
+                ]
+        return tuple(segment_list)
+
+    def _quantize_segmentwise(
+        self,
+        duration_list: list[abjad.Duration],
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> tuple[abjad.Voice, LeafHandleTupleTuple, tuple[int, ...], tuple[int, ...]]:
+        # Return the quantized voice, the indices of all segments which
+        # fell back to the leaf maker and the indices of their chronons.
+        segment_tuple = NauertConsecutionToQuantizedAbjadContainer._split_duration_list_at_bar_lines(
+            duration_list, time_signature_tuple
+        )
+        if not segment_tuple:
+            return self._quantize_whole(duration_list, time_signature_tuple)
+        # Material often repeats the same rhythmic cells: each distinct
+        # pattern (durations, rests and time signatures) is only quantized
+        # once and then copied.
+        pattern_key_list = [
+            (
+                tuple(segment.duration_list),
+                # nauert will raise an error if there is only one time signature
+                (
+                    segment.time_signature_tuple * 2
+                    if len(segment.time_signature_tuple) == 1
+                    else segment.time_signature_tuple
+                ),
+            )
+            for segment in segment_tuple
+        ]
+        pattern_key_to_quantized_segment_dict: dict[
+            tuple, tuple[abjad.Voice, LeafHandleTupleTuple, bool]
+        ] = {}
+        missing_pattern_key_list = []
+        # Quantized segments which are shared with the cache. They are
+        # tracked here instead of asking the cache later on, because other
+        # threads may insert or evict items in the meantime.
+        cached_pattern_key_set = set()
+        for pattern_key in pattern_key_list:
+            if pattern_key in pattern_key_to_quantized_segment_dict:
+                self._pattern_cache.record_hit()
+            elif (quantized_segment := self._pattern_cache.get(pattern_key)) is None:
+                pattern_key_to_quantized_segment_dict[pattern_key] = None
+                missing_pattern_key_list.append(pattern_key)
+            else:
+                pattern_key_to_quantized_segment_dict[pattern_key] = (
+                    *quantized_segment,
+                    False,
+                )
+                cached_pattern_key_set.add(pattern_key)
+
+        quantize_argument_tuple = tuple(zip(*missing_pattern_key_list))
+        if not missing_pattern_key_list:
+            quantized_segment_iterator = iter(())
+        elif self._executor_class is None or len(missing_pattern_key_list) < 2:
+            quantized_segment_iterator = map(
+                self._quantize_within_time_budget, *quantize_argument_tuple
+            )
+        else:
+            executor = self._executor_class(self._max_workers)
+            # Bars are usually quickly quantized, so we send them in
+            # chunks to the workers to reduce the communication overhead.
+            chunk_size = max(
+                len(missing_pattern_key_list)
+                // ((self._max_workers or os.cpu_count()) * 4),
+                1,
+            )
+            with executor:
+                quantized_segment_iterator = iter(
+                    tuple(
+                        executor.map(
+                            self._quantize_within_time_budget,
+                            *quantize_argument_tuple,
+                            chunksize=chunk_size,
+                        )
+                    )
+                )
+        for pattern_key, quantized_segment in zip(
+            missing_pattern_key_list, quantized_segment_iterator
+        ):
+            pattern_key_to_quantized_segment_dict[pattern_key] = quantized_segment
+            # Fallbacks depend on the load of the machine, so nauert
+            # should try again next time.
+            if not quantized_segment[2] and self._pattern_cache.maxsize != 0:
+                self._pattern_cache[pattern_key] = quantized_segment[:2]
+                cached_pattern_key_set.add(pattern_key)
+
+        # Quantized segments which are kept in the cache (or which are used
+        # again later) need to be copied, the others can be used directly.
+        pattern_key_to_last_usage_dict = {
+            pattern_key: nth_segment
+            for nth_segment, pattern_key in enumerate(pattern_key_list)
+        }
+        quantized_segment_list = []
+        fallback_segment_index_list = []
+        # A dict keeps the order and ignores chronons which appear in two
+        # segments (rests which are split at a bar line).
+        fallback_chronon_index_dict: dict[int, None] = {}
+        for nth_segment, pattern_key in enumerate(pattern_key_list):
+            (
+                segment_voice,
+                segment_leaf_handle_tuple_tuple,
+                is_fallback,
+            ) = pattern_key_to_quantized_segment_dict[pattern_key]
+            if (
+                pattern_key in cached_pattern_key_set
+                or pattern_key_to_last_usage_dict[pattern_key] != nth_segment
+            ):
+                (
+                    segment_voice,
+                    segment_leaf_handle_tuple_tuple,
+                ) = self._copy_quantized_voice(
+                    segment_voice, segment_leaf_handle_tuple_tuple
+                )
+            quantized_segment_list.append(
+                (segment_voice, segment_leaf_handle_tuple_tuple)
+            )
+            if is_fallback:
+                fallback_segment_index_list.append(nth_segment)
+                fallback_chronon_index_dict.update(
+                    dict.fromkeys(segment_tuple[nth_segment].chronon_index_tuple)
+                )
+
+        # Join all bars in one voice. The bars are moved and not copied,
+        # therefore the leaf handles stay valid and only the chronon indices
+        # need to be remapped.
+        quanitisized_abjad_leaf_voice = abjad.Voice()
+        related_abjad_leaves_per_chronon: list[list[AbjadLeafHandle]] = [
+            [] for _ in duration_list
+        ]
+        previous_time_signature = None
+        for segment, (segment_voice, segment_leaf_handle_tuple_tuple) in zip(
+            segment_tuple, quantized_segment_list
+        ):
+            first_leaf = abjad.select.leaf(segment_voice, 0)
+            if abjad.get.indicator(first_leaf, abjad.TimeSignature) == (
+                previous_time_signature
+            ):
+                abjad.detach(abjad.TimeSignature, first_leaf)
+            previous_time_signature = segment.time_signature_tuple[-1]
+            quanitisized_abjad_leaf_voice.extend(segment_voice[:])
+            for nth_chronon, leaf_handle_tuple in zip(
+                segment.chronon_index_tuple, segment_leaf_handle_tuple_tuple
+            ):
+                related_abjad_leaves_per_chronon[nth_chronon].extend(leaf_handle_tuple)
+
         return (
+            quanitisized_abjad_leaf_voice,
+            tuple(
+                tuple(leaf_handle_list)
+                for leaf_handle_list in related_abjad_leaves_per_chronon
+            ),
+            tuple(fallback_segment_index_list),
+            tuple(fallback_chronon_index_dict),
+        )
+
+    def _quantize_whole(
+        self,
+        duration_list: list[abjad.Duration],
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> tuple[abjad.Voice, LeafHandleTupleTuple, tuple[int, ...], tuple[int, ...]]:
+        (
             quanitisized_abjad_leaf_voice,
             related_abjad_leaves_per_chronon,
-            is_chronon_rest_tuple,
+            is_fallback,
+        ) = self._quantize_within_time_budget(duration_list, time_signature_tuple)
+        if is_fallback:
+            return (
+                quanitisized_abjad_leaf_voice,
+                related_abjad_leaves_per_chronon,
+                (0,),
+                tuple(range(len(duration_list))),
+            )
+        return quanitisized_abjad_leaf_voice, related_abjad_leaves_per_chronon, (), ()
+
+    def _make_skeleton(
+        self,
+        rest_merged_durations: _RestMergedDurations,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> _Skeleton:
+        duration_list = self._rest_merged_durations_to_duration_list(
+            rest_merged_durations
         )
+        if self._segment_at_bar_lines:
+            quantize = self._quantize_segmentwise
+        else:
+            quantize = self._quantize_whole
+        (
+            quanitisized_abjad_leaf_voice,
+            related_abjad_leaves_per_chronon,
+            fallback_segment_index_tuple,
+            fallback_chronon_index_tuple,
+        ) = quantize(duration_list, time_signature_tuple)
+        if fallback_segment_index_tuple and self._report_fallback is not None:
+            self._report_fallback(
+                QuantizationFallback(
+                    self._time_budget,
+                    fallback_segment_index_tuple,
+                    tuple(
+                        rest_merged_durations.chronon_index_tuple[nth_chronon]
+                        for nth_chronon in fallback_chronon_index_tuple
+                    ),
+                )
+            )
+        elif fallback_segment_index_tuple:
+            warnings.warn(
+                "nauert exceeded the time budget of {} seconds for the segment(s)"
+                " {}: these segments have been quantized by"
+                " 'LeafMakerConsecutionToQuantizedAbjadContainer'.".format(
+                    self._time_budget, ", ".join(map(str, fallback_segment_index_tuple))
+                )
+            )
+        # Fallbacks depend on the load of the machine, so nauert should
+        # try again next time.
+        return _Skeleton(
+            quanitisized_abjad_leaf_voice,
+            related_abjad_leaves_per_chronon,
+            not fallback_segment_index_tuple,
+        )
+
+    # ###################################################################### #
+    #               public methods for interaction with the user             #
+    # ###################################################################### #
+
+    def pattern_cache_info(self) -> abjad_utilities.LRUCache.CacheInfo:
+        """Get hit and miss statistics of the segment pattern cache.
+
+        Each segment which doesn't need to be searched by nauert again counts
+        as a hit. See ``pattern_cache_size`` for more information.
+        """
+        return self._pattern_cache.cache_info()
+
+    def convert(
+        self, consecution_to_convert: core_events.Consecution
+    ) -> QuantizationData:
+        return self._quantize_consecution(consecution_to_convert)
 
 
 class LeafMakerConsecutionToQuantizedAbjadContainer(
@@ -490,10 +1343,19 @@ class LeafMakerConsecutionToQuantizedAbjadContainer(
            and not-tuplet notation). If ties are desired the user has to build them
            manually before passing the :class:`~mutwo.core_events.Consecution`
            to the converter.
+        3. If an event is split at a bar line into parts which need
+           tuplets, the meters of the bars with these parts aren't
+           rewritten, because :meth:`abjad.Meter.rewrite_meter` may not
+           terminate for them.
     """
 
     _maximum_dot_count = 1
 
+    # Meters and beam groupings only depend on the time signature, so all
+    # converters can share them.
+    _meter_data_cache = abjad_utilities.LRUCache(maxsize=64)
+    _meter_data_cache_lock = threading.Lock()
+
     def __init__(
         self,
         *args,
@@ -530,88 +1392,154 @@ class LeafMakerConsecutionToQuantizedAbjadContainer(
         return offset_inventory
 
     @staticmethod
-    def _add_explicit_beams(
-        bar: abjad.Container, meter: abjad.Meter, global_offset: abjad.Offset
-    ) -> None:
-        offset_inventory = (
-            LeafMakerConsecutionToQuantizedAbjadContainer._find_offset_inventory(meter)
-        )
-        leaf_offset_list = []
-        # don't attach beams on tuplets
-        relevant_bar_items = filter(
-            lambda leaf_or_tuplet: isinstance(leaf_or_tuplet, abjad.Leaf)
-            and leaf_or_tuplet.written_duration < fractions.Fraction(1, 4),
-            bar,
-        )
-        leaf_selection = abjad.select.leaves(relevant_bar_items)
-        for leaf in leaf_selection:
-            offset = abjad.get.timespan(leaf).start_offset - global_offset
-            leaf_offset_list.append(offset)
-
-        beam_range_list = []
-        for start, end in zip(offset_inventory, offset_inventory[1:]):
-            area = ranges.Range(start, end)
-            offset_tuple = tuple(
-                filter(lambda offset: offset in area, leaf_offset_list)
-            )
-            n_elements = len(offset_tuple)
-            is_start_in_leaves = start in offset_tuple
-
-            # make new beam range
-            if is_start_in_leaves and n_elements > 1:
-                new_beam_range = [
-                    leaf_offset_list.index(offset_tuple[0]),
-                    leaf_offset_list.index(offset_tuple[-1]),
-                ]
-                beam_range_list.append(new_beam_range)
+    def _get_meter_data(time_signature: abjad.TimeSignature) -> _MeterData:
+        cls = LeafMakerConsecutionToQuantizedAbjadContainer
+        with cls._meter_data_cache_lock:
+            meter_data = cls._meter_data_cache.get(time_signature)
+            if meter_data is None:
+                meter = _Meter(time_signature)
+                meter_data = _MeterData(meter, cls._find_offset_inventory(meter))
+                cls._meter_data_cache[time_signature] = meter_data
+        return meter_data
 
-        for beam_range in beam_range_list:
-            start, stop = beam_range
-            abjad.attach(abjad.StartBeam(), leaf_selection[start])
-            abjad.attach(abjad.StopBeam(), leaf_selection[stop])
+    @staticmethod
+    def _add_explicit_beams(bar: abjad.Container, meter_data: _MeterData) -> None:
+        offset_inventory = meter_data.beam_offset_inventory
+        leaf_list, leaf_offset_list = [], []
+        # Offsets are accumulated from the durations of the bar items
+        # instead of asking abjad for the timespan of each leaf, which
+        # would update the offsets of the complete score.
+        offset = fractions.Fraction(0)
+        for leaf_or_tuplet in bar:
+            if isinstance(leaf_or_tuplet, abjad.Leaf):
+                duration = leaf_or_tuplet.written_duration
+                if (multiplier := leaf_or_tuplet.multiplier) is not None:
+                    duration *= multiplier
+                # don't attach beams on tuplets
+                if leaf_or_tuplet.written_duration < fractions.Fraction(1, 4):
+                    leaf_list.append(leaf_or_tuplet)
+                    leaf_offset_list.append(offset)
+            else:
+                duration = abjad.get.duration(leaf_or_tuplet)
+            offset += duration
 
-        global_offset += offset_inventory[-1]
-        return global_offset
+        # Leaf offsets are sorted, so the leaves between two offsets of
+        # the beat level can be found by bisection.
+        start_index = 0
+        for start, end in zip(offset_inventory, offset_inventory[1:]):
+            start_index = bisect.bisect_left(leaf_offset_list, start, start_index)
+            end_index = bisect.bisect_left(leaf_offset_list, end, start_index)
+            # Only beam if the beat starts with a leaf and if there are
+            # at least two leaves inside the beat.
+            if end_index - start_index > 1 and leaf_offset_list[start_index] == start:
+                abjad.attach(abjad.StartBeam(), leaf_list[start_index])
+                abjad.attach(abjad.StopBeam(), leaf_list[end_index - 1])
+            start_index = end_index
 
     # ###################################################################### #
     #                       private methods                                  #
     # ###################################################################### #
 
-    def _make_note_tuple(
-        self, consecution_to_convert: core_events.Consecution
-    ) -> tuple[abjad.Leaf, ...]:
-        pitch_list = [
-            None if event.is_rest else "c" for event in consecution_to_convert
-        ]
-        # It has to be a list! Otherwise abjad raises an exception.
-        duration_list = list(
-            map(
-                lambda duration: abjad.Duration(to_abjad_compatible_duration(duration)),
-                consecution_to_convert.get_parameter("duration"),
+    @staticmethod
+    def _get_bar_duration_iterator(
+        time_signature_tuple: tuple[abjad.TimeSignature, ...]
+    ) -> typing.Iterator[abjad.Duration]:
+        # As documented, the last time signature is repeated for all bars
+        # after the passed time signatures (the same as in '_rewrite_meter').
+        return (
+            time_signature.duration
+            for time_signature in itertools.chain(
+                time_signature_tuple, itertools.repeat(time_signature_tuple[-1])
             )
         )
-        note_tuple = tuple(self._leaf_maker(pitch_list, duration_list))
-        return note_tuple
 
-    def _rewrite_meter(self, voice: abjad.Voice):
-        time_signature_iter = iter(self._time_signature_tuple)
-        last_time_signature = self._time_signature_tuple[-1]
+    def _plan_bar_list(
+        self,
+        rest_merged_durations: _RestMergedDurations,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> tuple[list[list[_PlannedLeaf]], frozenset[int]]:
+        # Split the events at the bar lines before any abjad object is
+        # created. This is only arithmetic on fractions and saves us from
+        # splitting (and sometimes copying) abjad leaves afterwards.
+        # Returns the planned bars and the indices of all bars which
+        # contain a part of a split event that needs a tuplet:
+        # abjad.LeafMaker may put such a part into a tuplet of its own
+        # with a prolation that abjad.Meter.rewrite_meter can't handle
+        # (it doesn't terminate).
+        bar_duration_iterator = self._get_bar_duration_iterator(time_signature_tuple)
+        bar_list: list[list[_PlannedLeaf]] = [[]]
+        split_tuplet_bar_index_list: list[int] = []
+        remaining_bar_duration = next(bar_duration_iterator)
+        for duration, is_rest in zip(
+            rest_merged_durations.duration_tuple, rest_merged_durations.is_rest_tuple
+        ):
+            is_split = False
+            while duration > remaining_bar_duration:
+                if not _has_power_of_two_denominator(remaining_bar_duration):
+                    split_tuplet_bar_index_list.append(len(bar_list) - 1)
+                bar_list[-1].append(
+                    _PlannedLeaf(remaining_bar_duration, is_rest, not is_rest)
+                )
+                duration -= remaining_bar_duration
+                bar_list.append([])
+                remaining_bar_duration = next(bar_duration_iterator)
+                is_split = True
+            if is_split and not _has_power_of_two_denominator(duration):
+                split_tuplet_bar_index_list.append(len(bar_list) - 1)
+            bar_list[-1].append(_PlannedLeaf(duration, is_rest, False))
+            remaining_bar_duration -= duration
+            if not remaining_bar_duration:
+                bar_list.append([])
+                remaining_bar_duration = next(bar_duration_iterator)
+        if not bar_list[-1]:
+            del bar_list[-1]
+        return bar_list, frozenset(split_tuplet_bar_index_list)
+
+    def _make_bar(self, planned_leaf_list: list[_PlannedLeaf]) -> abjad.Container:
+        # All leaves of a bar are made at once, so that abjad.LeafMaker
+        # can group adjacent durations with the same prolation into one
+        # tuplet.
+        pitch_list, duration_list = [], []
+        for planned_leaf in planned_leaf_list:
+            pitch_list.append(None if planned_leaf.is_rest else "c")
+            # It has to be a list of abjad durations! Otherwise abjad
+            # raises an exception.
+            duration_list.append(abjad.Duration(planned_leaf.duration))
+        bar = abjad.Container(
+            self._leaf_maker(pitch_list, duration_list), simultaneous=False
+        )
+        # Only the last leaf of a bar can cross a bar line.
+        if planned_leaf_list[-1].is_tied:
+            abjad.attach(abjad.Tie(), abjad.select.leaf(bar, -1))
+        return bar
+
+    def _rewrite_meter(
+        self,
+        voice: abjad.Voice,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+        split_tuplet_bar_index_set: frozenset[int] = frozenset(),
+    ):
+        time_signature_iter = iter(time_signature_tuple)
+        last_time_signature = time_signature_tuple[-1]
         # rewrite by meter
-        global_offset = abjad.Offset((0, 1))
         previous_time_signature = None
-        for bar in voice:
+        for bar_index, bar in enumerate(voice):
             try:
                 time_signature = next(time_signature_iter)
             except StopIteration:
                 time_signature = last_time_signature
             if time_signature != previous_time_signature:
                 abjad.attach(time_signature, abjad.get.leaf(bar, 0))
-            meter = abjad.Meter(time_signature)
-            abjad.Meter.rewrite_meter(
-                bar[:], time_signature, maximum_dot_count=self._maximum_dot_count
-            )
+            meter_data = self._get_meter_data(time_signature)
+            # abjad.Meter.rewrite_meter may never terminate for bars with
+            # tuplets of events which have been split at a bar line (see
+            # the known limitations), so we keep them as they are.
+            if bar_index not in split_tuplet_bar_index_set:
+                abjad.Meter.rewrite_meter(
+                    bar[:], meter_data.meter, maximum_dot_count=self._maximum_dot_count
+                )
             if self._add_beams:
-                global_offset = self._add_explicit_beams(bar, meter, global_offset)
+                self._add_explicit_beams(bar, meter_data)
             previous_time_signature = time_signature
 
         last_bar = bar
@@ -619,32 +1547,26 @@ class LeafMakerConsecutionToQuantizedAbjadContainer(
 
         if difference:
             last_bar.extend(self._leaf_maker([None], [difference]))
-            abjad.Meter.rewrite_meter(
-                last_bar[:], time_signature, maximum_dot_count=self._maximum_dot_count
-            )
+            if bar_index not in split_tuplet_bar_index_set:
+                abjad.Meter.rewrite_meter(
+                    last_bar[:],
+                    meter_data.meter,
+                    maximum_dot_count=self._maximum_dot_count,
+                )
 
     def _make_voice(
-        self, consecution_to_convert: core_events.Consecution
+        self,
+        rest_merged_durations: _RestMergedDurations,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
     ) -> abjad.Voice:
-        # first build notes
-        note_tuple = self._make_note_tuple(consecution_to_convert)
-
-        # split notes by time signatures
-        notes_split_by_time_signature_sequence = abjad.mutate.split(
-            note_tuple,
-            [time_signature.duration for time_signature in self._time_signature_tuple],
-            cyclic=True,
+        planned_bar_list, split_tuplet_bar_index_set = self._plan_bar_list(
+            rest_merged_durations, time_signature_tuple
+        )
+        voice = abjad.Voice(
+            [self._make_bar(planned_leaf_list) for planned_leaf_list in planned_bar_list]
         )
-        bar_list = []
-        for selection in notes_split_by_time_signature_sequence:
-            try:
-                bar = abjad.Container(selection, simultaneous=False)
-            except Exception:
-                bar = abjad.Container(abjad.mutate.copy(selection), simultaneous=False)
-            bar_list.append(bar)
-        voice = abjad.Voice(bar_list)
         if self._do_rewrite_meter:
-            self._rewrite_meter(voice)
+            self._rewrite_meter(voice, time_signature_tuple, split_tuplet_bar_index_set)
         if self._concatenate_adjacent_tuplets:
             abjad_utilities.concatenate_adjacent_tuplets(voice)
         if self._reduce_multiplier:
@@ -652,19 +1574,19 @@ class LeafMakerConsecutionToQuantizedAbjadContainer(
         return voice
 
     def _get_data_for_leaf(
-        self, index_tuple: tuple[int, ...], leaf: abjad.Leaf
-    ) -> tuple[tuple[int, ...], bool, bool]:
+        self, leaf_handle: AbjadLeafHandle, leaf: abjad.Leaf
+    ) -> tuple[AbjadLeafHandle, bool, bool]:
         has_tie = abjad.get.indicator(leaf, abjad.Tie())
         is_rest = isinstance(leaf, (abjad.Rest, abjad.MultimeasureRest, abjad.Skip))
-        return index_tuple, has_tie, is_rest
+        return leaf_handle, has_tie, is_rest
 
     def _get_data_for_tuplet_or_leaf(
         self,
-        index_tuple: tuple[int, ...],
+        leaf_handle: AbjadLeafHandle,
         leaf_or_tuplet: typing.Union[abjad.Leaf, abjad.Tuplet],
-    ) -> tuple[tuple[tuple[int, ...], bool], ...]:
+    ) -> tuple[tuple[AbjadLeafHandle, bool, bool], ...]:
         if isinstance(leaf_or_tuplet, abjad.Leaf):
-            return (self._get_data_for_leaf(index_tuple, leaf_or_tuplet),)
+            return (self._get_data_for_leaf(leaf_handle, leaf_or_tuplet),)
         else:
             data_per_leaf_or_tuplet_list = []
             for nth_leaf_or_tuplet_of_tuplet, sub_leaf_or_tuplet in enumerate(
@@ -672,7 +1594,7 @@ class LeafMakerConsecutionToQuantizedAbjadContainer(
             ):
                 data_per_leaf_or_tuplet_list.extend(
                     self._get_data_for_tuplet_or_leaf(
-                        index_tuple + (nth_leaf_or_tuplet_of_tuplet,),
+                        AbjadLeafHandle(leaf_or_tuplet, nth_leaf_or_tuplet_of_tuplet),
                         sub_leaf_or_tuplet,
                     )
                 )
@@ -680,13 +1602,13 @@ class LeafMakerConsecutionToQuantizedAbjadContainer(
 
     def _make_related_abjad_leaves_per_chronon(
         self, voice: abjad.Voice
-    ) -> tuple[tuple[tuple[int, ...], ...], ...]:
+    ) -> LeafHandleTupleTuple:
         data_per_tuplet_or_leaf_list = []
-        for nth_bar, bar in enumerate(voice):
+        for bar in voice:
             for nth_leaf_or_tuplet, leaf_or_tuplet in enumerate(bar):
                 data_per_tuplet_or_leaf_list.extend(
                     self._get_data_for_tuplet_or_leaf(
-                        (nth_bar, nth_leaf_or_tuplet), leaf_or_tuplet
+                        AbjadLeafHandle(bar, nth_leaf_or_tuplet), leaf_or_tuplet
                     )
                 )
 
@@ -694,13 +1616,13 @@ class LeafMakerConsecutionToQuantizedAbjadContainer(
         related_abjad_leaves = []
         was_previous_note_rest = None
         has_previous_tie = None
-        for index_tuple, has_tie, is_rest in data_per_tuplet_or_leaf_list:
+        for leaf_handle, has_tie, is_rest in data_per_tuplet_or_leaf_list:
             if has_previous_tie or all((was_previous_note_rest, is_rest)):
-                related_abjad_leaves.append(index_tuple)
+                related_abjad_leaves.append(leaf_handle)
             else:
                 if related_abjad_leaves:
                     related_abjad_leaves_per_chronon.append(tuple(related_abjad_leaves))
-                related_abjad_leaves = [index_tuple]
+                related_abjad_leaves = [leaf_handle]
 
             has_previous_tie = has_tie
             was_previous_note_rest = is_rest
@@ -710,20 +1632,550 @@ class LeafMakerConsecutionToQuantizedAbjadContainer(
 
         return tuple(related_abjad_leaves_per_chronon)
 
+    def _make_skeleton(
+        self,
+        rest_merged_durations: _RestMergedDurations,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> _Skeleton:
+        voice = self._make_voice(rest_merged_durations, time_signature_tuple)
+        return _Skeleton(voice, self._make_related_abjad_leaves_per_chronon(voice))
+
     def convert(
         self, consecution_to_convert: core_events.Consecution
     ) -> QuantizationData:
-        consecution_to_convert, is_chronon_rest_tuple = self._apply_is_rest(
-            self._tie_rests(consecution_to_convert)
+        return self._quantize_consecution(consecution_to_convert)
+
+
+class GridConsecutionToQuantizedAbjadContainer(ConsecutionToQuantizedAbjadContainer):
+    """Quantize :class:`~mutwo.core_events.Consecution` objects on beat grids.
+
+    :param default_time_signature_sequence: Set time signatures to divide the quantized abjad data
+        in desired bar sizes. If the converted
+        :class:`~mutwo.core_events.Consecution` is longer than the sum of
+        all passed time signatures, the last time signature
+        will be repeated for the remaining bars.
+    :type default_time_signature_sequence: typing.Sequence[abjad.TimeSignature]
+    :param subdivision_dict: Describes into how many equal parts a beat
+        (the denominator of the time signature) and each of its parts
+        can be divided. See
+        :const:`~mutwo.abjad_converters.configurations.DEFAULT_GRID_SUBDIVISION_DICT`
+        for the format. If set to `None` the default of the configuration
+        module is used. Default to `None`.
+    :type subdivision_dict: typing.Optional[dict]
+    :param complexity_weight: How expensive each additional leaf of a
+        subdivision is compared to the distance (in beats) between the
+        onsets and the grid. Higher values lead to simpler rhythms
+        which are less precise. Default to 0.02.
+    :type complexity_weight: float
+    :param add_beams: Set to `True` if the leaves of each beat should
+        be beamed together. Default to `True`.
+    :type add_beams: bool
+
+    For each beat the quantizer chooses the subdivision, which minimizes
+    the distance of the onsets to the grid and the complexity of the
+    subdivision. Because an onset can be moved to the start of the next
+    beat, beats aren't independent from each other: the best subdivisions
+    are found by dynamic programming over all beats. Repeated rhythms are
+    only evaluated once, so the quantizer runs in roughly linear time.
+    The result is deterministic and, unlike
+    :class:`LeafMakerConsecutionToQuantizedAbjadContainer`, supports
+    nested tuplets and ties across tuplets with different prolation.
+    Unlike :class:`NauertConsecutionToQuantizedAbjadContainer` a beat
+    can't be divided into more onsets than the finest subdivision allows,
+    in this case :class:`mutwo.abjad_utilities.NoFittingSubdivisionError`
+    is raised.
+
+    **Example:**
+
+    >>> import abjad
+    >>> from mutwo import abjad_converters
+    >>> from mutwo import core_events, music_events
+    >>> converter = abjad_converters.ConsecutionToAbjadVoice(
+    ...     abjad_converters.GridConsecutionToQuantizedAbjadContainer(
+    ...         default_time_signature_sequence=(abjad.TimeSignature((2, 4)),)
+    ...     )
+    ... )
+    >>> seq = core_events.Consecution(
+    ...     [music_events.NoteLike("c", 1 / 6) for _ in range(3)]
+    ... )
+    >>> abjad_voice = converter.convert(seq)
+    """
+
+    def __init__(
+        self,
+        *args,
+        subdivision_dict: typing.Optional[dict] = None,
+        complexity_weight: float = 0.02,
+        add_beams: bool = True,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        if subdivision_dict is None:
+            subdivision_dict = (
+                abjad_converters.configurations.DEFAULT_GRID_SUBDIVISION_DICT
+            )
+        self._candidate_tuple = self._make_candidate_tuple(subdivision_dict)
+        self._complexity_weight = complexity_weight
+        self._add_beams = add_beams
+
+    # ###################################################################### #
+    #                       static private methods                           #
+    # ###################################################################### #
+
+    @staticmethod
+    def _make_division_tree_tuple(
+        subdivision_dict: typing.Optional[dict],
+    ) -> tuple[_DivisionTree, ...]:
+        division_tree_list: list[_DivisionTree] = [None]
+        for part_count, part_subdivision_dict in sorted(
+            (subdivision_dict or {}).items()
+        ):
+            part_division_tree_tuple = (
+                GridConsecutionToQuantizedAbjadContainer._make_division_tree_tuple(
+                    part_subdivision_dict
+                )
+            )
+            division_tree_list.extend(
+                (part_count, part_division_tree_list)
+                for part_division_tree_list in itertools.product(
+                    part_division_tree_tuple, repeat=part_count
+                )
+            )
+        return tuple(division_tree_list)
+
+    @staticmethod
+    def _division_tree_to_point_list(
+        division_tree: _DivisionTree,
+        start: fractions.Fraction,
+        duration: fractions.Fraction,
+    ) -> list[fractions.Fraction]:
+        if division_tree is None:
+            return [start]
+        part_count, part_division_tree_tuple = division_tree
+        part_duration = duration / part_count
+        point_list = []
+        for part_index, part_division_tree in enumerate(part_division_tree_tuple):
+            point_list.extend(
+                GridConsecutionToQuantizedAbjadContainer._division_tree_to_point_list(
+                    part_division_tree,
+                    start + part_index * part_duration,
+                    part_duration,
+                )
+            )
+        return point_list
+
+    @staticmethod
+    def _make_candidate_tuple(subdivision_dict: dict) -> tuple[_GridCandidate, ...]:
+        cls = GridConsecutionToQuantizedAbjadContainer
+        candidate_dict: dict[tuple[fractions.Fraction, ...], _GridCandidate] = {}
+        for division_tree in cls._make_division_tree_tuple(subdivision_dict):
+            point_tuple = tuple(
+                cls._division_tree_to_point_list(
+                    division_tree, fractions.Fraction(0), fractions.Fraction(1)
+                )
+            )
+            # Different trees can describe the same grid: only the
+            # first (simplest) one is kept.
+            if point_tuple not in candidate_dict:
+                candidate_dict[point_tuple] = _GridCandidate(
+                    division_tree,
+                    tuple(float(point) for point in point_tuple) + (1.0,),
+                    len(point_tuple),
+                )
+        # Sorting is stable, so that candidates with the same leaf count
+        # keep their order and the quantization stays deterministic.
+        return tuple(
+            sorted(candidate_dict.values(), key=lambda candidate: candidate.leaf_count)
         )
-        self._time_signature_tuple = self._get_time_signature_tuple(
-            consecution_to_convert
+
+    @staticmethod
+    def _is_assignable(duration: fractions.Fraction) -> bool:
+        # Only plain and single dotted durations are used.
+        denominator = duration.denominator
+        return duration.numerator in (1, 3) and not denominator & (denominator - 1)
+
+    @staticmethod
+    def _merge_grid_leaves(grid_item_list: list) -> list:
+        # Merge a leaf into its previous leaf if it only continues the
+        # same chronon and if the merged duration can be written as one
+        # leaf.
+        merged_grid_item_list: list = []
+        for grid_item in grid_item_list:
+            if (
+                merged_grid_item_list
+                and isinstance(grid_item, _GridLeaf)
+                and not grid_item.is_onset
+                and isinstance(
+                    previous_grid_item := merged_grid_item_list[-1], _GridLeaf
+                )
+                and previous_grid_item.chronon_index == grid_item.chronon_index
+            ):
+                written_duration = (
+                    previous_grid_item.written_duration + grid_item.written_duration
+                )
+                if GridConsecutionToQuantizedAbjadContainer._is_assignable(
+                    written_duration
+                ):
+                    merged_grid_item_list[-1] = previous_grid_item._replace(
+                        written_duration=written_duration
+                    )
+                    continue
+            merged_grid_item_list.append(grid_item)
+        return merged_grid_item_list
+
+    @staticmethod
+    def _make_grid_item_list(
+        division_tree: _DivisionTree,
+        written_duration: fractions.Fraction,
+        slot_iterator: typing.Iterator[tuple[int, bool]],
+    ) -> list:
+        if division_tree is None:
+            return [_GridLeaf(written_duration, *next(slot_iterator))]
+        part_count, part_division_tree_tuple = division_tree
+        # The parts are written with the next smaller power of two and
+        # scaled by a tuplet if the part count isn't a power of two.
+        denominator = 2 ** (part_count.bit_length() - 1)
+        part_written_duration = written_duration / denominator
+        grid_item_list = []
+        for part_division_tree in part_division_tree_tuple:
+            grid_item_list.extend(
+                GridConsecutionToQuantizedAbjadContainer._make_grid_item_list(
+                    part_division_tree, part_written_duration, slot_iterator
+                )
+            )
+        grid_item_list = GridConsecutionToQuantizedAbjadContainer._merge_grid_leaves(
+            grid_item_list
+        )
+        if denominator == part_count:
+            return grid_item_list
+        # A tuplet which only contains one leaf is written as a plain leaf.
+        if len(grid_item_list) == 1 and isinstance(grid_item_list[0], _GridLeaf):
+            return [grid_item_list[0]._replace(written_duration=written_duration)]
+        return [_GridTuplet((denominator, part_count), grid_item_list)]
+
+    # ###################################################################### #
+    #                       private methods                                  #
+    # ###################################################################### #
+
+    def _make_beat_option_tuple(
+        self, position_tuple: tuple[fractions.Fraction, ...], is_start_occupied: bool
+    ) -> tuple[typing.Optional[_GridBeatOption], typing.Optional[_GridBeatOption]]:
+        # Return the best option of the beat for each state of the next
+        # beat (if the start of the next beat is occupied by an onset of
+        # this beat or not).
+        best_option_list: list[typing.Optional[_GridBeatOption]] = [None, None]
+        if not position_tuple:
+            best_option_list[0] = _GridBeatOption(
+                0.0, self._candidate_tuple[0], (), False
+            )
+            return tuple(best_option_list)
+        float_position_tuple = tuple(float(position) for position in position_tuple)
+        for candidate in self._candidate_tuple:
+            point_tuple = candidate.point_tuple
+            last_point_index = candidate.leaf_count
+            # Each onset is moved to its nearest grid point, but two
+            # onsets can't share the same grid point.
+            point_index = 0 if is_start_occupied else -1
+            point_index_list = []
+            cost = self._complexity_weight * (last_point_index - 1)
+            for position in float_position_tuple:
+                nearest_point_index = bisect.bisect_left(point_tuple, position)
+                if nearest_point_index and (
+                    position - point_tuple[nearest_point_index - 1]
+                    <= point_tuple[nearest_point_index] - position
+                ):
+                    nearest_point_index -= 1
+                point_index = max(nearest_point_index, point_index + 1)
+                if point_index > last_point_index:
+                    break
+                point_index_list.append(point_index)
+                cost += abs(position - point_tuple[point_index])
+            else:
+                # The last grid point is the start of the next beat.
+                is_onset_pushed = point_index == last_point_index
+                best_option = best_option_list[is_onset_pushed]
+                if best_option is None or cost < best_option.cost:
+                    best_option_list[is_onset_pushed] = _GridBeatOption(
+                        cost, candidate, tuple(point_index_list), is_onset_pushed
+                    )
+        return tuple(best_option_list)
+
+    def _make_beat_list(
+        self,
+        rest_merged_durations: _RestMergedDurations,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> tuple[
+        list[tuple[abjad.TimeSignature, int, fractions.Fraction, tuple[int, ...]]],
+        list[fractions.Fraction],
+    ]:
+        # Split the events into beats. Each beat is described by its
+        # time signature, its index within the bar, its start and the
+        # indices of the chronons which start within the beat.
+        onset_list = [fractions.Fraction(0)]
+        for duration in rest_merged_durations.duration_tuple:
+            onset_list.append(onset_list[-1] + duration)
+        # The end of the last chronon is the onset of the padding rest.
+        end = onset_list[-1]
+        beat_list = []
+        start, chronon_index = fractions.Fraction(0), 0
+        time_signature_iterator = itertools.chain(
+            time_signature_tuple, itertools.repeat(time_signature_tuple[-1])
+        )
+        while start < end:
+            time_signature = next(time_signature_iterator)
+            beat_duration = fractions.Fraction(1, time_signature.denominator)
+            for beat_index in range(time_signature.numerator):
+                start_chronon_index = chronon_index
+                while (
+                    chronon_index < len(onset_list)
+                    and onset_list[chronon_index] < start + beat_duration
+                ):
+                    chronon_index += 1
+                beat_list.append(
+                    (
+                        time_signature,
+                        beat_index,
+                        start,
+                        tuple(range(start_chronon_index, chronon_index)),
+                    )
+                )
+                start += beat_duration
+        return beat_list, onset_list
+
+    def _find_beat_option_list(
+        self, beat_list: list, onset_list: list[fractions.Fraction]
+    ) -> list[_GridBeatOption]:
+        if not beat_list:
+            return []
+        beat_option_tuple_dict: dict = {}
+        # Cost and previous state for each state (if the start of the
+        # current beat is occupied or not).
+        cost_list: list[typing.Optional[float]] = [0.0, None]
+        back_pointer_list = []
+        for beat_index, (time_signature, _, start, chronon_index_tuple) in enumerate(
+            beat_list
+        ):
+            beat_duration = fractions.Fraction(1, time_signature.denominator)
+            position_tuple = tuple(
+                (onset_list[chronon_index] - start) / beat_duration
+                for chronon_index in chronon_index_tuple
+            )
+            new_cost_list: list[typing.Optional[float]] = [None, None]
+            back_pointer = [None, None]
+            for is_start_occupied, cost in enumerate(cost_list):
+                if cost is None:
+                    continue
+                key = (position_tuple, is_start_occupied)
+                try:
+                    beat_option_tuple = beat_option_tuple_dict[key]
+                except KeyError:
+                    beat_option_tuple = beat_option_tuple_dict[key] = (
+                        self._make_beat_option_tuple(*key)
+                    )
+                for beat_option in beat_option_tuple:
+                    if beat_option is None:
+                        continue
+                    new_cost = cost + beat_option.cost
+                    state = beat_option.is_onset_pushed
+                    if new_cost_list[state] is None or new_cost < new_cost_list[state]:
+                        new_cost_list[state] = new_cost
+                        back_pointer[state] = (is_start_occupied, beat_option)
+            if new_cost_list == [None, None]:
+                raise abjad_utilities.NoFittingSubdivisionError(beat_index)
+            cost_list = new_cost_list
+            back_pointer_list.append(back_pointer)
+
+        # Only the onset of the padding rest (the end of the last chronon)
+        # can be moved behind the last beat.
+        time_signature, _, start, _ = beat_list[-1]
+        if onset_list[-1] >= start + fractions.Fraction(1, time_signature.denominator):
+            cost_list[1] = None
+        state_list = [state for state, cost in enumerate(cost_list) if cost is not None]
+        if not state_list:
+            raise abjad_utilities.NoFittingSubdivisionError(len(beat_list) - 1)
+        state = min(state_list, key=cost_list.__getitem__)
+        beat_option_list = []
+        for back_pointer in reversed(back_pointer_list):
+            state, beat_option = back_pointer[state]
+            beat_option_list.append(beat_option)
+        beat_option_list.reverse()
+        return beat_option_list
+
+    def _make_skeleton(
+        self,
+        rest_merged_durations: _RestMergedDurations,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> _Skeleton:
+        beat_list, onset_list = self._make_beat_list(
+            rest_merged_durations, time_signature_tuple
+        )
+        beat_option_list = self._find_beat_option_list(beat_list, onset_list)
+        chronon_count = len(rest_merged_durations.duration_tuple)
+        # The padding rest, which fills the last bar, is treated as an
+        # additional rest.
+        is_rest_tuple = rest_merged_durations.is_rest_tuple + (True,)
+
+        bar_list: list[tuple[abjad.TimeSignature, list, list[int]]] = []
+        chronon_index, pushed_chronon_index = 0, None
+        for (time_signature, beat_index, _, chronon_index_tuple), beat_option in zip(
+            beat_list, beat_option_list
+        ):
+            slot_list = [None] * beat_option.candidate.leaf_count
+            if pushed_chronon_index is not None:
+                slot_list[0] = (pushed_chronon_index, True)
+                pushed_chronon_index = None
+            for onset_chronon_index, point_index in zip(
+                chronon_index_tuple, beat_option.point_index_tuple
+            ):
+                if point_index == len(slot_list):
+                    pushed_chronon_index = onset_chronon_index
+                else:
+                    slot_list[point_index] = (onset_chronon_index, True)
+            for slot_index, slot in enumerate(slot_list):
+                if slot is None:
+                    slot_list[slot_index] = (chronon_index, False)
+                else:
+                    chronon_index = slot[0]
+            beat_duration = fractions.Fraction(1, time_signature.denominator)
+            grid_item_list = self._make_grid_item_list(
+                beat_option.candidate.division_tree, beat_duration, iter(slot_list)
+            )
+            if beat_index == 0:
+                bar_list.append((time_signature, [], []))
+            bar_grid_item_list, beat_index_list = bar_list[-1][1:]
+            # A beat which only continues the previous leaf is merged into
+            # this leaf, if the merged leaf starts at a multiple of its
+            # undotted duration.
+            if (
+                len(grid_item_list) == 1
+                and isinstance(grid_leaf := grid_item_list[0], _GridLeaf)
+                and not grid_leaf.is_onset
+                and bar_grid_item_list
+                and isinstance(previous_grid_item := bar_grid_item_list[-1], _GridLeaf)
+            ):
+                written_duration = (
+                    previous_grid_item.written_duration + grid_leaf.written_duration
+                )
+                offset = sum(
+                    (
+                        self._get_grid_item_duration(grid_item)
+                        for grid_item in bar_grid_item_list[:-1]
+                    ),
+                    fractions.Fraction(0),
+                )
+                undotted_duration = fractions.Fraction(1, written_duration.denominator)
+                if written_duration.numerator == 3:
+                    undotted_duration *= 2
+                if (
+                    self._is_assignable(written_duration)
+                    and not offset % undotted_duration
+                ):
+                    bar_grid_item_list[-1] = previous_grid_item._replace(
+                        written_duration=written_duration
+                    )
+                    continue
+            bar_grid_item_list.extend(grid_item_list)
+            beat_index_list.extend([beat_index] * len(grid_item_list))
+
+        voice = abjad.Voice([])
+        related_abjad_leaf_list_per_chronon: list[list[AbjadLeafHandle]] = [
+            [] for _ in range(chronon_count + 1)
+        ]
+        previous_time_signature = None
+        # The previous leaf and its chronon index, to tie notes which
+        # belong to the same chronon.
+        previous_leaf_data = None
+        for time_signature, bar_grid_item_list, beat_index_list in bar_list:
+            bar = abjad.Container([], simultaneous=False)
+            voice.append(bar)
+            leaf_list_per_beat: list[list[abjad.Leaf]] = [
+                [] for _ in range(time_signature.numerator)
+            ]
+            for grid_item, beat_index in zip(bar_grid_item_list, beat_index_list):
+                for leaf, chronon_index in self._append_grid_item(
+                    grid_item,
+                    bar,
+                    is_rest_tuple,
+                    related_abjad_leaf_list_per_chronon,
+                ):
+                    if (
+                        previous_leaf_data
+                        and previous_leaf_data[1] == chronon_index
+                        and not is_rest_tuple[chronon_index]
+                    ):
+                        abjad.attach(abjad.Tie(), previous_leaf_data[0])
+                    previous_leaf_data = (leaf, chronon_index)
+                    leaf_list_per_beat[beat_index].append(leaf)
+            if time_signature != previous_time_signature:
+                abjad.attach(time_signature, abjad.get.leaf(bar, 0))
+                previous_time_signature = time_signature
+            if self._add_beams:
+                for leaf_list in leaf_list_per_beat:
+                    if len(leaf_list) > 1 and all(
+                        leaf.written_duration < fractions.Fraction(1, 4)
+                        for leaf in leaf_list
+                    ):
+                        abjad.attach(abjad.StartBeam(), leaf_list[0])
+                        abjad.attach(abjad.StopBeam(), leaf_list[-1])
+
+        return _Skeleton(
+            voice,
+            tuple(
+                tuple(related_abjad_leaf_list)
+                for related_abjad_leaf_list in related_abjad_leaf_list_per_chronon[:-1]
+            ),
         )
-        voice = self._make_voice(consecution_to_convert)
-        related_abjad_leaves_per_chronon = self._make_related_abjad_leaves_per_chronon(
-            voice
+
+    def _get_grid_item_duration(
+        self, grid_item: typing.Union[_GridLeaf, _GridTuplet]
+    ) -> fractions.Fraction:
+        if isinstance(grid_item, _GridLeaf):
+            return grid_item.written_duration
+        numerator, denominator = grid_item.multiplier
+        return (
+            sum(
+                (self._get_grid_item_duration(item) for item in grid_item.item_list),
+                fractions.Fraction(0),
+            )
+            * numerator
+            / denominator
         )
-        return voice, related_abjad_leaves_per_chronon, is_chronon_rest_tuple
+
+    def _append_grid_item(
+        self,
+        grid_item: typing.Union[_GridLeaf, _GridTuplet],
+        container: abjad.Container,
+        is_rest_tuple: tuple[bool, ...],
+        related_abjad_leaf_list_per_chronon: list[list[AbjadLeafHandle]],
+    ) -> typing.Iterator[tuple[abjad.Leaf, int]]:
+        if isinstance(grid_item, _GridTuplet):
+            tuplet = abjad.Tuplet(grid_item.multiplier, [])
+            container.append(tuplet)
+            for item in grid_item.item_list:
+                yield from self._append_grid_item(
+                    item, tuplet, is_rest_tuple, related_abjad_leaf_list_per_chronon
+                )
+        else:
+            written_duration = abjad.Duration(grid_item.written_duration)
+            chronon_index = grid_item.chronon_index
+            if is_rest_tuple[chronon_index]:
+                leaf = abjad.Rest(written_duration)
+            else:
+                leaf = abjad.Note("c", written_duration)
+            related_abjad_leaf_list_per_chronon[chronon_index].append(
+                AbjadLeafHandle(container, len(container))
+            )
+            container.append(leaf)
+            yield leaf, chronon_index
+
+    # ###################################################################### #
+    #               public methods for interaction with the user             #
+    # ###################################################################### #
+
+    def convert(
+        self, consecution_to_convert: core_events.Consecution
+    ) -> QuantizationData:
+        return self._quantize_consecution(consecution_to_convert)
 
 
 class _DurationLineBasedQuantizedAbjadContainerMixin(object):
@@ -802,39 +2254,38 @@ class _DurationLineBasedQuantizedAbjadContainerMixin(object):
             first_element,
         )
 
-    def _adjust_quantisized_abjad_leaves(
+    def _add_duration_lines(
         self,
-        quanitisized_abjad_leaf_voice: abjad.Container,
-        related_abjad_leaves_per_chronon: tuple[tuple[tuple[int, ...], ...], ...],
+        rest_merged_durations: _RestMergedDurations,
+        related_abjad_leaves_per_merged_chronon: LeafHandleTupleTuple,
     ):
+        # This is an extra pass over the quantized skeleton, before it's
+        # cached and before any pitches are added. Therefore the merged rest
+        # mask tells which chronons are notes. The skips can't be made
+        # together with the other leaves, because meters are rewritten
+        # (and nauert notates its leaves) based on tied notes.
         is_first = True
 
-        for abjad_leaves_indices in related_abjad_leaves_per_chronon:
-            if abjad_leaves_indices:
-                first_element = core_utilities.get_nested_item_from_index_sequence(
-                    abjad_leaves_indices[0], quanitisized_abjad_leaf_voice
-                )
+        for leaf_handle_tuple, is_rest in zip(
+            related_abjad_leaves_per_merged_chronon, rest_merged_durations.is_rest_tuple
+        ):
+            if leaf_handle_tuple:
+                first_element = leaf_handle_tuple[0].leaf
                 if is_first:
                     self._prepare_first_element(first_element)
                     is_first = False
 
-                is_active = bool(abjad.get.pitches(first_element))
-                if is_active:
-                    if len(abjad_leaves_indices) > 1:
+                if not is_rest:
+                    if len(leaf_handle_tuple) > 1:
                         abjad.detach(abjad.Tie(), first_element)
 
                     abjad.attach(
                         abjad.LilyPondLiteral("\\-", site="after"), first_element
                     )
 
-                    for indices in abjad_leaves_indices[1:]:
-                        element = core_utilities.get_nested_item_from_index_sequence(
-                            indices, quanitisized_abjad_leaf_voice
-                        )
-                        core_utilities.set_nested_item_from_index_sequence(
-                            indices,
-                            quanitisized_abjad_leaf_voice,
-                            abjad.Skip(element.written_duration),
+                    for leaf_handle in leaf_handle_tuple[1:]:
+                        leaf_handle.leaf = abjad.Skip(
+                            leaf_handle.leaf.written_duration
                         )
 
 
@@ -856,24 +2307,18 @@ class NauertConsecutionToDurationLineBasedQuantizedAbjadContainer(
             duration_line_thickness=duration_line_thickness,
         )
 
-    def convert(
-        self, consecution_to_convert: core_events.Consecution
-    ) -> QuantizationData:
-        (
-            quanitisized_abjad_leaf_voice,
-            related_abjad_leaves_per_chronon,
-            is_chronon_rest_tuple,
-        ) = super().convert(consecution_to_convert)
+    def _make_skeleton(
+        self,
+        rest_merged_durations: _RestMergedDurations,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> _Skeleton:
+        skeleton = super()._make_skeleton(rest_merged_durations, time_signature_tuple)
 
-        self._adjust_quantisized_abjad_leaves(
-            quanitisized_abjad_leaf_voice, related_abjad_leaves_per_chronon
+        self._add_duration_lines(
+            rest_merged_durations, skeleton.related_abjad_leaves_per_merged_chronon
         )
 
-        return (
-            quanitisized_abjad_leaf_voice,
-            related_abjad_leaves_per_chronon,
-            is_chronon_rest_tuple,
-        )
+        return skeleton
 
 
 class LeafMakerConsecutionToDurationLineBasedQuantizedAbjadContainer(
@@ -894,30 +2339,23 @@ class LeafMakerConsecutionToDurationLineBasedQuantizedAbjadContainer(
             duration_line_minimum_length=duration_line_minimum_length,
         )
 
-    def convert(
-        self, consecution_to_convert: core_events.Consecution
-    ) -> QuantizationData:
-        (
-            quanitisized_abjad_leaf_voice,
-            related_abjad_leaves_per_chronon,
-            is_chronon_rest_tuple,
-        ) = super().convert(consecution_to_convert)
+    def _make_skeleton(
+        self,
+        rest_merged_durations: _RestMergedDurations,
+        time_signature_tuple: tuple[abjad.TimeSignature, ...],
+    ) -> _Skeleton:
+        skeleton = super()._make_skeleton(rest_merged_durations, time_signature_tuple)
 
-        self._adjust_quantisized_abjad_leaves(
-            quanitisized_abjad_leaf_voice, related_abjad_leaves_per_chronon
+        self._add_duration_lines(
+            rest_merged_durations, skeleton.related_abjad_leaves_per_merged_chronon
         )
 
         # only assign first item to abjad leaves
-        post_processed_releated_abjad_leaves_per_chronon = []
-        for related_abjad_leaves in related_abjad_leaves_per_chronon:
-            post_processed_releated_abjad_leaves_per_chronon.append(
-                (related_abjad_leaves[0],)
+        return skeleton._replace(
+            related_abjad_leaves_per_merged_chronon=tuple(
+                related_abjad_leaves[:1]
+                for related_abjad_leaves in skeleton.related_abjad_leaves_per_merged_chronon
             )
-
-        return (
-            quanitisized_abjad_leaf_voice,
-            post_processed_releated_abjad_leaves_per_chronon,
-            is_chronon_rest_tuple,
         )
 
 
@@ -929,5 +2367,19 @@ LeafMakerConsecutionToDurationLineBasedQuantizedAbjadContainer._set_docs(
 )
 
 
+def _is_chronon_rest(chronon: core_events.Chronon) -> bool:
+    # Default for 'is_chronon_rest'. This is a module level function and
+    # not a closure, so that quantizers can be pickled (e.g. in order to
+    # send them to worker processes).
+    # 'getattr' with a default value doesn't need to raise and catch an
+    # exception for chronons without any 'pitch_list' (e.g. rests).
+    return not getattr(chronon, "pitch_list", None)
+
+
+def _has_power_of_two_denominator(duration: fractions.Fraction) -> bool:
+    denominator = duration.denominator
+    return not denominator & (denominator - 1)
+
+
 def to_abjad_compatible_duration(duration: core_parameters.abc.Duration):
     return getattr(duration, "ratio", None) or duration.beat_count
@@ -1,3 +1,4 @@
+import math
 import typing
 
 import abjad
@@ -7,6 +8,7 @@ try:
 except ImportError:
     import fractions
 
+from mutwo import abjad_utilities
 from mutwo import ekmelily_converters
 from mutwo import music_parameters
 
@@ -54,6 +56,10 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
         :const:`mutwo.ekmelily_converters.configurations.DEFAULT_TEMPERED_PITCH_INDICATOR`
         for the default value.
     :type tempered_pitch_indicator: str, optional
+    :param cache_size: Converted just intonation pitches are cached by their
+        ratio. Set to ``None`` for an unbounded cache or to ``0`` to disable
+        caching. Default to 1024.
+    :type cache_size: typing.Optional[int]
 
     The resulting Abjad pitches are expected to be used in combination with tuning
     files that are generated by
@@ -101,6 +107,7 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
         utonality_indicator: str = None,
         exponent_to_exponent_indicator: typing.Callable[[int], str] = None,
         tempered_pitch_indicator: str = None,
+        cache_size: typing.Optional[int] = 1024,
     ):
         # set default values
         if prime_to_heji_accidental_name is None:
@@ -140,11 +147,41 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
         )
         self._prime_to_heji_accidental_name = prime_to_heji_accidental_name
 
+        # Precompute the prefix of each accidental part ('tonality' +
+        # 'heji_accidental_name') for all configured primes.
+        self._prime_to_otonal_and_utonal_accidental_prefix_dict = {
+            prime: (
+                f"{otonality_indicator}{heji_accidental_name}",
+                f"{utonality_indicator}{heji_accidental_name}",
+            )
+            for prime, heji_accidental_name in prime_to_heji_accidental_name.items()
+        }
+        self._exponent_to_exponent_indicator_dict: dict[int, str] = {}
+
+        # Semitone distance of each diatonic pitch class (in octave 4) to
+        # the reference pitch (in octave 4): with this we can find the
+        # octave of a pitch without building 'WesternPitch' objects.
+        reference_midi_pitch_number = round(
+            music_parameters.WesternPitch(reference_pitch, 4).midi_pitch_number
+        )
+        self._diatonic_pitch_class_name_to_semitone_distance_dict = {
+            diatonic_pitch_class_name: round(
+                music_parameters.WesternPitch(
+                    diatonic_pitch_class_name, 4
+                ).midi_pitch_number
+            )
+            - reference_midi_pitch_number
+            for diatonic_pitch_class_name in "c d e f g a b".split(" ")
+        }
+
+        self._just_intonation_pitch_cache = abjad_utilities.LRUCache(cache_size)
+
         self._mutwo_pitch_to_abjad_pitch = MutwoPitchToAbjadPitch(
             # When using HEJI we usually alter Lilypond to no longer support
             # quarter tones. Therefore we need to explicitly specify that
             # any WesternPitch is rounded to half tones.
-            (fractions.Fraction(1, 1),)
+            (fractions.Fraction(1, 1),),
+            cache_size=cache_size,
         )
 
     def _find_western_octave_for_just_intonation_pitch(
@@ -161,40 +198,36 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
         if closest_pythagorean_pitch_index < self._reference_index:
             octave += 1
 
-        pitch_as_western_pitch = music_parameters.WesternPitch(
-            closest_pythagorean_pitch_name[0], octave
-        )
-        reference_pitch_as_western_pitch = music_parameters.WesternPitch(
-            self._reference_pitch, 4
-        )
-        expected_difference_in_cents = pitch_to_convert.cents
-        while (
-            expected_difference_in_cents
-            - (
-                (
-                    pitch_as_western_pitch.midi_pitch_number
-                    - reference_pitch_as_western_pitch.midi_pitch_number
-                )
-                * 100
-            )
-            > 300
-        ):
-            pitch_as_western_pitch.octave += 1
-
-        while (
-            expected_difference_in_cents
-            - (
-                (
-                    pitch_as_western_pitch.midi_pitch_number
-                    - reference_pitch_as_western_pitch.midi_pitch_number
-                )
-                * 100
+        # Closed form of (1) raising the octave while the expected interval
+        # to the reference pitch is more than 300 cents above the interval
+        # of the western pitch to the reference pitch and then (2) lowering
+        # the octave while it is more than 300 cents below.
+        difference_in_cents = pitch_to_convert.cents - (
+            (
+                self._diatonic_pitch_class_name_to_semitone_distance_dict[
+                    closest_pythagorean_pitch_name[0]
+                ]
+                + ((octave - 4) * 12)
             )
-            < -300
-        ):
-            pitch_as_western_pitch.octave -= 1
-
-        return pitch_as_western_pitch.octave
+            * 100
+        )
+        if difference_in_cents > 300:
+            octave_count = math.ceil((difference_in_cents - 300) / 1200)
+            octave += octave_count
+            difference_in_cents -= octave_count * 1200
+        if difference_in_cents < -300:
+            octave -= math.ceil((-300 - difference_in_cents) / 1200)
+
+        return octave
+
+    def _get_exponent_indicator(self, exponent: int) -> str:
+        try:
+            return self._exponent_to_exponent_indicator_dict[exponent]
+        except KeyError:
+            exponent_indicator = self._exponent_to_exponent_indicator_dict[
+                exponent
+            ] = self._exponent_to_exponent_indicator(exponent)
+            return exponent_indicator
 
     def _find_heji_accidental_for_just_intonation_pitch(
         self,
@@ -209,17 +242,12 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
         for prime in sorted(prime_to_exponent.keys()):
             exponent = prime_to_exponent[prime]
             if exponent != 0:
-                tonality = (
-                    self._otonality_indicator
-                    if exponent > 0
-                    else self._utonality_indicator
-                )
-                heji_accidental_name = self._prime_to_heji_accidental_name[prime]
-                exponent_indicator = self._exponent_to_exponent_indicator(
-                    abs(exponent) - 1
+                otonal_prefix, utonal_prefix = (
+                    self._prime_to_otonal_and_utonal_accidental_prefix_dict[prime]
                 )
                 accidental_part_list.append(
-                    f"{tonality}{heji_accidental_name}{exponent_indicator}"
+                    (otonal_prefix if exponent > 0 else utonal_prefix)
+                    + self._get_exponent_indicator(abs(exponent) - 1)
                 )
 
         accidental = self._HEJIAccidental("".join(accidental_part_list))
@@ -248,9 +276,17 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
         abjad_pitch._pitch_class = abjad_pitch_class
         return abjad_pitch
 
+    def cache_info(self) -> abjad_utilities.LRUCache.CacheInfo:
+        """Get hit and miss statistics of the just intonation pitch cache."""
+        return self._just_intonation_pitch_cache.cache_info()
+
     def convert(self, pitch_to_convert: music_parameters.abc.Pitch) -> abjad.Pitch:
         if isinstance(pitch_to_convert, music_parameters.JustIntonationPitch):
-            abjad_pitch = self._convert_just_intonation_pitch(pitch_to_convert)
+            ratio = pitch_to_convert.ratio
+            if (abjad_pitch := self._just_intonation_pitch_cache.get(ratio)) is None:
+                abjad_pitch = self._just_intonation_pitch_cache[
+                    ratio
+                ] = self._convert_just_intonation_pitch(pitch_to_convert)
         else:
             abjad_pitch = self._mutwo_pitch_to_abjad_pitch.convert(pitch_to_convert)
 
@@ -7,6 +7,7 @@ try:
 except ImportError:
     import fractions
 
+from mutwo import abjad_utilities
 from mutwo import core_converters
 from mutwo import music_parameters
 
@@ -24,6 +25,13 @@ class MutwoPitchToAbjadPitch(core_converters.abc.Converter):
         the documentation of `round_to` method from
         :class:`music_parameters.WesternPitch` for further information.
     :type allowed_division_sequence: typing.Sequence[fractions.Fraction]
+    :param cache_size: Converted pitches are kept in a least recently used
+        cache, so that repeating pitches only cost a dictionary lookup.
+        Pitches are identified by their :attr:`name` (for
+        :class:`music_parameters.WesternPitch`) or by their :attr:`hertz`
+        attribute (for any other pitch). Set to ``None`` for an unbounded
+        cache or to ``0`` to disable caching. Default to 1024.
+    :type cache_size: typing.Optional[int]
 
     This default class simply checks if the passed Mutwo object belongs to
     :class:`mutwo.music_parameters.WesternPitch`. If it does, Mutwo
@@ -34,6 +42,9 @@ class MutwoPitchToAbjadPitch(core_converters.abc.Converter):
     If users desire to make more complex conversions (for instance
     due to ``scordatura`` or transpositions of instruments), one can simply
     inherit from this class to define more complex cases.
+
+    Because :class:`abjad.NamedPitch` objects are immutable, the same
+    object is returned for equal pitches.
     """
 
     def __init__(
@@ -41,10 +52,28 @@ class MutwoPitchToAbjadPitch(core_converters.abc.Converter):
         allowed_division_sequence: typing.Sequence[fractions.Fraction] = (
             fractions.Fraction(1, 2),
         ),
+        cache_size: typing.Optional[int] = 1024,
     ):
         self._allowed_division_sequence = allowed_division_sequence
+        self._allowed_division_tuple = tuple(allowed_division_sequence)
+        self._pitch_cache = abjad_utilities.LRUCache(cache_size)
 
-    def convert(self, pitch_to_convert: music_parameters.abc.Pitch) -> abjad.Pitch:
+    def _get_pitch_key(
+        self, pitch_to_convert: music_parameters.abc.Pitch
+    ) -> typing.Hashable:
+        # The name of a WesternPitch (pitch class + octave) fully
+        # defines the rounded pitch. For all other pitches only the
+        # frequency is used for the conversion.
+        if isinstance(pitch_to_convert, music_parameters.WesternPitch):
+            return (
+                type(pitch_to_convert),
+                pitch_to_convert.name,
+                self._allowed_division_tuple,
+            )
+        else:
+            return pitch_to_convert.hertz
+
+    def _convert(self, pitch_to_convert: music_parameters.abc.Pitch) -> abjad.Pitch:
         if isinstance(pitch_to_convert, music_parameters.WesternPitch):
             return abjad.NamedPitch(
                 pitch_to_convert.copy().round_to(
@@ -53,3 +82,23 @@ class MutwoPitchToAbjadPitch(core_converters.abc.Converter):
             )
         else:
             return abjad.NamedPitch.from_hertz(pitch_to_convert.hertz)
+
+    def cache_info(self) -> abjad_utilities.LRUCache.CacheInfo:
+        """Get hit and miss statistics of the pitch cache.
+
+        **Example:**
+
+        >>> from mutwo import abjad_converters, music_parameters
+        >>> converter = abjad_converters.MutwoPitchToAbjadPitch()
+        >>> for pitch_name in "c d c c".split(" "):
+        ...     abjad_pitch = converter.convert(music_parameters.WesternPitch(pitch_name))
+        >>> converter.cache_info()
+        CacheInfo(hits=2, misses=2, maxsize=1024, currsize=2)
+        """
+        return self._pitch_cache.cache_info()
+
+    def convert(self, pitch_to_convert: music_parameters.abc.Pitch) -> abjad.Pitch:
+        key = self._get_pitch_key(pitch_to_convert)
+        if (abjad_pitch := self._pitch_cache.get(key)) is None:
+            abjad_pitch = self._pitch_cache[key] = self._convert(pitch_to_convert)
+        return abjad_pitch
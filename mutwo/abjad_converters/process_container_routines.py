@@ -18,6 +18,18 @@ __all__ = (
 )
 
 
+# Module level functions instead of lambda functions as default arguments,
+# so that routines (and the converters which use them) can be pickled.
+
+
+def _compound_to_instrument_name(compound: core_events.abc.Compound) -> str:
+    return compound.instrument_name
+
+
+def _compound_to_short_instrument_name(compound: core_events.abc.Compound) -> str:
+    return compound.short_instrument_name
+
+
 class ProcessAbjadContainerRoutine(abc.ABC):
     @abc.abstractmethod
     def __call__(
@@ -75,10 +87,10 @@ class AddInstrumentName(ProcessAbjadContainerRoutine):
         self,
         compound_to_instrument_name: typing.Callable[
             [core_events.abc.Compound], str
-        ] = lambda compound: compound.instrument_name,
+        ] = _compound_to_instrument_name,
         compound_to_short_instrument_name: typing.Callable[
             [core_events.abc.Compound], str
-        ] = lambda compound: compound.short_instrument_name,
+        ] = _compound_to_short_instrument_name,
         instrument_name_font_size: str = "teeny",
         short_instrument_name_font_size: str = "teeny",
     ):
@@ -38,13 +38,28 @@ def _concatenate_adjacent_tuplets(bar: abjad.Container):
         i for i, e in enumerate(bar) if isinstance(e, abjad.Tuplet)
     )
     g = abjad_utilities.group_consecutive_numbers(tuplet_index_tuple)
-    for tuplet_index_list in reversed(g):
-        _concatenate_adjacent_tuplets_for_one_group(bar, tuplet_index_list)
-
-
-def _concatenate_adjacent_tuplets_for_one_group(bar: abjad.Container, group: list[int]):
+    component_list, is_changed = [], False
+    previous_index = 0
+    for tuplet_index_list in g:
+        if tuplet_list := _concatenate_adjacent_tuplets_for_one_group(
+            bar, tuplet_index_list
+        ):
+            component_list.extend(bar[previous_index : tuplet_index_list[0]])
+            component_list.extend(tuplet_list)
+            previous_index = tuplet_index_list[-1] + 1
+            is_changed = True
+    # Only mutate the bar if there is any group of consecutive tuplets
+    # which can be concatenated. All groups are replaced at once.
+    if is_changed:
+        component_list.extend(bar[previous_index:])
+        bar[:] = component_list
+
+
+def _concatenate_adjacent_tuplets_for_one_group(
+    bar: abjad.Container, group: list[int]
+) -> list[abjad.Tuplet]:
     if len(group) < 2:  # We can't concatenate 1 element
-        return
+        return []
 
     prolation_list = [bar[i].implied_prolation for i in group]
     # We now sort our tuplets by their prolation: if two or more
@@ -59,17 +74,15 @@ def _concatenate_adjacent_tuplets_for_one_group(bar: abjad.Container, group: lis
         else:
             common_prolation_group_list.append([prolation, [i]])
 
-    # Only do expensive copy and inplace mutation if there is any
-    # group of consecutive tuplets which can be concatenated.
     if not any_common:
-        return
+        return []
 
     tuplet_list = []
     for prolation, tuplet_index_list in common_prolation_group_list:
         t = abjad.Tuplet(prolation)
         for i in tuplet_index_list:
-            for component in bar[i]:
-                t.append(abjad.mutate.copy(component))
+            # Move the components (with their indicators) into the
+            # new tuplet instead of copying them.
+            t.extend(bar[i][:])
         tuplet_list.append(t)
-
-    bar[group[0] : group[-1] + 1] = tuplet_list
+    return tuplet_list
@@ -1,4 +1,4 @@
-__all__ = ("NoTimeSignatureError",)
+__all__ = ("NoTimeSignatureError", "NoFittingSubdivisionError")
 
 
 class NoTimeSignatureError(Exception):
@@ -8,3 +8,12 @@ class NoTimeSignatureError(Exception):
             "'default_time_signature_sequence_count'. "
             "Specify at least one time signature!"
         )
+
+
+class NoFittingSubdivisionError(Exception):
+    def __init__(self, beat_index: int):
+        super().__init__(
+            f"Found no subdivision of beat '{beat_index}' which can notate "
+            "all of its onsets. Add finer subdivisions to argument "
+            "'subdivision_dict'!"
+        )
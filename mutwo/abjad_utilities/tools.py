@@ -1,8 +1,12 @@
+import collections
+import dataclasses
 import itertools
 import operator
+import threading
+import typing
 
 
-__all__ = ("group_consecutive_numbers",)
+__all__ = ("group_consecutive_numbers", "LRUCache", "ConversionStatistics")
 
 
 def group_consecutive_numbers(number_tuple: tuple[int, ...]) -> list[list[int]]:
@@ -18,3 +22,213 @@ def group_consecutive_numbers(number_tuple: tuple[int, ...]) -> list[list[int]]:
     for k, g in itertools.groupby(enumerate(number_tuple), lambda t: t[1] - t[0]):
         d.append(list(map(operator.itemgetter(1), g)))
     return d
+
+
+class LRUCache(object):
+    """Bounded cache which discards the least recently used items.
+
+    :param maxsize: Maximum number of items which are kept in the cache.
+        If ``None`` the cache grows without any limit. If ``0`` nothing
+        is cached. Default to 128.
+    :type maxsize: typing.Optional[int]
+
+    Unlike :func:`functools.lru_cache` this is a plain object which
+    can be stored on converters and which can be pickled together with
+    them. It can be shared by converters which run in different threads.
+
+    **Example:**
+
+    >>> from mutwo import abjad_utilities
+    >>> cache = abjad_utilities.LRUCache(maxsize=2)
+    >>> cache.get('a') is None
+    True
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3  # discards 'b', because it is the least recently used
+    >>> 'b' in cache
+    False
+    >>> cache.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=2)
+    """
+
+    CacheInfo = collections.namedtuple(
+        "CacheInfo", ("hits", "misses", "maxsize", "currsize")
+    )
+
+    def __init__(self, maxsize: typing.Optional[int] = 128):
+        self._maxsize = maxsize
+        self._ordered_dict: collections.OrderedDict = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        with self._lock:
+            return key in self._ordered_dict
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ordered_dict)
+
+    def __setitem__(self, key: typing.Hashable, value: typing.Any):
+        if self._maxsize == 0:
+            return
+        ordered_dict = self._ordered_dict
+        with self._lock:
+            ordered_dict[key] = value
+            ordered_dict.move_to_end(key)
+            if self._maxsize is not None and len(ordered_dict) > self._maxsize:
+                ordered_dict.popitem(last=False)
+
+    @property
+    def maxsize(self) -> typing.Optional[int]:
+        return self._maxsize
+
+    def get(self, key: typing.Hashable, default: typing.Any = None) -> typing.Any:
+        """Get cached value and update hit/miss statistics.
+
+        :param key: The key of the value.
+        :type key: typing.Hashable
+        :param default: Returned in case the key isn't cached. Default to ``None``.
+        :type default: typing.Any
+        """
+        with self._lock:
+            try:
+                value = self._ordered_dict[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._ordered_dict.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def record_hit(self):
+        """Count a hit of a value which has been found outside of the cache.
+
+        This is useful if a caller already keeps the value (for instance
+        because it has been requested before within the same call), but
+        wants the statistics to be the same as if it had called :meth:`get`.
+        """
+        with self._lock:
+            self.hits += 1
+
+    def cache_info(self) -> CacheInfo:
+        """Get hit and miss statistics (like :func:`functools.lru_cache`)."""
+        with self._lock:
+            return self.CacheInfo(
+                self.hits, self.misses, self._maxsize, len(self._ordered_dict)
+            )
+
+    def clear(self):
+        """Remove all items and reset statistics."""
+        with self._lock:
+            self._ordered_dict.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class ConversionStatistics(object):
+    """Collect wall time, call count and leaf count per conversion stage.
+
+    Pass an instance to the ``statistics`` argument of a converter (for
+    instance :class:`mutwo.abjad_converters.ConsecutionToAbjadVoice` or
+    :class:`mutwo.abjad_converters.NestedCompoundToAbjadContainer`) to
+    find out where conversion time goes. The same instance can be shared
+    by several (nested) converters. Stages are named
+    ``'<converter>.<stage>'``. If no statistics object is passed to a
+    converter, nothing is recorded. Leaves are only counted once per
+    conversion (in the ``fill`` stage), all other stages have a leaf count
+    of 0.
+
+    Statistics of conversions which run in other processes (for instance
+    via :meth:`mutwo.abjad_converters.CompoundToAbjadContainer.convert_many`)
+    are recorded in the copies of the worker processes and don't arrive
+    in the original object.
+
+    **Example:**
+
+    >>> from mutwo import abjad_converters, abjad_utilities
+    >>> from mutwo import core_events, music_events
+    >>> statistics = abjad_utilities.ConversionStatistics()
+    >>> converter = abjad_converters.ConsecutionToAbjadVoice(statistics=statistics)
+    >>> voice = converter.convert(
+    ...     core_events.Consecution([music_events.NoteLike("c", 1)])
+    ... )
+    >>> statistics.stage_dict["ConsecutionToAbjadVoice.quantize"].call_count
+    1
+    """
+
+    @dataclasses.dataclass
+    class Stage(object):
+        call_count: int = 0
+        wall_time: float = 0
+        leaf_count: int = 0
+
+    def __init__(self):
+        self._stage_dict: dict[str, ConversionStatistics.Stage] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return self.summary()
+
+    @property
+    def stage_dict(self) -> dict[str, Stage]:
+        """All recorded stages."""
+        return dict(self._stage_dict)
+
+    def record(self, stage_name: str, wall_time: float, leaf_count: int = 0):
+        """Add one call of a stage.
+
+        :param stage_name: The name of the stage.
+        :type stage_name: str
+        :param wall_time: How long the call took in seconds.
+        :type wall_time: float
+        :param leaf_count: How many leaves have been processed by the call.
+            Default to 0.
+        :type leaf_count: int
+        """
+        with self._lock:
+            try:
+                stage = self._stage_dict[stage_name]
+            except KeyError:
+                stage = self._stage_dict[stage_name] = self.Stage()
+            stage.call_count += 1
+            stage.wall_time += wall_time
+            stage.leaf_count += leaf_count
+
+    def summary(self) -> str:
+        """Get a table of all stages, sorted by their wall time."""
+        line_list = [f"{'stage':<60} {'calls':>8} {'time [s]':>10} {'leaves':>10}"]
+        for stage_name, stage in sorted(
+            self._stage_dict.items(), key=lambda item: item[1].wall_time, reverse=True
+        ):
+            line_list.append(
+                f"{stage_name:<60} {stage.call_count:>8} "
+                f"{stage.wall_time:>10.4f} {stage.leaf_count:>10}"
+            )
+        return "\n".join(line_list)
+
+    def clear(self):
+        """Remove all recorded stages."""
+        with self._lock:
+            self._stage_dict.clear()
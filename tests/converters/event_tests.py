@@ -1,9 +1,14 @@
 """Test conversion of mutwo to abjad events"""
 
+import concurrent.futures
 import os
+import pickle
+import time
 import unittest
+import warnings
 
 import abjad  # type: ignore
+from abjadext import nauert  # type: ignore
 
 try:
     import quicktions as fractions  # type: ignore
@@ -13,11 +18,13 @@ except ImportError:
 import ranges
 
 from mutwo import abjad_converters
+from mutwo import abjad_parameters
 from mutwo import abjad_utilities
 from mutwo import core_events
 from mutwo import core_parameters
 from mutwo import music_events
 from mutwo import music_parameters
+from mutwo.abjad_converters.events import quantization
 
 
 t = abjad_utilities.AbjadTestCase.t
@@ -333,6 +340,72 @@ class IntegrationTest(abjad_utilities.AbjadTestCase):
             )
         )
 
+    def _test_grid(self, ev: core_events.Consecution):
+        return dict(
+            converter=abjad_converters.ConsecutionToAbjadVoice(
+                abjad_converters.GridConsecutionToQuantizedAbjadContainer(
+                    default_time_signature_sequence=(abjad.TimeSignature((4, 4)),)
+                )
+            ),
+            ev=ev,
+        )
+
+    @t(RESET_TESTS, FORCE_PNG)
+    def test_leaf_maker_tuplet_across_bar_line(self):
+        """Test notation of tuplets which are split at a bar line
+
+        The meters of the bars around such a bar line aren't rewritten.
+        """
+        return dict(
+            converter=abjad_converters.ConsecutionToAbjadVoice(
+                abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer(
+                    (abjad.TimeSignature((3, 4)),)
+                )
+            ),
+            ev=seq(
+                [
+                    n("c", f(1, 4)),
+                    n("d", f(2, 5)),
+                    n("e", f(1, 8)),
+                    n("f", f(1, 4)),
+                    n("g", f(3, 5)),
+                    n("a", f(1, 6)),
+                ]
+            ),
+        )
+
+    @t(RESET_TESTS, FORCE_PNG)
+    def test_grid_nested_tuplet(self):
+        """Test if the grid quantizer writes nested tuplets"""
+        return self._test_grid(
+            seq(
+                [
+                    n("c", f(3, 4)),
+                    n("c", f(1, 20)),
+                    n("c", f(1, 20)),
+                    n("c", f(1, 10)),
+                    n("d", f(1, 60)),
+                    n("d", f(1, 60)),
+                    n("d", f(1, 60)),
+                ]
+            )
+        )
+
+    @t(RESET_TESTS, FORCE_PNG)
+    def test_grid_ties_across_tuplets_with_different_prolation(self):
+        """Test if the grid quantizer ties across tuplets with different prolation"""
+        return self._test_grid(
+            seq(
+                [
+                    n("c", f(1, 6)),
+                    n("c", f(1, 6)),
+                    n("c", f(1, 6) + f(1, 20)),  # this is the tied note
+                    n("c", f(1, 20)),
+                    n("c", f(3, 20)),
+                ]
+            )
+        )
+
 
 f = fractions.Fraction
 n = music_events.NoteLike
@@ -405,6 +478,726 @@ class ConsecutionToAbjadVoiceTest(unittest.TestCase):
 
             self.assertEqual(indicators0, indicators1)
 
+    def test_nauert_related_leaves_per_chronon(self):
+        quantizer = abjad_converters.NauertConsecutionToQuantizedAbjadContainer()
+        _, leaf_handle_tuple_tuple, _ = quantizer.convert(self.consecution)
+        self.assertEqual(
+            [
+                [leaf_handle.leaf.written_duration for leaf_handle in leaf_handle_tuple]
+                for leaf_handle_tuple in leaf_handle_tuple_tuple
+            ],
+            [
+                [abjad.Duration(3, 4)],
+                [abjad.Duration(1, 4)],
+                [abjad.Duration(1, 4)],
+                [abjad.Duration(1, 8)],
+            ],
+        )
+
+    def test_nauert_q_schema_cache(self):
+        time_signature_tuple = (abjad.TimeSignature((3, 4)),) * 2
+        quantizer0, quantizer1 = (
+            abjad_converters.NauertConsecutionToQuantizedAbjadContainer(
+                time_signature_tuple
+            )
+            for _ in range(2)
+        )
+        self.assertIs(
+            quantizer0._get_q_schema(time_signature_tuple),
+            quantizer1._get_q_schema(time_signature_tuple),
+        )
+        quantizer2 = abjad_converters.NauertConsecutionToQuantizedAbjadContainer(
+            time_signature_tuple, search_tree=nauert.UnweightedSearchTree()
+        )
+        self.assertIsNot(
+            quantizer0._get_q_schema(time_signature_tuple),
+            quantizer2._get_q_schema(time_signature_tuple),
+        )
+
+    def test_default_is_chronon_rest(self):
+        is_chronon_rest = (
+            abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer()._is_chronon_rest
+        )
+        self.assertTrue(is_chronon_rest(core_events.Chronon(1)))
+        self.assertTrue(is_chronon_rest(n([], 1)))
+        self.assertFalse(is_chronon_rest(n("c", 1)))
+
+    def test_convert_with_adjacent_rests(self):
+        # Adjacent rests are merged by the quantizer, but the notes after
+        # them still need to get their own pitches and dynamics.
+        consecution = seq(
+            [
+                n("c", f(1, 4), volume="mf"),
+                n([], f(1, 8)),
+                n([], f(1, 8)),
+                n("d", f(1, 4), volume="ff"),
+                n("e", f(1, 4), volume="p"),
+            ]
+        )
+        for quantizer in (
+            abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer(),
+            abjad_converters.NauertConsecutionToQuantizedAbjadContainer(),
+            abjad_converters.GridConsecutionToQuantizedAbjadContainer(),
+            abjad_converters.LeafMakerConsecutionToDurationLineBasedQuantizedAbjadContainer(),
+            abjad_converters.NauertConsecutionToDurationLineBasedQuantizedAbjadContainer(),
+        ):
+            with self.subTest(quantizer=quantizer):
+                _, leaf_handle_tuple_tuple, is_chronon_rest_mask = quantizer.convert(
+                    consecution
+                )
+                self.assertEqual(
+                    is_chronon_rest_mask, bytearray((False, True, True, False, False))
+                )
+                self.assertEqual(
+                    [
+                        len(leaf_handle_tuple)
+                        for leaf_handle_tuple in leaf_handle_tuple_tuple
+                    ],
+                    [1, 1, 0, 1, 1],
+                )
+                voice = abjad_converters.ConsecutionToAbjadVoice(quantizer).convert(
+                    consecution
+                )
+                self.assertEqual(
+                    [
+                        (
+                            abjad.lilypond(note.written_pitch),
+                            abjad.get.indicator(note, abjad.Dynamic).name,
+                        )
+                        for note in abjad.select.notes(voice)
+                    ],
+                    [("c'", "mf"), ("d'", "ff"), ("e'", "p")],
+                )
+                # The converted events aren't mutated.
+                self.assertFalse(hasattr(consecution[1], "is_rest"))
+
+    def test_leaf_maker_meter_data_cache(self):
+        get_meter_data = (
+            abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer._get_meter_data
+        )
+        meter_data = get_meter_data(abjad.TimeSignature((5, 4)))
+        self.assertIs(meter_data, get_meter_data(abjad.TimeSignature((5, 4))))
+        self.assertIsNot(meter_data, get_meter_data(abjad.TimeSignature((6, 4))))
+        self.assertEqual(
+            meter_data.meter.depthwise_offset_inventory,
+            abjad.Meter(abjad.TimeSignature((5, 4))).depthwise_offset_inventory,
+        )
+        self.assertEqual(len(meter_data.beam_offset_inventory), 6)
+
+    def test_leaf_maker_bar_layout(self):
+        quantizer = abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer(
+            (abjad.TimeSignature((3, 4)), abjad.TimeSignature((2, 4)))
+        )
+        voice, related_abjad_leaves_per_chronon, _ = quantizer.convert(
+            seq([n("c", f(1, 2)), n("d", f(1, 2)), n([], f(3, 4)), n("e", f(1, 4))])
+        )
+        self.assertEqual(
+            [abjad.get.duration(bar) for bar in voice],
+            [f(3, 4), f(2, 4), f(2, 4), f(2, 4)],
+        )
+        # The second note is split at the bar line and tied
+        # across it, the rest is split without a tie.
+        first_bar_last_leaf, second_bar_first_leaf = (
+            leaf_handle.leaf for leaf_handle in related_abjad_leaves_per_chronon[1]
+        )
+        self.assertTrue(abjad.get.indicator(first_bar_last_leaf, abjad.Tie))
+        self.assertIs(second_bar_first_leaf, abjad.get.leaf(voice[1], 0))
+        # The last time signature is repeated and the last bar is
+        # filled with rests.
+        self.assertEqual(
+            abjad.lilypond(voice[-1]), abjad.lilypond(abjad.Container("c4 r4"))
+        )
+
+    def test_leaf_maker_tuplet_across_bar_line(self):
+        # The meters of bars with parts of an event which is split into
+        # tuplets aren't rewritten, otherwise 'rewrite_meter' doesn't
+        # terminate.
+        quantizer = abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer(
+            (abjad.TimeSignature((3, 4)),)
+        )
+        voice, related_abjad_leaves_per_chronon, _ = quantizer.convert(
+            seq(
+                [
+                    n("c", f(1, 4)),
+                    n("d", f(2, 5)),
+                    n("e", f(1, 8)),
+                    n("f", f(1, 4)),
+                    n("g", f(3, 5)),
+                    n("a", f(1, 6)),
+                ]
+            )
+        )
+        self.assertEqual(
+            [abjad.get.duration(bar) for bar in voice], [abjad.Duration(3, 4)] * 3
+        )
+        self.assertEqual(
+            [
+                len(related_abjad_leaves)
+                for related_abjad_leaves in related_abjad_leaves_per_chronon
+            ],
+            [1, 1, 2, 1, 3, 1],
+        )
+
+    def test_grid_quantizer(self):
+        quantizer = abjad_converters.GridConsecutionToQuantizedAbjadContainer(
+            (abjad.TimeSignature((2, 4)),)
+        )
+        voice, related_abjad_leaves_per_chronon, _ = quantizer.convert(
+            seq([n("c", f(1, 6)), n("d", f(1, 6)), n("e", f(1, 6)), n("f", f(3, 4))])
+        )
+        abjad.detach(abjad.TimeSignature, abjad.get.leaf(voice, 0))
+        self.assertEqual(
+            abjad.lilypond(voice[0]),
+            abjad.lilypond(
+                abjad.Container(r"\times 2/3 { c4 c8 ~ } \times 2/3 { c8 c4 }")
+            ),
+        )
+        # The second note is tied across two tuplets.
+        self.assertEqual(
+            [
+                len(leaf_handle_tuple)
+                for leaf_handle_tuple in related_abjad_leaves_per_chronon
+            ],
+            [1, 2, 1, 2],
+        )
+        self.assertEqual(
+            abjad.lilypond(voice[-1]), abjad.lilypond(abjad.Container("c4 r4"))
+        )
+        # Quantization is deterministic: onsets which are slightly off
+        # are moved to the same grid.
+        voice_with_offset = quantizer.convert(
+            seq(
+                [
+                    n("c", f(1, 6) + f(1, 1000)),
+                    n("d", f(1, 6) - f(1, 1000)),
+                    n("e", f(1, 6)),
+                    n("f", f(3, 4)),
+                ]
+            )
+        )[0]
+        abjad.detach(abjad.TimeSignature, abjad.get.leaf(voice_with_offset, 0))
+        self.assertEqual(abjad.lilypond(voice), abjad.lilypond(voice_with_offset))
+
+    def test_grid_quantizer_without_fitting_subdivision(self):
+        quantizer = abjad_converters.GridConsecutionToQuantizedAbjadContainer(
+            subdivision_dict={2: None}
+        )
+        with self.assertRaises(abjad_utilities.NoFittingSubdivisionError):
+            quantizer.convert(seq([n("c", f(1, 16)) for _ in range(4)]))
+
+    def test_concatenate_adjacent_tuplets(self):
+        voice = abjad.Voice(
+            [
+                abjad.Container(
+                    r"\tuplet 3/2 { c8 d8 e8 } \tuplet 3/2 { f8 g8 a8 } c4 "
+                    r"\tuplet 3/2 { c4 d8 ~ } \tuplet 3/2 { d8 e4 }"
+                )
+            ]
+        )
+        leaf_list = abjad.select.leaves(voice)
+        abjad_utilities.concatenate_adjacent_tuplets(voice)
+        self.assertEqual(
+            abjad.lilypond(voice[0]),
+            abjad.lilypond(
+                abjad.Container(
+                    r"\tuplet 3/2 { c8 d8 e8 f8 g8 a8 } c4 \tuplet 3/2 { c4 d8 ~ d8 e4 }"
+                )
+            ),
+        )
+        # Leaves are moved into the new tuplets and not copied.
+        self.assertEqual(
+            list(map(id, abjad.select.leaves(voice))), list(map(id, leaf_list))
+        )
+
+    def test_convert_with_segment_at_bar_lines(self):
+        consecution = seq(
+            [
+                # first bar line is crossed by a note: no segment boundary
+                n("c", f(3, 4)),
+                n("d", f(1, 2)),
+                n("e", f(3, 4)),
+                # second bar line is at the start of a rest and third
+                # bar line is crossed by a rest: both are segment boundaries
+                n([], f(5, 4)),
+                n("f", f(1, 4)),
+                # fourth bar line is crossed by a note
+                n("g", 1),
+            ]
+        )
+        segment_tuple = abjad_converters.NauertConsecutionToQuantizedAbjadContainer._split_duration_list_at_bar_lines(
+            [abjad.Duration(d) for d in (3 / 4, 1 / 2, 3 / 4, -5 / 4, 1 / 4, 1)],
+            (abjad.TimeSignature((4, 4)),),
+        )
+        self.assertEqual(
+            [segment.chronon_index_tuple for segment in segment_tuple],
+            [(0, 1, 2), (3,), (3, 4, 5)],
+        )
+        self.assertEqual(
+            [len(segment.time_signature_tuple) for segment in segment_tuple],
+            [2, 1, 2],
+        )
+
+        def convert(**kwargs):
+            return abjad.lilypond(
+                abjad_converters.ConsecutionToAbjadVoice(
+                    abjad_converters.NauertConsecutionToQuantizedAbjadContainer(
+                        **kwargs
+                    )
+                ).convert(consecution)
+            )
+
+        expected_lilypond = convert()
+        self.assertEqual(
+            convert(segment_at_bar_lines=True, executor_class=None), expected_lilypond
+        )
+        self.assertEqual(
+            convert(
+                segment_at_bar_lines=True,
+                executor_class=concurrent.futures.ProcessPoolExecutor,
+                max_workers=2,
+            ),
+            expected_lilypond,
+        )
+
+    def test_convert_with_segment_at_bar_lines_and_rest_at_end(self):
+        # The end of the rest doesn't fill the last bar and would be
+        # a segment without any note.
+        consecution = seq([n("c", f(3, 4)), n([], f(1, 4) + f(1, 48))])
+        segment_tuple = abjad_converters.NauertConsecutionToQuantizedAbjadContainer._split_duration_list_at_bar_lines(
+            [abjad.Duration(3, 4), -abjad.Duration(13, 48)],
+            (abjad.TimeSignature((4, 4)),),
+        )
+        self.assertEqual(
+            [segment.chronon_index_tuple for segment in segment_tuple], [(0, 1)]
+        )
+        self.assertEqual(
+            segment_tuple[0].duration_list,
+            [abjad.Duration(3, 4), -abjad.Duration(13, 48)],
+        )
+
+        def convert(**kwargs):
+            return abjad.lilypond(
+                abjad_converters.ConsecutionToAbjadVoice(
+                    abjad_converters.NauertConsecutionToQuantizedAbjadContainer(
+                        **kwargs
+                    )
+                ).convert(consecution)
+            )
+
+        self.assertEqual(convert(segment_at_bar_lines=True), convert())
+
+    def test_convert_with_pattern_cache(self):
+        def bar():
+            return [
+                n("c", f(1, 4)),
+                n("d", f(1, 12)),
+                n("e", f(1, 6)),
+                n([], f(1, 4)),
+                n("f", f(1, 4)),
+            ]
+
+        consecution = seq(bar() + bar() + [n("g", f(3, 4)), n("a", f(1, 4))] + bar())
+        # The skeleton cache would skip the second quantization.
+        quantizer = abjad_converters.NauertConsecutionToQuantizedAbjadContainer(
+            segment_at_bar_lines=True, executor_class=None, skeleton_cache_size=0
+        )
+        converter = abjad_converters.ConsecutionToAbjadVoice(quantizer)
+        expected_lilypond = abjad.lilypond(
+            abjad_converters.ConsecutionToAbjadVoice(
+                abjad_converters.NauertConsecutionToQuantizedAbjadContainer()
+            ).convert(consecution)
+        )
+        for expected_cache_info in ((2, 2, 128, 2), (6, 2, 128, 2)):
+            self.assertEqual(
+                abjad.lilypond(converter.convert(consecution)), expected_lilypond
+            )
+            self.assertEqual(quantizer.pattern_cache_info(), expected_cache_info)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(quantizer)).pattern_cache_info(), (0, 0, 128, 0)
+        )
+
+    def test_convert_with_small_pattern_cache_in_threads(self):
+        # Items are evicted while other threads still use them: quantized
+        # segments which are shared with the cache always need to be copied.
+        consecution = seq(
+            [n("c", f(1, 4)), n("d", f(1, 12)), n("e", f(1, 6)), n("f", f(1, 2))]
+            + [n("g", f(3, 4)), n("a", f(1, 4))]
+            + [n([], f(1, 4)), n("b", f(1, 10)), n("c", f(13, 20))]
+        )
+        quantizer = abjad_converters.NauertConsecutionToQuantizedAbjadContainer(
+            segment_at_bar_lines=True,
+            executor_class=None,
+            pattern_cache_size=1,
+            skeleton_cache_size=0,
+        )
+        converter = abjad_converters.ConsecutionToAbjadVoice(quantizer)
+        expected_lilypond = abjad.lilypond(converter.convert(consecution))
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            voice_list = list(executor.map(converter.convert, [consecution] * 16))
+        leaf_id_set = set()
+        for voice in voice_list:
+            self.assertEqual(abjad.lilypond(voice), expected_lilypond)
+            leaf_id_set.update(map(id, abjad.select.leaves(voice)))
+        self.assertEqual(
+            len(leaf_id_set), sum(len(abjad.select.leaves(v)) for v in voice_list)
+        )
+        self.assertEqual(quantizer.pattern_cache_info().currsize, 1)
+
+    def test_convert_with_time_budget(self):
+        consecution = seq(
+            [n("c", f(1, 4)), n("d", f(1, 4)), n([], f(1, 2))]
+            + [n("e", f(1, 6)) for _ in range(6)]
+        )
+        expected_lilypond = abjad.lilypond(
+            abjad_converters.ConsecutionToAbjadVoice(
+                abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer()
+            ).convert(consecution)
+        )
+        for segment_at_bar_lines, expected_fallback_segment_index_tuple in (
+            (False, (0,)),
+            (True, (0, 1)),
+        ):
+            with self.subTest(segment_at_bar_lines=segment_at_bar_lines):
+                # Without any time each segment falls back to the leaf maker.
+                quantizer = abjad_converters.NauertConsecutionToQuantizedAbjadContainer(
+                    segment_at_bar_lines=segment_at_bar_lines,
+                    executor_class=None,
+                    time_budget=0,
+                )
+                converter = abjad_converters.ConsecutionToAbjadVoice(quantizer)
+                with self.assertWarns(UserWarning) as warning_context:
+                    voice = converter.convert(consecution)
+                self.assertEqual(abjad.lilypond(voice), expected_lilypond)
+                self.assertIn(
+                    "segment(s) {}:".format(
+                        ", ".join(map(str, expected_fallback_segment_index_tuple))
+                    ),
+                    str(warning_context.warning),
+                )
+                # Fallbacks aren't cached.
+                self.assertEqual(quantizer.skeleton_cache_info().currsize, 0)
+                self.assertEqual(quantizer.pattern_cache_info().currsize, 0)
+
+                # Nightly builds can collect fallbacks instead of warnings.
+                quantization_fallback_list = []
+                quantizer = abjad_converters.NauertConsecutionToQuantizedAbjadContainer(
+                    segment_at_bar_lines=segment_at_bar_lines,
+                    executor_class=None,
+                    time_budget=0,
+                    report_fallback=quantization_fallback_list.append,
+                )
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error")
+                    quantizer.convert(consecution)
+                self.assertEqual(
+                    quantization_fallback_list,
+                    [
+                        abjad_converters.QuantizationFallback(
+                            0,
+                            expected_fallback_segment_index_tuple,
+                            tuple(range(len(consecution))),
+                        )
+                    ],
+                )
+
+        quantizer = abjad_converters.NauertConsecutionToQuantizedAbjadContainer(
+            time_budget=60, skeleton_cache_size=16
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            quantizer.convert(consecution)
+        self.assertEqual(quantizer.skeleton_cache_info().currsize, 1)
+
+    def test_deadline_job_handler(self):
+        search_tree = nauert.UnweightedSearchTree({2: {2: None}, 3: None, 5: None})
+
+        def make_job():
+            return nauert.QuantizationJob(
+                1,
+                search_tree,
+                [
+                    nauert.QEventProxy(nauert.PitchedQEvent(250, [0]), 0.25),
+                    nauert.QEventProxy(nauert.SilentQEvent(500), 0.5),
+                    nauert.QEventProxy(nauert.PitchedQEvent(750, [3]), 0.75),
+                ],
+            )
+
+        deadline_job_handler_class = quantization._DeadlineJobHandler
+        # The installed version of nauert needs to allow to interrupt
+        # its search, otherwise a warning is shown.
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            job = make_job()
+            deadline_job_handler_class(time.monotonic() + 60)([job])
+            self.assertTrue(job.q_grids)
+            with self.assertRaises(
+                quantization._TimeBudgetExceededError
+            ):
+                deadline_job_handler_class(time.monotonic() - 1)([make_job()])
+
+    def test_convert_with_skeleton_cache(self):
+        quantizer = abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer(
+            skeleton_cache_size=16
+        )
+        converter = abjad_converters.ConsecutionToAbjadVoice(quantizer)
+        expected_converter = abjad_converters.ConsecutionToAbjadVoice(
+            abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer(
+                skeleton_cache_size=0
+            )
+        )
+        voice_list = []
+        # The second voice doubles the rhythm of the first voice, the
+        # last voice only has different pitches.
+        for nth_voice, pitch_name_tuple in enumerate(
+            (("c", "d", "e"), ("c", "d", "e"), ("f", "g", "a"))
+        ):
+            consecution = seq(
+                [
+                    n(pitch_name_tuple[0], f(1, 6), volume="p"),
+                    n(pitch_name_tuple[1], f(1, 3)),
+                    n([], f(1, 8)),
+                    n([], f(1, 8)),
+                    n(pitch_name_tuple[2], f(5, 4)),
+                ]
+            )
+            voice = converter.convert(consecution)
+            self.assertEqual(
+                abjad.lilypond(voice),
+                abjad.lilypond(expected_converter.convert(consecution)),
+            )
+            self.assertEqual(quantizer.skeleton_cache_info(), (nth_voice, 1, 16, 1))
+            voice_list.append(voice)
+        # Each voice gets its own leaves.
+        self.assertFalse(
+            set(map(id, abjad.select.leaves(voice_list[0])))
+            & set(map(id, abjad.select.leaves(voice_list[1])))
+        )
+        self.assertEqual(
+            pickle.loads(pickle.dumps(quantizer)).skeleton_cache_info(),
+            (0, 0, 16, 0),
+        )
+
+    def test_duration_line_quantizer(self):
+        quantizer = abjad_converters.LeafMakerConsecutionToDurationLineBasedQuantizedAbjadContainer(
+            skeleton_cache_size=16
+        )
+        consecution = seq([n("c", f(5, 4)), n([], f(1, 4)), n([], f(1, 2))])
+        # The skips are already part of the cached skeleton.
+        for _ in range(2):
+            voice, related_abjad_leaves_per_chronon, _ = quantizer.convert(consecution)
+            self.assertEqual(
+                [type(leaf) for leaf in abjad.select.leaves(voice)],
+                [abjad.Note, abjad.Skip, abjad.Rest],
+            )
+            first_leaf = abjad.select.leaf(voice, 0)
+            self.assertFalse(abjad.get.indicator(first_leaf, abjad.Tie))
+            self.assertIn(
+                "\\-",
+                [
+                    literal.argument
+                    for literal in abjad.get.indicators(
+                        first_leaf, abjad.LilyPondLiteral
+                    )
+                ],
+            )
+            self.assertEqual(
+                [
+                    leaf_handle.leaf
+                    for leaf_handle, in related_abjad_leaves_per_chronon[:2]
+                ],
+                [first_leaf, abjad.select.leaf(voice, 2)],
+            )
+
+    def test_pickle(self):
+        for converter in (
+            abjad_converters.ConsecutionToAbjadVoice(),
+            abjad_converters.ConsecutionToAbjadVoice(
+                abjad_converters.NauertConsecutionToDurationLineBasedQuantizedAbjadContainer()
+            ),
+            abjad_converters.ConsecutionToAbjadVoice(
+                abjad_converters.NauertConsecutionToQuantizedAbjadContainer(
+                    time_budget=60
+                )
+            ),
+            self.complex_converter,
+        ):
+            unpickled_converter = pickle.loads(pickle.dumps(converter))
+            self.assertEqual(
+                abjad.lilypond(converter.convert(self.consecution)),
+                abjad.lilypond(unpickled_converter.convert(self.consecution)),
+            )
+
+    def test_convert_many(self):
+        consecution_list = [self.complex_consecution, self.complex_consecution[:5]]
+        self.assertEqual(
+            [
+                abjad.lilypond(v)
+                for v in self.complex_converter.convert_many(
+                    consecution_list, max_workers=2
+                )
+            ],
+            [
+                # Results of worker processes are pickled: abjad sorts
+                # note heads of chords when unpickling them.
+                abjad.lilypond(
+                    pickle.loads(
+                        pickle.dumps(self.complex_converter.convert(consecution))
+                    )
+                )
+                for consecution in consecution_list
+            ],
+        )
+
+    def test_convert_with_index_tuple_quantizer(self):
+        # Quantizers which still return nested index paths instead
+        # of leaf handles are supported.
+        class IndexTupleQuantizer(
+            abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer
+        ):
+            def convert(self, consecution_to_convert):
+                voice, leaf_handle_tuple_tuple, is_rest_tuple = super().convert(
+                    consecution_to_convert
+                )
+                return (
+                    voice,
+                    tuple(
+                        tuple(
+                            (voice.index(leaf_handle.parent), leaf_handle.index)
+                            for leaf_handle in leaf_handle_tuple
+                        )
+                        for leaf_handle_tuple in leaf_handle_tuple_tuple
+                    ),
+                    is_rest_tuple,
+                )
+
+        consecution = core_events.Consecution(
+            [music_events.NoteLike(p, "1/4", volume="mf") for p in "c d e f g".split()]
+        )
+        self.assertEqual(
+            abjad.lilypond(
+                abjad_converters.ConsecutionToAbjadVoice(IndexTupleQuantizer()).convert(
+                    consecution
+                )
+            ),
+            abjad.lilypond(abjad_converters.ConsecutionToAbjadVoice().convert(consecution)),
+        )
+
+    def test_convert_only_quantizer(self):
+        # Custom quantizers which only implement 'convert' are
+        # still supported.
+        class ConvertOnlyQuantizer(
+            abjad_converters.ConsecutionToQuantizedAbjadContainer
+        ):
+            def convert(self, consecution_to_convert):
+                return abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer().convert(
+                    consecution_to_convert
+                )
+
+        consecution = core_events.Consecution(
+            [music_events.NoteLike(p, "1/4", volume="mf") for p in "c d e f g".split()]
+        )
+        self.assertEqual(
+            abjad.lilypond(
+                abjad_converters.ConsecutionToAbjadVoice(
+                    ConvertOnlyQuantizer()
+                ).convert(consecution)
+            ),
+            abjad.lilypond(abjad_converters.ConsecutionToAbjadVoice().convert(consecution)),
+        )
+
+    def test_custom_attachment_class(self):
+        # Attachment classes which override 'from_indicator_collection'
+        # don't need to be named like an indicator.
+        class ArticulationMarkup(abjad_parameters.abc.BangFirstAttachment):
+            @classmethod
+            def from_indicator_collection(cls, indicator_collection, **kwargs):
+                try:
+                    articulation = indicator_collection.articulation
+                except AttributeError:
+                    return None
+                if articulation.name:
+                    return cls(articulation, **kwargs)
+                return None
+
+            @property
+            def is_active(self):
+                return True
+
+            def process_leaf(self, leaf):
+                abjad.attach(
+                    abjad.Markup(rf"\markup {{ {self.indicator.name} }}"), leaf
+                )
+                return leaf
+
+        converter = abjad_converters.ConsecutionToAbjadVoice(
+            abjad_attachment_class_sequence=(ArticulationMarkup,)
+        )
+        consecution = core_events.Consecution(
+            [
+                music_events.NoteLike(
+                    "c", "1/4", playing_indicator_collection="articulation.name='>'"
+                ),
+                music_events.NoteLike("d", "1/4"),
+            ]
+        )
+        voice = converter.convert(consecution)
+        self.assertEqual(
+            [
+                abjad.get.indicator(leaf, abjad.Markup)
+                for leaf in abjad.select.leaves(voice)[:2]
+            ],
+            [abjad.Markup(r"\markup { > }"), None],
+        )
+
+    def test_grace_note_converter_reuse(self):
+        def make_grace_note_consecution(pitch):
+            grace_note = music_events.NoteLike(pitch, "1/8")
+            grace_note.notation_indicator_collection.ottava.octave_count = 1
+            return core_events.Consecution([grace_note])
+
+        converter = abjad_converters.ConsecutionToAbjadVoice()
+        consecution = core_events.Consecution(
+            [
+                music_events.NoteLike(
+                    "c",
+                    "1/4",
+                    grace_note_consecution=make_grace_note_consecution("d"),
+                    after_grace_note_consecution=make_grace_note_consecution("e"),
+                )
+                for _ in range(3)
+            ]
+        )
+        voice = converter.convert(consecution)
+        before_grace_note_converter = converter._get_grace_note_converter(True)
+        after_grace_note_converter = converter._get_grace_note_converter(False)
+        self.assertIsNot(before_grace_note_converter, after_grace_note_converter)
+        self.assertEqual(
+            abjad.lilypond(voice), abjad.lilypond(converter.convert(consecution))
+        )
+        self.assertIs(
+            converter._get_grace_note_converter(True), before_grace_note_converter
+        )
+        self.assertIs(
+            converter._get_grace_note_converter(False), after_grace_note_converter
+        )
+        # Each grace note group is converted on its own: the equal
+        # ottava of subsequent groups isn't skipped.
+        for grace_container_class in (
+            abjad.BeforeGraceContainer,
+            abjad.AfterGraceContainer,
+        ):
+            grace_container_list = [
+                component
+                for component in abjad.iterate.components(voice)
+                if isinstance(component, grace_container_class)
+            ]
+            self.assertEqual(len(grace_container_list), 3)
+            for grace_container in grace_container_list:
+                self.assertEqual(
+                    abjad.get.indicator(grace_container[0], abjad.Ottava),
+                    abjad.Ottava(1, site="before"),
+                )
+
 
 class NestedCompoundToAbjadContainerTest(abjad_utilities.AbjadTestCase):
     def test_convert(self):
@@ -420,6 +1213,123 @@ class NestedCompoundToAbjadContainerTest(abjad_utilities.AbjadTestCase):
         # check if abjad container name is correct
         self.assertEqual(abjad_score.name, "Integrating duo")
 
+    def test_convert_with_statistics(self):
+        statistics = abjad_utilities.ConversionStatistics()
+        voice_converter = abjad_converters.ConsecutionToAbjadVoice(
+            statistics=statistics
+        )
+        converter = abjad_converters.NestedCompoundToAbjadContainer(
+            abjad_converters.CycleBasedNestedCompoundToCompoundToAbjadContainers(
+                [voice_converter]
+            ),
+            abjad.Staff,
+            "Staff",
+            statistics=statistics,
+        )
+        nested_event = _make_nested_event()[0]
+        converter.convert(nested_event)
+        stage_dict = statistics.stage_dict
+        for stage_name in (
+            "quantize",
+            "extract",
+            "pitches",
+            "collect_attachments",
+            "tempo",
+            "apply_attachments",
+            "multimeasure_rests",
+            "lyrics",
+            "fill",
+        ):
+            self.assertEqual(
+                stage_dict[f"ConsecutionToAbjadVoice.{stage_name}"].call_count,
+                len(nested_event),
+            )
+        self.assertEqual(
+            stage_dict["NestedCompoundToAbjadContainer[Staff].fill"].call_count, 1
+        )
+        self.assertEqual(
+            stage_dict["NestedCompoundToAbjadContainer[Staff].fill"].leaf_count,
+            stage_dict["ConsecutionToAbjadVoice.fill"].leaf_count,
+        )
+        # Leaves are only counted once per conversion
+        self.assertTrue(stage_dict["ConsecutionToAbjadVoice.fill"].leaf_count)
+        self.assertEqual(stage_dict["ConsecutionToAbjadVoice.quantize"].leaf_count, 0)
+        self.assertTrue(str(statistics))
+
+    def test_convert_with_executor(self):
+        nested_event = _make_nested_event()
+        abjad_score = _make_nested_converter().convert(nested_event)
+        abjad_score_parallel = _make_nested_converter(
+            concurrent.futures.ThreadPoolExecutor
+        ).convert(nested_event)
+        self.assertEqual(
+            abjad.lilypond(abjad_score_parallel), abjad.lilypond(abjad_score)
+        )
+
+    def test_convert_with_thread_executor_and_mixed_time_signatures(self):
+        # All voices are converted by one shared quantizer, but they have
+        # different time signatures.
+        tag_to_time_signature_tuple = {
+            "a": (abjad.TimeSignature((3, 4)),),
+            "b": (abjad.TimeSignature((5, 8)),),
+            "c": (abjad.TimeSignature((4, 4)), abjad.TimeSignature((2, 4))),
+        }
+        duration_tuple = tuple(
+            f(*ratio)
+            for ratio in (
+                (1, 4),
+                (1, 8),
+                (1, 8),
+                (3, 8),
+                (1, 8),
+                (1, 2),
+                (1, 4),
+                (1, 6),
+                (1, 12),
+            )
+        )
+        nested_event = tsim(
+            [
+                seq(
+                    [
+                        n("c", duration_tuple[(i + j) % len(duration_tuple)])
+                        for j in range(32)
+                    ],
+                    tag="abc"[i % 3],
+                )
+                for i in range(24)
+            ]
+        )
+
+        def make_converter(executor_class):
+            return abjad_converters.NestedCompoundToAbjadContainer(
+                abjad_converters.CycleBasedNestedCompoundToCompoundToAbjadContainers(
+                    [
+                        abjad_converters.ConsecutionToAbjadVoice(
+                            abjad_converters.LeafMakerConsecutionToQuantizedAbjadContainer(
+                                event_to_time_signature_tuple=lambda consecution: (
+                                    tag_to_time_signature_tuple[consecution.tag]
+                                ),
+                                # Otherwise most voices are only copied.
+                                skeleton_cache_size=0,
+                            )
+                        )
+                    ]
+                ),
+                abjad.Staff,
+                "Staff",
+                executor_class=executor_class,
+            )
+
+        self.assertEqual(
+            abjad.lilypond(
+                make_converter(concurrent.futures.ThreadPoolExecutor).convert(
+                    nested_event
+                )
+            ),
+            abjad.lilypond(make_converter(None).convert(nested_event)),
+        )
+
 
 def _make_nested_event() -> core_events.Concurrence:
     w = music_parameters.WesternPitch
@@ -449,7 +1359,7 @@ def _make_nested_event() -> core_events.Concurrence:
     )
 
 
-def _make_nested_converter():
+def _make_nested_converter(executor_class=None):
     return abjad_converters.NestedCompoundToAbjadContainer(
         abjad_converters.TagBasedNestedCompoundToCompoundToAbjadContainers(
             {
@@ -489,6 +1399,7 @@ def _make_nested_converter():
         ),
         abjad.Score,
         "Score",
+        executor_class=executor_class,
     )
 
 
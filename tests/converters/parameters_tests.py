@@ -51,6 +51,29 @@ class MutwoPitchToAbjadPitchTest(unittest.TestCase):
                 converter.convert(mutwo_pitch).number, expected_abjad_pitch.number
             )
 
+    def test_convert_cache(self):
+        converter = abjad_converters.MutwoPitchToAbjadPitch(cache_size=2)
+        pitch_list = [
+            music_parameters.WesternPitch("ds", 4),
+            music_parameters.WesternPitch("ds", 4),
+            music_parameters.JustIntonationPitch("3/2", concert_pitch=262),
+            music_parameters.WesternPitch("gts", 5),
+            music_parameters.WesternPitch("ds", 4),
+        ]
+        abjad_pitch_list = [converter.convert(pitch) for pitch in pitch_list]
+        # Equal pitches return the same (immutable) abjad pitch
+        self.assertIs(abjad_pitch_list[0], abjad_pitch_list[1])
+        self.assertEqual(abjad_pitch_list[3], abjad.NamedPitch("g''"))
+        self.assertEqual(abjad_pitch_list[4], abjad.NamedPitch("ds'"))
+        # Last 'ds' was discarded by 'gts'
+        self.assertEqual(converter.cache_info(), (1, 4, 2, 2))
+
+    def test_convert_without_cache(self):
+        converter = abjad_converters.MutwoPitchToAbjadPitch(cache_size=0)
+        pitch = music_parameters.WesternPitch("ds", 4)
+        self.assertEqual(converter.convert(pitch), converter.convert(pitch))
+        self.assertEqual(converter.cache_info().currsize, 0)
+
 
 class MutwoPitchToHEJIAbjadPitchTest(unittest.TestCase):
     @abjad_utilities.run_if_ekmelily_available
@@ -87,6 +110,23 @@ class MutwoPitchToHEJIAbjadPitchTest(unittest.TestCase):
                 expected_lilypond_string,
             )
 
+    @abjad_utilities.run_if_ekmelily_available
+    def test_convert_cache(self):
+        converter = abjad_converters.MutwoPitchToHEJIAbjadPitch(reference_pitch="c")
+        for _ in range(3):
+            for ratio, expected_lilypond_string in (
+                ("5/4", "eoaa'"),
+                ("10/4", "eoaa''"),
+                ("7/6", "efoba'"),
+            ):
+                self.assertEqual(
+                    abjad.lilypond(
+                        converter.convert(music_parameters.JustIntonationPitch(ratio))
+                    ),
+                    expected_lilypond_string,
+                )
+        self.assertEqual(converter.cache_info(), (6, 3, 1024, 3))
+
 
 class MutwoVolumeToAbjadAttachmentDynamicTest(unittest.TestCase):
     def test_convert(self):